@@ -0,0 +1,58 @@
+from subprocess import run
+from sys import argv, executable, exit
+
+
+# This script measures with python -X importtime how long a short-lived script
+# like demo_with_files.py spends importing Jazal. It exits with status 1 if the
+# time exceeds a budget so that it can fail a build when the import time
+# regresses. The imports made at the interpreter's startup are subtracted and
+# the best of several runs is kept to reduce noise. From the
+# repository's root directory, run it with
+# python -m benchmarks.import_time_bench.
+# Argument 1 (optional): the budget in milliseconds. Defaults to 25.
+# Argument 2 (optional): the number of runs. Defaults to 10.
+
+IMPORT_STATEMENT = "from jazal import MissingPathArgWarner, "\
+	+ "make_altered_name, make_altered_path"
+
+
+def measure_import_time(statement):
+	"""
+	Runs a statement in a new interpreter and adds the times of all the
+	imports, including those made at the interpreter's startup.
+
+	Args:
+		statement (str): the Python statement to run
+
+	Returns:
+		float: the import time in milliseconds
+	"""
+	completed = run((executable, "-X", "importtime", "-c", statement),
+		capture_output=True, text=True, check=True)
+	total_us = 0
+
+	for line in completed.stderr.splitlines():
+		if not line.startswith("import time:") or "self [us]" in line:
+			continue
+
+		self_us = line.split("|")[0].split(":")[1]
+		total_us += int(self_us)
+
+	return total_us / 1000
+
+
+if __name__ == "__main__":
+	budget_ms = float(argv[1]) if len(argv) > 1 else 25.0
+	run_count = int(argv[2]) if len(argv) > 2 else 10
+
+	# The first run may compile the modules.
+	measure_import_time(IMPORT_STATEMENT)
+	startup_ms = min(measure_import_time("pass") for _ in range(run_count))
+	import_time_ms = min(measure_import_time(IMPORT_STATEMENT)
+		for _ in range(run_count)) - startup_ms
+	print("Import time: " + format(import_time_ms, ".2f") + " ms, budget: "
+		+ format(budget_ms, ".2f") + " ms")
+
+	if import_time_ms > budget_ms:
+		print("The import time exceeds the budget.")
+		exit(1)
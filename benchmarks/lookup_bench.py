@@ -0,0 +1,73 @@
+from jazal import DirFdLookup
+from pathlib import Path
+from sys import argv
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+
+# This script compares the lookup objects that PathChecker.set_lookup accepts
+# with pathlib.Path's methods. The files queried are in a directory at the
+# bottom of a deep synthetic tree, where resolving each path is the main
+# cost. From the repository's root directory, run it with
+# python -m benchmarks.lookup_bench.
+# Argument 1 (optional): the number of files to create. Defaults to 10000.
+# Argument 2 (optional): the depth of the directory containing the files.
+# Defaults to 20.
+# Argument 3 (optional): the number of measurements of each lookup. Defaults
+# to 5.
+
+
+def make_deep_dir(root, depth, file_count):
+	dir_path = root
+
+	for i in range(depth):
+		dir_path = dir_path/("level" + str(i))
+
+	dir_path.mkdir(parents=True)
+	paths = list()
+
+	for i in range(file_count):
+		file_path = dir_path/("file" + str(i) + ".pdf")
+		file_path.touch()
+		paths.append(file_path)
+
+	return dir_path, paths
+
+
+def measure(function, paths, repeat):
+	best_time = None
+
+	for _ in range(repeat):
+		start = perf_counter()
+
+		for path in paths:
+			function(path)
+
+		duration = perf_counter() - start
+
+		if best_time is None or duration < best_time:
+			best_time = duration
+
+	return best_time
+
+
+def print_time(label, duration, reference_time):
+	print(label + ": " + format(duration, ".3f") + " s (x"
+		+ format(reference_time / duration, ".2f") + " vs pathlib)")
+
+
+if __name__ == "__main__":
+	file_count = int(argv[1]) if len(argv) > 1 else 10000
+	depth = int(argv[2]) if len(argv) > 2 else 20
+	repeat = int(argv[3]) if len(argv) > 3 else 5
+
+	with TemporaryDirectory() as temp_dir:
+		dir_path, paths = make_deep_dir(Path(temp_dir), depth, file_count)
+		print(str(file_count) + " files at depth " + str(depth))
+
+		pathlib_time = measure(Path.is_file, paths, repeat)
+		print_time("Path.is_file", pathlib_time, pathlib_time)
+
+		with DirFdLookup() as lookup:
+			print_time("DirFdLookup.path_is_file",
+				measure(lookup.path_is_file, paths, repeat), pathlib_time)
@@ -0,0 +1,43 @@
+from jazal import PathSet
+from pathlib import Path
+from sys import argv
+from tracemalloc import\
+	get_traced_memory,\
+	start,\
+	stop
+
+
+# This script measures with tracemalloc the memory taken by a list of
+# pathlib.Path objects, as many PathChecker objects would hold, and by a
+# PathSet containing the same paths. From the repository's root directory,
+# run it with python -m benchmarks.path_set_memory_bench.
+# Argument 1 (optional): the number of paths. Defaults to 1000000.
+# Argument 2 (optional): the number of paths per directory. Defaults to 1000.
+
+
+def make_path_strs(path_count, paths_per_dir):
+	return ["/mnt/archive/project/run" + str(i // paths_per_dir)
+		+ "/sample_" + str(i) + ".tar.gz" for i in range(path_count)]
+
+
+def measure(make_container, path_strs):
+	start()
+	container = make_container(path_strs)
+	size = get_traced_memory()[0]
+	stop()
+	del container
+	return size
+
+
+if __name__ == "__main__":
+	path_count = int(argv[1]) if len(argv) > 1 else 1000000
+	paths_per_dir = int(argv[2]) if len(argv) > 2 else 1000
+	path_strs = make_path_strs(path_count, paths_per_dir)
+	print(str(path_count) + " paths, " + str(paths_per_dir)
+		+ " per directory")
+	list_size = measure(lambda strs: [Path(s) for s in strs], path_strs)
+	set_size = measure(PathSet, path_strs)
+	print("List of pathlib.Path: " + format(list_size / 2**20, ".1f")
+		+ " MiB")
+	print("PathSet: " + format(set_size / 2**20, ".1f") + " MiB, "
+		+ format(1 - set_size / list_size, ".0%") + " saved")
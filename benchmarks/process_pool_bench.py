@@ -0,0 +1,75 @@
+from jazal import\
+	CheckPlan,\
+	ProcessPoolChecker
+from os import cpu_count
+from pathlib import Path
+from sys import argv
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+
+# This script measures how ProcessPoolChecker scales from 1 process to the
+# number of processors. It validates the paths of a synthetic tree with a
+# CheckPlan sequentially, then with 1, 2, 4... worker processes. From the
+# repository's root directory, run it with
+# python -m benchmarks.process_pool_bench.
+# Argument 1 (optional): the number of files to create. Defaults to 100000.
+# Argument 2 (optional): the maximum number of processes. Defaults to the
+# number of processors.
+
+FILES_PER_DIR = 1000
+
+
+def make_tree(root, file_count):
+	paths = list()
+
+	for i in range(file_count):
+		dir_path = root/("dir" + str(i // FILES_PER_DIR))
+
+		if i % FILES_PER_DIR == 0:
+			dir_path.mkdir()
+
+		file_path = dir_path/("file" + str(i) + (".pdf" if i % 2 else ".txt"))
+		file_path.touch()
+		paths.append(str(file_path))
+		paths.append(str(dir_path/("missing" + str(i) + ".pdf")))
+
+	return paths
+
+
+def worker_counts(max_workers):
+	count = 1
+
+	while count < max_workers:
+		yield count
+		count *= 2
+
+	yield max_workers
+
+
+if __name__ == "__main__":
+	file_count = int(argv[1]) if len(argv) > 1 else 100000
+	max_workers = int(argv[2]) if len(argv) > 2 else cpu_count() or 1
+	plan = CheckPlan("path", ".pdf", must_be_file=True)
+
+	with TemporaryDirectory() as temp_dir:
+		paths = make_tree(Path(temp_dir), file_count)
+
+		start = perf_counter()
+		expected = plan.validate_all(paths)
+		sequential_time = perf_counter() - start
+		print("Sequential: " + format(sequential_time, ".3f") + " s")
+
+		for worker_count in worker_counts(max_workers):
+			with ProcessPoolChecker(max_workers=worker_count) as ppc:
+				# The first call starts the worker processes.
+				ppc.validate(paths[:worker_count], plan)
+				start = perf_counter()
+				results = ppc.validate(paths, plan)
+				duration = perf_counter() - start
+
+			assert results == expected
+			print(str(worker_count) + " process(es): "
+				+ format(duration, ".3f") + " s, speedup x"
+				+ format(sequential_time / duration, ".2f")
+				+ ", chunk size " + str(ppc.last_chunk_size))
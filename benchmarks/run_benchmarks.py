@@ -0,0 +1,272 @@
+from argparse import ArgumentParser
+from jazal import\
+	MissingPathArgWarner,\
+	PathChecker,\
+	ReactivePathChecker,\
+	extension_to_str,\
+	get_file_stem,\
+	make_altered_name,\
+	make_altered_path,\
+	make_altered_stem,\
+	stat_or_none
+from json import dump, load
+from pathlib import Path
+from platform import platform, python_version
+from sys import exit, stderr, stdout
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+
+# This script measures every public operation of PathChecker,
+# ReactivePathChecker, MissingPathArgWarner and module path_util on synthetic
+# directory trees generated in a temporary directory. The results, in
+# nanoseconds per call, can be written to a JSON file and compared with a
+# baseline made by a previous run. The script exits with status 1 if an
+# operation is slower than its baseline by more than the tolerance. From the
+# repository's root directory, run it with
+# python -m benchmarks.run_benchmarks --help
+# to see the options. The progress and the regressions are printed to the
+# standard error stream. Without option --output, the JSON report is the
+# only output on the standard output stream.
+
+EXTENSIONS = (".pdf", ".txt", ".tar.gz", "")
+FILES_PER_DIR = 1000
+MISSING_RATIO = 4
+
+
+def make_tree(root, file_count):
+	"""
+	Creates empty files in subdirectories of root and lists paths to check:
+	the files, the subdirectories and inexistent paths.
+
+	Args:
+		root (pathlib.Path): the directory where the tree is generated
+		file_count (int): the number of files to create
+
+	Returns:
+		list: the paths (pathlib.Path) to check
+	"""
+	paths = list()
+
+	for i in range(file_count):
+		dir_path = root/("dir" + str(i // FILES_PER_DIR))
+
+		if i % FILES_PER_DIR == 0:
+			dir_path.mkdir()
+			paths.append(dir_path)
+
+		extension = EXTENSIONS[i % len(EXTENSIONS)]
+		file_path = dir_path/("file" + str(i) + extension)
+		file_path.touch()
+		paths.append(file_path)
+
+		if i % MISSING_RATIO == 0:
+			paths.append(dir_path/("missing" + str(i) + ".pdf"))
+
+	return paths
+
+
+def call_each(function, items):
+	for item in items:
+		function(item)
+
+
+def call_catching(function, items):
+	for item in items:
+		try:
+			function(item)
+
+		except (FileNotFoundError, ValueError):
+			pass
+
+
+def make_operations(paths):
+	"""
+	Makes the benchmarked operations. Each of them is a function without
+	arguments that performs one call per path.
+
+	Args:
+		paths (list): the paths (pathlib.Path) to check
+
+	Returns:
+		dict: the operations mapped to their name
+	"""
+	checkers = [PathChecker(path, ".pdf") for path in paths]
+	r_checkers = [ReactivePathChecker(path, ".pdf", "arg") for path in paths]
+	warners = [MissingPathArgWarner("arg" + str(i % 10), ".pdf")
+		for i in range(len(paths))]
+	other_checkers = [PathChecker(path, ".pdf") for path in paths]
+
+	return {
+		"PathChecker.__init__":
+			lambda: call_each(lambda p: PathChecker(p, ".pdf"), paths),
+		"PathChecker.__eq__": lambda: [c == o
+			for c, o in zip(checkers, other_checkers)],
+		"PathChecker.__hash__": lambda: call_each(hash, checkers),
+		"PathChecker.__repr__": lambda: call_each(repr, checkers),
+		"PathChecker.extension_is_correct": lambda: call_each(
+			PathChecker.extension_is_correct, checkers),
+		"PathChecker.get_file_name": lambda: call_each(
+			PathChecker.get_file_name, checkers),
+		"PathChecker.get_file_stem": lambda: call_each(
+			PathChecker.get_file_stem, checkers),
+		"PathChecker.path_exists": lambda: call_each(
+			PathChecker.path_exists, checkers),
+		"PathChecker.path_is_dir": lambda: call_each(
+			PathChecker.path_is_dir, checkers),
+		"PathChecker.path_is_file": lambda: call_each(
+			PathChecker.path_is_file, checkers),
+		"ReactivePathChecker.__init__": lambda: call_each(
+			lambda p: ReactivePathChecker(p, ".pdf", "arg"), paths),
+		"ReactivePathChecker.check_extension_correct": lambda: call_catching(
+			ReactivePathChecker.check_extension_correct, r_checkers),
+		"ReactivePathChecker.check_path_exists": lambda: call_catching(
+			ReactivePathChecker.check_path_exists, r_checkers),
+		"ReactivePathChecker.check_path_is_dir": lambda: call_catching(
+			ReactivePathChecker.check_path_is_dir, r_checkers),
+		"ReactivePathChecker.check_path_is_file": lambda: call_catching(
+			ReactivePathChecker.check_path_is_file, r_checkers),
+		"ReactivePathChecker.name_with_correct_exten": lambda: call_each(
+			ReactivePathChecker.name_with_correct_exten, r_checkers),
+		"ReactivePathChecker.path_with_correct_exten": lambda: call_each(
+			ReactivePathChecker.path_with_correct_exten, r_checkers),
+		"MissingPathArgWarner.__init__": lambda: call_each(
+			lambda p: MissingPathArgWarner("arg", ".pdf"), paths),
+		"MissingPathArgWarner.make_missing_arg_msg": lambda: call_each(
+			MissingPathArgWarner.make_missing_arg_msg, warners),
+		"MissingPathArgWarner.make_path_checker": lambda: [
+			w.make_path_checker(p) for w, p in zip(warners, paths)],
+		"MissingPathArgWarner.make_reactive_path_checker": lambda: [
+			w.make_reactive_path_checker(p) for w, p in zip(warners, paths)],
+		"path_util.extension_to_str": lambda: call_each(
+			extension_to_str, paths),
+		"path_util.get_file_stem": lambda: call_each(get_file_stem, paths),
+		"path_util.make_altered_name": lambda: call_each(
+			lambda p: make_altered_name(p, "a_", "_b", ".txt"), paths),
+		"path_util.make_altered_path": lambda: call_each(
+			lambda p: make_altered_path(p, "a_", "_b", ".txt"), paths),
+		"path_util.make_altered_stem": lambda: call_each(
+			lambda p: make_altered_stem(p, "a_", "_b"), paths),
+		"path_util.stat_or_none": lambda: call_each(stat_or_none, paths)
+	}
+
+
+def run_suite(file_count, repeat):
+	"""
+	Generates a tree and measures each operation on it.
+
+	Args:
+		file_count (int): the number of files in the tree
+		repeat (int): the number of measurements of each operation. The
+			fastest is kept.
+
+	Returns:
+		dict: the time per call in nanoseconds (float) mapped to the
+			operation's name
+	"""
+	with TemporaryDirectory() as temp_dir:
+		paths = make_tree(Path(temp_dir), file_count)
+		results = dict()
+
+		for name, operation in make_operations(paths).items():
+			best_time = None
+
+			for _ in range(repeat):
+				start = perf_counter()
+				operation()
+				duration = perf_counter() - start
+
+				if best_time is None or duration < best_time:
+					best_time = duration
+
+			results[name] = best_time * 1e9 / len(paths)
+
+	return results
+
+
+def compare_with_baseline(report, baseline, tolerance):
+	"""
+	Prints the operations slower than their baseline by more than the
+	tolerance.
+
+	Args:
+		report (dict): the results of this run
+		baseline (dict): the results of a previous run
+		tolerance (float): the accepted slowdown, such as 0.2 for 20 %
+
+	Returns:
+		int: the number of regressions
+	"""
+	regression_count = 0
+
+	for size, results in report["results"].items():
+		base_results = baseline["results"].get(size, dict())
+
+		for name, time_ns in results.items():
+			base_time_ns = base_results.get(name)
+
+			if base_time_ns is None or base_time_ns <= 0:
+				continue
+
+			ratio = time_ns / base_time_ns
+
+			if ratio > 1 + tolerance:
+				regression_count += 1
+				print("REGRESSION " + size + " files, " + name + ": "
+					+ format(base_time_ns, ".0f") + " ns -> "
+					+ format(time_ns, ".0f") + " ns (x"
+					+ format(ratio, ".2f") + ")", file=stderr)
+
+	return regression_count
+
+
+def make_arg_parser():
+	parser = ArgumentParser(
+		description="Measures Jazal's public operations.")
+	parser.add_argument("-s", "--sizes", type=int, nargs="+",
+		default=[1000, 10000],
+		help="the numbers of files in the generated trees, for instance "
+			+ "1000 10000 100000 1000000. Defaults to 1000 10000.")
+	parser.add_argument("-r", "--repeat", type=int, default=3,
+		help="the number of measurements of each operation. Defaults to 3.")
+	parser.add_argument("-o", "--output", type=Path,
+		help="the JSON file where the results are written")
+	parser.add_argument("-b", "--baseline", type=Path,
+		help="a JSON file written by a previous run to compare with")
+	parser.add_argument("-t", "--tolerance", type=float, default=0.2,
+		help="the accepted slowdown relative to the baseline. "
+			+ "Defaults to 0.2.")
+	return parser
+
+
+if __name__ == "__main__":
+	args = make_arg_parser().parse_args()
+	report = {
+		"python": python_version(),
+		"platform": platform(),
+		"unit": "ns per call",
+		"results": dict()
+	}
+
+	for size in args.sizes:
+		results = run_suite(size, args.repeat)
+		report["results"][str(size)] = results
+
+		for name, time_ns in results.items():
+			print(str(size) + " files, " + name + ": "
+				+ format(time_ns, ".0f") + " ns", file=stderr)
+
+	if args.output is None:
+		dump(report, stdout, indent="\t")
+		print()
+
+	else:
+		with args.output.open(mode="w") as output_stream:
+			dump(report, output_stream, indent="\t")
+
+	if args.baseline is not None:
+		with args.baseline.open() as baseline_stream:
+			baseline = load(baseline_stream)
+
+		if compare_with_baseline(report, baseline, args.tolerance) > 0:
+			exit(1)
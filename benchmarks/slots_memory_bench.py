@@ -0,0 +1,83 @@
+from jazal import\
+	MissingPathArgWarner,\
+	PathChecker,\
+	ReactivePathChecker
+from pathlib import Path
+from sys import argv
+from tracemalloc import\
+	get_traced_memory,\
+	start,\
+	stop
+
+
+# This script measures with tracemalloc the memory taken by many PathChecker,
+# ReactivePathChecker and MissingPathArgWarner instances. It compares them
+# with classes that store the same attributes in an instance dictionary, as
+# Jazal's classes did before they used __slots__. The paths are made before
+# the measurements so that only the checkers are counted. From the
+# repository's root directory, run it with
+# python -m benchmarks.slots_memory_bench.
+# Argument 1 (optional): the number of instances. Defaults to 1000000.
+
+
+class DictPathChecker:
+
+	def __init__(self, a_path, extension):
+		self._extension = extension
+		self._path = a_path
+		self._snapshot_on = False
+		self._snapshot_ttl = None
+		self._snapshot_stat = None
+		self._snapshot_time = None
+		self._lookup = None
+		self._parsed_path = None
+
+
+class DictReactivePathChecker(DictPathChecker):
+
+	def __init__(self, a_path, extension, arg_name):
+		DictPathChecker.__init__(self, a_path, extension)
+		self._arg_name = arg_name
+
+
+class DictMissingPathArgWarner:
+
+	def __init__(self, arg_name, extension):
+		self._extension = extension
+		self._arg_name = arg_name
+
+
+def measure(make_instance, paths):
+	start()
+	instances = [make_instance(path) for path in paths]
+	size = get_traced_memory()[0]
+	stop()
+	del instances
+	return size
+
+
+def compare(name, make_dict_instance, make_slot_instance, paths):
+	dict_size = measure(make_dict_instance, paths)
+	slot_size = measure(make_slot_instance, paths)
+	print(name + ": dictionary " + format(dict_size / 2**20, ".1f")
+		+ " MiB, slots " + format(slot_size / 2**20, ".1f") + " MiB, "
+		+ format(1 - slot_size / dict_size, ".0%") + " saved")
+
+
+if __name__ == "__main__":
+	instance_count = int(argv[1]) if len(argv) > 1 else 1000000
+	paths = [Path("data/file" + str(i) + ".pdf")
+		for i in range(instance_count)]
+	print(str(instance_count) + " instances")
+	compare("PathChecker",
+		lambda path: DictPathChecker(path, ".pdf"),
+		lambda path: PathChecker(path, ".pdf"),
+		paths)
+	compare("ReactivePathChecker",
+		lambda path: DictReactivePathChecker(path, ".pdf", "input"),
+		lambda path: ReactivePathChecker(path, ".pdf", "input"),
+		paths)
+	compare("MissingPathArgWarner",
+		lambda path: DictMissingPathArgWarner("input", ".pdf"),
+		lambda path: MissingPathArgWarner("input", ".pdf"),
+		paths)
@@ -0,0 +1,53 @@
+from jazal import\
+	get_str_name,\
+	str_extension,\
+	str_file_stem
+from pathlib import Path
+from timeit import timeit
+
+
+# This script compares the extension and stem computations that go through
+# pathlib.Path.suffixes with the string functions of module str_path_util.
+# From the repository's root directory, run it with
+# python -m benchmarks.str_path_util_bench.
+
+PATH_COUNT = 100000
+REPEAT = 3
+
+
+def suffixes_extension(path_str):
+	return "".join(Path(path_str).suffixes)
+
+
+def suffixes_stem(path_str):
+	path = Path(path_str)
+	file_stem = path.name
+	suffixes = path.suffixes
+
+	if len(suffixes) > 0:
+		file_stem = file_stem[:file_stem.index(suffixes[0])]
+
+	return file_stem
+
+
+def time_function(function, path_strs):
+	return min(timeit(lambda: [function(p) for p in path_strs], number=1)
+		for _ in range(REPEAT))
+
+
+def compare(name, pathlib_function, str_function, path_strs):
+	pathlib_time = time_function(pathlib_function, path_strs)
+	str_time = time_function(str_function, path_strs)
+	print(name + ": pathlib " + format(pathlib_time, ".3f") + " s, strings "
+		+ format(str_time, ".3f") + " s, speedup "
+		+ format(pathlib_time / str_time, ".1f"))
+
+
+if __name__ == "__main__":
+	path_strs = ["data/run" + str(i % 100) + "/sample" + str(i)
+		+ (".tar.gz", ".pdf", ".nii.gz", "")[i % 4]
+		for i in range(PATH_COUNT)]
+	print(str(PATH_COUNT) + " paths")
+	compare("Name", lambda p: Path(p).name, get_str_name, path_strs)
+	compare("Extension", suffixes_extension, str_extension, path_strs)
+	compare("Stem", suffixes_stem, str_file_stem, path_strs)
@@ -0,0 +1,82 @@
+from jazal import\
+	ReactivePathChecker,\
+	ThreadPoolChecker
+from pathlib import Path
+from sys import argv
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+
+# This script compares the sequential verification of many paths with the
+# verification performed by ThreadPoolChecker. From the repository's root
+# directory, run it with python -m benchmarks.thread_pool_bench.
+# Argument 1 (optional): a directory, ideally on a network mount, whose files
+# will be checked. If it is omitted, files are created in a temporary
+# directory.
+# Argument 2 (optional): the number of threads. Defaults to 16.
+
+FILE_CHECKS = (
+	ReactivePathChecker.check_path_exists,
+	ReactivePathChecker.check_path_is_file,
+	ReactivePathChecker.check_extension_correct)
+FILE_COUNT = 5000
+
+
+def make_checkers(directory):
+	return [ReactivePathChecker(path, ".txt", "path")
+		for path in directory.iterdir()]
+
+
+def run_sequential(checkers):
+	failure_count = 0
+
+	for checker in checkers:
+		try:
+			for check in FILE_CHECKS:
+				check(checker)
+
+		except Exception:
+			failure_count += 1
+
+	return failure_count
+
+
+def run_threaded(checkers, thread_count):
+	with ThreadPoolChecker(max_workers=thread_count) as tpc:
+		return sum(1 for _, error in tpc.check(checkers, FILE_CHECKS)
+			if error is not None)
+
+
+def time_run(name, function, *args):
+	start = perf_counter()
+	failure_count = function(*args)
+	duration = perf_counter() - start
+	print(name + ": " + format(duration, ".3f") + " s, "
+		+ str(failure_count) + " failures")
+	return duration
+
+
+def benchmark(directory, thread_count):
+	checkers = make_checkers(directory)
+	print(str(len(checkers)) + " paths in " + str(directory))
+	sequential = time_run("Sequential", run_sequential, checkers)
+	threaded = time_run(str(thread_count) + " threads", run_threaded,
+		checkers, thread_count)
+	print("Speedup: " + format(sequential / threaded, ".2f"))
+
+
+if __name__ == "__main__":
+	thread_count = int(argv[2]) if len(argv) > 2 else 16
+
+	if len(argv) > 1:
+		benchmark(Path(argv[1]), thread_count)
+
+	else:
+		with TemporaryDirectory() as temp_dir:
+			temp_dir = Path(temp_dir)
+
+			for i in range(FILE_COUNT):
+				suffix = ".txt" if i % 10 > 0 else ".pdf"
+				(temp_dir/("file" + str(i) + suffix)).touch()
+
+			benchmark(temp_dir, thread_count)
@@ -1,4 +1,76 @@
-from .missing_path_arg_warner import MissingPathArgWarner
-from .path_checker import PathChecker
-from .path_util import *
-from .reactive_path_checker import ReactivePathChecker
+"""
+Jazal performs certain verifications on file paths before a function or a
+script uses them.
+
+The public names of this package are imported from their module only when they
+are first accessed, so that importing Jazal stays fast and does not load the
+modules that an application does not use.
+"""
+
+
+from importlib import import_module
+
+
+# Each public name is mapped to the module that defines it.
+_NAME_MODULES = {
+	"AlteredPathMaker": ".altered_path_maker",
+	"AsyncPathChecker": ".async_path_checker",
+	"BatchPathChecker": ".batch_path_checker",
+	"CheckPlan": ".check_plan",
+	"CheckStatus": ".check_status",
+	"ContentSignatureCache": ".content_signature",
+	"header_matches": ".content_signature",
+	"read_header": ".content_signature",
+	"DirFdLookup": ".dir_fd_lookup",
+	"DirectoryIndex": ".directory_index",
+	"ExtensionSet": ".extension_set",
+	"FingerprintCache": ".file_fingerprint",
+	"hash_file": ".file_fingerprint",
+	"InotifyWatcher": ".inotify_watcher",
+	"WatchedDirectoryIndex": ".inotify_watcher",
+	"CheckInstrument": ".instrumentation",
+	"disable_instrumentation": ".instrumentation",
+	"enable_instrumentation": ".instrumentation",
+	"get_instrumentation": ".instrumentation",
+	"MissingPathArgWarner": ".missing_path_arg_warner",
+	"NegativeLookupCache": ".negative_lookup_cache",
+	"ParsedPath": ".parsed_path",
+	"PathChecker": ".path_checker",
+	"PathPipeline": ".path_pipeline",
+	"read_path_lines": ".path_pipeline",
+	"PathSet": ".path_set",
+	"PersistentCheckCache": ".persistent_cache",
+	"extension_to_str": ".path_util",
+	"get_file_stem": ".path_util",
+	"make_altered_name": ".path_util",
+	"make_altered_path": ".path_util",
+	"make_altered_stem": ".path_util",
+	"stat_or_none": ".path_util",
+	"ProcessPoolChecker": ".process_pool_checker",
+	"ReactivePathChecker": ".reactive_path_checker",
+	"get_str_name": ".str_path_util",
+	"split_name": ".str_path_util",
+	"str_altered_name": ".str_path_util",
+	"str_extension": ".str_path_util",
+	"str_file_stem": ".str_path_util",
+	"ThreadPoolChecker": ".thread_pool_checker",
+	"TreeValidator": ".tree_validator"
+}
+
+__all__ = sorted(_NAME_MODULES)
+
+
+def __dir__():
+	return sorted(set(globals()) | set(_NAME_MODULES))
+
+
+def __getattr__(name):
+	module_name = _NAME_MODULES.get(name)
+
+	if module_name is None:
+		raise AttributeError(
+			"module '" + __name__ + "' has no attribute '" + name + "'")
+
+	value = getattr(import_module(module_name, __name__), name)
+	globals()[name] = value
+	return value
@@ -0,0 +1,187 @@
+from .parsed_path import ParsedPath
+from .str_path_util import split_name
+
+
+class AlteredPathMaker:
+	"""
+	This class applies the alteration performed by functions
+	make_altered_name and make_altered_path of module path_util to many
+	paths. The strings added before and after the stems and the extension
+	(properties before_stem, after_stem and extension) are given once, when
+	the object is created, and each path is parsed only once.
+
+	The altered names or paths can be generated lazily or returned in a list.
+	Method find_collisions detects the paths that would be altered into the
+	same path in a single pass.
+	"""
+
+	__slots__ = ("_after_stem", "_before_stem", "_extension", "_prefix",
+		"_suffix")
+
+	def __init__(self, before_stem=None, after_stem=None, extension=None):
+		"""
+		The constructor stores the alteration to apply.
+
+		Args:
+			before_stem (str): the string to add to the beginning of the
+				paths' stem. If it is None, nothing is added to the stems'
+				beginning. Defaults to None.
+			after_stem (str): the string to add to the end of the paths' stem.
+				If it is None, nothing is added to the stems' end. Defaults to
+				None.
+			extension (str): the extension to append to the new stems. If
+				None, the extension of each path is appended. Defaults to
+				None.
+		"""
+		self._before_stem = before_stem
+		self._after_stem = after_stem
+		self._extension = extension
+		self._prefix = "" if before_stem is None else before_stem
+		self._suffix = "" if after_stem is None else after_stem
+
+	def __repr__(self):
+		return self.__class__.__name__ + "(" + repr(self._before_stem)\
+			+ ", " + repr(self._after_stem) + ", " + repr(self._extension)\
+			+ ")"
+
+	@property
+	def after_stem(self):
+		"""
+		This read-only property is the string (str) added to the end of the
+		stems or None if nothing is added.
+		"""
+		return self._after_stem
+
+	@property
+	def before_stem(self):
+		"""
+		This read-only property is the string (str) added to the beginning of
+		the stems or None if nothing is added.
+		"""
+		return self._before_stem
+
+	@property
+	def extension(self):
+		"""
+		This read-only property is the extension (str) appended to the new
+		stems or None if each path keeps its extension.
+		"""
+		return self._extension
+
+	def find_collisions(self, paths):
+		"""
+		Detects the paths that this object would alter into the same path.
+
+		Args:
+			paths (iterable): pathlib.Path or ParsedPath objects
+
+		Returns:
+			dict: each altered path (pathlib.Path) made from more than one
+				path mapped to the list of the paths that it is made from, in
+				their original order
+		"""
+		first_sources = dict()
+		collisions = dict()
+
+		for path in paths:
+			altered_path = self.make_path(path)
+
+			if altered_path not in first_sources:
+				first_sources[altered_path] = path
+				continue
+
+			sources = collisions.get(altered_path)
+
+			if sources is None:
+				collisions[altered_path] = [first_sources[altered_path], path]
+
+			else:
+				sources.append(path)
+
+		return collisions
+
+	def iter_names(self, paths):
+		"""
+		Lazily makes the altered name of each path.
+
+		Args:
+			paths (iterable): pathlib.Path or ParsedPath objects
+
+		Returns:
+			generator: the altered names (str) in the order of paths
+		"""
+		for path in paths:
+			yield self.make_name(path)
+
+	def iter_paths(self, paths):
+		"""
+		Lazily makes the altered form of each path.
+
+		Args:
+			paths (iterable): pathlib.Path or ParsedPath objects
+
+		Returns:
+			generator: the altered paths (pathlib.Path) in the order of paths
+		"""
+		for path in paths:
+			yield self.make_path(path)
+
+	def make_name(self, path):
+		"""
+		Makes the altered name of one path. The result is the same as that of
+		path_util.make_altered_name.
+
+		Args:
+			path (pathlib.Path or ParsedPath): the file path that provides the
+				original name
+
+		Returns:
+			str: a new file name with the specified additions
+		"""
+		if isinstance(path, ParsedPath):
+			stem = path.stem
+			path_exten = path.extension
+
+		else:
+			stem, path_exten = split_name(path.name)
+
+		return self._prefix + stem + self._suffix\
+			+ (path_exten if self._extension is None else self._extension)
+
+	def make_names(self, paths):
+		"""
+		Makes the altered name of each path.
+
+		Args:
+			paths (iterable): pathlib.Path or ParsedPath objects
+
+		Returns:
+			list: the altered names (str) in the order of paths
+		"""
+		return [self.make_name(path) for path in paths]
+
+	def make_path(self, path):
+		"""
+		Makes the altered form of one path. The result is the same as that of
+		path_util.make_altered_path.
+
+		Args:
+			path (pathlib.Path or ParsedPath): the file path of which an
+				altered form is needed
+
+		Returns:
+			pathlib.Path: a new file path with the specified additions
+		"""
+		return path.parent/self.make_name(path)
+
+	def make_paths(self, paths):
+		"""
+		Makes the altered form of each path.
+
+		Args:
+			paths (iterable): pathlib.Path or ParsedPath objects
+
+		Returns:
+			list: the altered paths (pathlib.Path) in the order of paths
+		"""
+		return [self.make_path(path) for path in paths]
@@ -0,0 +1,180 @@
+from asyncio import\
+	Semaphore,\
+	gather,\
+	get_running_loop
+
+
+class AsyncPathChecker:
+	"""
+	This class provides coroutine counterparts of the methods of PathChecker
+	and ReactivePathChecker that query the file system. Each of them runs the
+	corresponding method of a given checker in an executor so that the event
+	loop is not blocked by slow storage. At most max_concurrency queries run
+	at the same time.
+
+	Since the checker's own methods are executed, the results, the exception
+	types and the exception messages are identical to the synchronous ones.
+	An instance must be used in only one event loop.
+	"""
+
+	def __init__(self, max_concurrency=16, executor=None):
+		"""
+		The constructor sets the concurrency limit and the executor.
+
+		Args:
+			max_concurrency (int): the maximum number of file system queries
+				running at the same time. Defaults to 16.
+			executor (concurrent.futures.Executor): the executor that runs the
+				queries. If it is None, the event loop's default executor is
+				used. Defaults to None.
+
+		Raises:
+			ValueError: if max_concurrency is smaller than 1
+		"""
+		if max_concurrency < 1:
+			raise ValueError("The maximum concurrency must be at least 1.")
+
+		self._max_concurrency = max_concurrency
+		self._executor = executor
+		self._semaphore = None
+
+	async def check_all(self, checkers, checks):
+		"""
+		Calls methods of ReactivePathChecker such as check_path_exists on each
+		checker concurrently. For a given checker, the methods are called in
+		the order of argument checks and the first one that raises an
+		exception stops the verification.
+
+		Args:
+			checkers (iterable): ReactivePathChecker objects
+			checks (sequence): functions taking a checker as their only
+				argument, such as ReactivePathChecker.check_path_exists
+
+		Returns:
+			list: item i is the exception raised by the verification of
+				checker i or None if all checks passed
+		"""
+		checks = tuple(checks)
+
+		def run_checks(checker):
+			for check in checks:
+				check(checker)
+
+		return await gather(
+			*(self._run(run_checks, checker) for checker in checkers),
+			return_exceptions=True)
+
+	async def check_extension_correct(self, checker):
+		"""
+		Calls checker.check_extension_correct. Since this verification does
+		not query the file system, it runs directly in the event loop.
+
+		Args:
+			checker (ReactivePathChecker): the checker to use
+
+		Raises:
+			ValueError: if checker.extension_is_correct() returns False
+		"""
+		checker.check_extension_correct()
+
+	async def check_path_exists(self, checker):
+		"""
+		Calls checker.check_path_exists in the executor.
+
+		Args:
+			checker (ReactivePathChecker): the checker to use
+
+		Raises:
+			FileNotFoundError: if checker.path_exists() returns False
+		"""
+		await self._run(checker.check_path_exists)
+
+	async def check_path_is_dir(self, checker):
+		"""
+		Calls checker.check_path_is_dir in the executor.
+
+		Args:
+			checker (ReactivePathChecker): the checker to use
+
+		Raises:
+			ValueError: if checker.path_is_dir() returns False
+		"""
+		await self._run(checker.check_path_is_dir)
+
+	async def check_path_is_file(self, checker):
+		"""
+		Calls checker.check_path_is_file in the executor.
+
+		Args:
+			checker (ReactivePathChecker): the checker to use
+
+		Raises:
+			ValueError: if checker.path_is_file() returns False
+		"""
+		await self._run(checker.check_path_is_file)
+
+	@property
+	def max_concurrency(self):
+		"""
+		This read-only property is the maximum number (int) of file system
+		queries running at the same time.
+		"""
+		return self._max_concurrency
+
+	async def path_exists(self, checker):
+		"""
+		Calls checker.path_exists in the executor.
+
+		Args:
+			checker (PathChecker): the checker to use
+
+		Returns:
+			bool: True if the checker's path exists, False otherwise
+		"""
+		return await self._run(checker.path_exists)
+
+	async def path_is_dir(self, checker):
+		"""
+		Calls checker.path_is_dir in the executor.
+
+		Args:
+			checker (PathChecker): the checker to use
+
+		Returns:
+			bool: True if the checker's path exists and is a directory, False
+				otherwise
+		"""
+		return await self._run(checker.path_is_dir)
+
+	async def path_is_file(self, checker):
+		"""
+		Calls checker.path_is_file in the executor.
+
+		Args:
+			checker (PathChecker): the checker to use
+
+		Returns:
+			bool: True if the checker's path exists and is a file, False
+				otherwise
+		"""
+		return await self._run(checker.path_is_file)
+
+	async def _run(self, function, *args):
+		"""
+		Runs a function in the executor once the concurrency limit allows it.
+
+		Args:
+			function (callable): the function to run
+			*args: the function's arguments
+
+		Returns:
+			the value returned by function
+		"""
+		if self._semaphore is None:
+			# The semaphore is made in a coroutine to bind it to the running
+			# event loop.
+			self._semaphore = Semaphore(self._max_concurrency)
+
+		async with self._semaphore:
+			return await get_running_loop().run_in_executor(
+				self._executor, function, *args)
@@ -0,0 +1,214 @@
+from pathlib import Path
+from stat import S_ISDIR, S_ISREG
+from .extension_set import\
+	extension_matches,\
+	repr_expected_extension,\
+	to_expected_extension
+from .path_util import\
+	extension_to_str,\
+	stat_or_none
+
+try:
+	import numpy as _numpy
+except ImportError:
+	_numpy = None
+
+
+class BatchPathChecker:
+	"""
+	This class performs the verifications of PathChecker on a whole sequence
+	of paths that are supposed to have the same extension (property
+	extension). Instead of one object per path, it produces one compact array
+	per verification, where item i is the result for path i. The arrays are
+	NumPy boolean arrays if NumPy is installed and bytearrays of zeros and ones
+	otherwise.
+
+	The file system is queried once per path with os.stat. The results are
+	kept and shared by methods path_exists, path_is_dir and path_is_file until
+	method refresh is called.
+	"""
+
+	def __init__(self, paths, extension):
+		"""
+		The constructor needs a sequence of paths and the extension that they
+		are supposed to have. The expected extension must start with a '.'.
+
+		Args:
+			paths (sequence): pathlib.Path objects or strings that this
+				instance will check
+			extension (str, ExtensionSet or iterable): the extension that the
+				paths are supposed to have. If the paths are not supposed to
+				have an extension, set this argument to an empty string. If
+				several extensions are allowed, give an ExtensionSet or
+				another collection of strings.
+
+		Raises:
+			TypeError: if an item of paths is not an instance of str or
+				pathlib.Path
+		"""
+		self._paths = tuple(_to_path(a_path) for a_path in paths)
+		self._extension = to_expected_extension(extension)
+		self._stat_results = None
+
+	def __getitem__(self, index):
+		return self._paths[index]
+
+	def __len__(self):
+		return len(self._paths)
+
+	def __repr__(self):
+		return self.__class__.__name__ + "(<" + str(len(self._paths))\
+			+ " paths>, " + repr_expected_extension(self._extension) + ")"
+
+	@property
+	def extension(self):
+		"""
+		This read-only property is the extension (str) that the paths are
+		supposed to have. If they are not supposed to have an extension, this
+		property is an empty string. If several extensions are allowed, this
+		property is an ExtensionSet.
+		"""
+		return self._extension
+
+	def extension_is_correct(self):
+		"""
+		Indicates whether each path's extension matches the expected
+		extension.
+
+		Returns:
+			numpy.ndarray or bytearray: item i is true if path i has the right
+				extension
+		"""
+		extension = self._extension
+		results = bytearray(len(self._paths))
+
+		for i, path in enumerate(self._paths):
+			if extension_matches(extension_to_str(path), extension):
+				results[i] = 1
+
+		return _make_result_array(results)
+
+	def path_exists(self):
+		"""
+		Indicates whether each path points to an existent directory or file.
+
+		Returns:
+			numpy.ndarray or bytearray: item i is true if path i exists
+		"""
+		results = bytearray(len(self._paths))
+
+		for i, stat_result in enumerate(self._get_stat_results()):
+			if stat_result is not None:
+				results[i] = 1
+
+		return _make_result_array(results)
+
+	def path_is_dir(self):
+		"""
+		Indicates whether each path points to a directory.
+
+		Returns:
+			numpy.ndarray or bytearray: item i is true if path i exists and
+				is a directory
+		"""
+		return self._make_mode_results(S_ISDIR)
+
+	def path_is_file(self):
+		"""
+		Indicates whether each path points to a file.
+
+		Returns:
+			numpy.ndarray or bytearray: item i is true if path i exists and
+				is a file
+		"""
+		return self._make_mode_results(S_ISREG)
+
+	@property
+	def paths(self):
+		"""
+		This read-only property is the tuple of paths (pathlib.Path) that this
+		object checks.
+		"""
+		return self._paths
+
+	def refresh(self):
+		"""
+		Discards the stored os.stat results. The file system will be queried
+		again by the next call to path_exists, path_is_dir or path_is_file.
+		"""
+		self._stat_results = None
+
+	def _get_stat_results(self):
+		"""
+		Provides the os.stat result of each path. The file system is queried
+		only if no results are stored.
+
+		Returns:
+			list: item i is path i's os.stat_result or None if path i does not
+				exist
+		"""
+		if self._stat_results is None:
+			self._stat_results = [stat_or_none(path) for path in self._paths]
+
+		return self._stat_results
+
+	def _make_mode_results(self, mode_test):
+		"""
+		Applies a file type test from module stat to each stored os.stat
+		result.
+
+		Args:
+			mode_test (callable): a function such as stat.S_ISDIR
+
+		Returns:
+			numpy.ndarray or bytearray: item i is true if path i exists and
+				passes mode_test
+		"""
+		results = bytearray(len(self._paths))
+
+		for i, stat_result in enumerate(self._get_stat_results()):
+			if stat_result is not None and mode_test(stat_result.st_mode):
+				results[i] = 1
+
+		return _make_result_array(results)
+
+
+def _make_result_array(results):
+	"""
+	Converts a bytearray of zeros and ones to a NumPy boolean array if NumPy is
+	installed.
+
+	Args:
+		results (bytearray): verification results
+
+	Returns:
+		numpy.ndarray or bytearray: the results as a NumPy boolean array or
+			the given bytearray if NumPy is not installed
+	"""
+	if _numpy is None:
+		return results
+
+	return _numpy.frombuffer(results, dtype=_numpy.bool_)
+
+
+def _to_path(a_path):
+	"""
+	Converts a path to a pathlib.Path object like PathChecker does.
+
+	Args:
+		a_path (pathlib.Path or str): a path to check
+
+	Returns:
+		pathlib.Path: a_path itself or a pathlib.Path made from it
+
+	Raises:
+		TypeError: if a_path is not an instance of pathlib.Path or str
+	"""
+	if isinstance(a_path, Path):
+		return a_path
+
+	elif isinstance(a_path, str):
+		return Path(a_path)
+
+	raise TypeError(
+		"The given path must be an instance of pathlib.Path or str.")
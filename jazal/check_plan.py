@@ -0,0 +1,215 @@
+from stat import S_ISDIR, S_ISREG
+from .check_status import\
+	CheckStatus,\
+	make_status_msg
+from .extension_set import\
+	extension_matches,\
+	repr_expected_extension,\
+	to_expected_extension
+from .path_util import stat_or_none
+from .str_path_util import\
+	get_str_name,\
+	split_name
+
+
+class CheckPlan:
+	"""
+	This class holds the verifications that the values of a path argument
+	must pass: the argument's name (property arg_name), the expected
+	extension (property extension) and whether the path must exist and be a
+	directory or a file. The plan is compiled once, when the object is
+	created, and can then be applied to any number of paths without making a
+	checker for each of them.
+
+	When a plan is applied to a path, the verifications are always performed
+	from the cheapest to the most expensive. The extension is tested first
+	with string operations only. Then, if needed, the file system is queried
+	with at most one os.stat call, which answers whether the path exists and
+	whether it is a directory or a file. The first failed verification ends
+	the process.
+
+	The outcome of a verification is a CheckStatus, and the message that
+	describes a failure is identical to that of the exception that
+	ReactivePathChecker would raise.
+	"""
+
+	__slots__ = ("_arg_name", "_extension", "_mode_test", "_must_be_dir",
+		"_must_be_file", "_must_exist", "_needs_stat", "_type_status")
+
+	def __init__(self, arg_name, extension, must_exist=True,
+			must_be_dir=False, must_be_file=False):
+		"""
+		The constructor needs the name of the path argument, the expected
+		extension and the requirements about the path's existence and type.
+		If a path required to be a directory or a file does not exist, it
+		fails the existence verification if must_exist is True and the type
+		verification otherwise, like ReactivePathChecker's check_path_is_dir
+		and check_path_is_file.
+
+		Args:
+			arg_name (str): the name of the path argument
+			extension (str, ExtensionSet or iterable): the extension that the
+				paths are supposed to have. If they are not supposed to have
+				an extension, set this argument to an empty string. If several
+				extensions are allowed, give an ExtensionSet or another
+				collection of strings.
+			must_exist (bool): True if the paths must exist. Defaults to True.
+			must_be_dir (bool): True if the paths must point to a directory.
+				Defaults to False.
+			must_be_file (bool): True if the paths must point to a file.
+				Defaults to False.
+
+		Raises:
+			ValueError: if must_be_dir and must_be_file are both True
+		"""
+		if must_be_dir and must_be_file:
+			raise ValueError(
+				"A path cannot be required to be a directory and a file.")
+
+		self._arg_name = arg_name
+		self._extension = to_expected_extension(extension)
+		self._must_exist = must_exist
+		self._must_be_dir = must_be_dir
+		self._must_be_file = must_be_file
+		self._needs_stat = must_exist or must_be_dir or must_be_file
+
+		if must_be_dir:
+			self._mode_test = S_ISDIR
+			self._type_status = CheckStatus.NOT_A_DIR
+
+		elif must_be_file:
+			self._mode_test = S_ISREG
+			self._type_status = CheckStatus.NOT_A_FILE
+
+		else:
+			self._mode_test = None
+			self._type_status = CheckStatus.OK
+
+	def __reduce__(self):
+		return self.__class__, (self._arg_name, self._extension,
+			self._must_exist, self._must_be_dir, self._must_be_file)
+
+	def __repr__(self):
+		return self.__class__.__name__ + "('" + self._arg_name + "', "\
+			+ repr_expected_extension(self._extension) + ", "\
+			+ str(self._must_exist) + ", " + str(self._must_be_dir) + ", "\
+			+ str(self._must_be_file) + ")"
+
+	@property
+	def arg_name(self):
+		"""
+		This read-only property is the name (str) of the path argument found
+		in the messages made by this plan.
+		"""
+		return self._arg_name
+
+	def check(self, path):
+		"""
+		Applies this plan to a path and raises the exception that
+		ReactivePathChecker's check methods would raise if a verification
+		fails.
+
+		Args:
+			path (pathlib.Path or str): the path to check
+
+		Raises:
+			FileNotFoundError: if path must exist and does not
+			ValueError: if path's extension or type is incorrect
+		"""
+		status = self.validate(path)
+
+		if status != CheckStatus.OK:
+			raise status.error_type(self.make_status_msg(path, status))
+
+	@property
+	def extension(self):
+		"""
+		This read-only property is the extension (str) that the paths are
+		supposed to have. If they are not supposed to have an extension, this
+		property is an empty string. If several extensions are allowed, this
+		property is an ExtensionSet.
+		"""
+		return self._extension
+
+	def make_status_msg(self, path, status):
+		"""
+		Makes the message that describes the outcome of this plan's
+		application to a path.
+
+		Args:
+			path (pathlib.Path or str): the checked path
+			status (CheckStatus): the status returned by method validate
+
+		Returns:
+			str: the message describing status or None if status is OK
+		"""
+		return make_status_msg(status, self._arg_name, self._extension, path)
+
+	@property
+	def must_be_dir(self):
+		"""
+		This read-only property is True if the paths must point to a
+		directory, False otherwise.
+		"""
+		return self._must_be_dir
+
+	@property
+	def must_be_file(self):
+		"""
+		This read-only property is True if the paths must point to a file,
+		False otherwise.
+		"""
+		return self._must_be_file
+
+	@property
+	def must_exist(self):
+		"""
+		This read-only property is True if the paths must exist, False
+		otherwise.
+		"""
+		return self._must_exist
+
+	def validate(self, path):
+		"""
+		Applies this plan to a path without raising an exception.
+
+		Args:
+			path (pathlib.Path or str): the path to check
+
+		Returns:
+			CheckStatus: OK if path passes all the verifications, the status
+				of the first failed verification otherwise
+		"""
+		if not extension_matches(
+				split_name(get_str_name(path))[1], self._extension):
+			return CheckStatus.WRONG_EXTENSION
+
+		if not self._needs_stat:
+			return CheckStatus.OK
+
+		stat_result = stat_or_none(path)
+
+		if stat_result is None:
+			if self._must_exist:
+				return CheckStatus.PATH_NOT_FOUND
+
+			return self._type_status
+
+		if self._mode_test is not None\
+				and not self._mode_test(stat_result.st_mode):
+			return self._type_status
+
+		return CheckStatus.OK
+
+	def validate_all(self, paths):
+		"""
+		Applies this plan to each path of an iterable.
+
+		Args:
+			paths (iterable): pathlib.Path objects or strings to check
+
+		Returns:
+			bytearray: item i is the CheckStatus value of path i
+		"""
+		validate = self.validate
+		return bytearray(validate(path) for path in paths)
@@ -0,0 +1,88 @@
+from enum import IntEnum
+from pathlib import Path
+from .extension_set import ExtensionSet
+
+
+class CheckStatus(IntEnum):
+	"""
+	This enumeration represents the outcome of a verification performed by the
+	validate methods of ReactivePathChecker. Its members are integers, so
+	they can be stored in compact arrays and tested for truth: OK is 0 and
+	every failure is a nonzero value. The message that describes a failure is
+	made by ReactivePathChecker.make_status_msg only when it is requested.
+	"""
+
+	OK = 0
+	WRONG_EXTENSION = 1
+	PATH_NOT_FOUND = 2
+	NOT_A_DIR = 3
+	NOT_A_FILE = 4
+	WRONG_CONTENT = 5
+	NOT_LISTABLE = 6
+
+	@property
+	def error_type(self):
+		"""
+		This read-only property is the type of exception that the check
+		methods of ReactivePathChecker raise for this status or None if this
+		status is OK.
+		"""
+		if self is CheckStatus.OK:
+			return None
+
+		elif self is CheckStatus.PATH_NOT_FOUND:
+			return FileNotFoundError
+
+		elif self is CheckStatus.NOT_LISTABLE:
+			return OSError
+
+		return ValueError
+
+
+def make_status_msg(status, arg_name, extension, path):
+	"""
+	Makes the message that describes a verification's outcome. For a failure,
+	it is the message of the exception that ReactivePathChecker's
+	corresponding check method raises.
+
+	Args:
+		status (CheckStatus): the outcome of a verification
+		arg_name (str): the name of the checked path argument
+		extension (str or ExtensionSet): the expected extension or the
+			allowed extensions
+		path (pathlib.Path or str): the checked path
+
+	Returns:
+		str: the message describing status or None if status is OK
+	"""
+	if status == CheckStatus.WRONG_EXTENSION:
+		if isinstance(extension, ExtensionSet):
+			return arg_name + " must be the path to a file with one of the "\
+				+ "extensions " + extension.to_quoted_list() + "."
+
+		return arg_name + " must be the path to a file with the extension '"\
+			+ extension + "'."
+
+	elif status == CheckStatus.WRONG_CONTENT:
+		if isinstance(extension, ExtensionSet):
+			return arg_name + " must be the path to a file whose content "\
+				+ "matches one of the extensions "\
+				+ extension.to_quoted_list() + "."
+
+		return arg_name + " must be the path to a file whose content "\
+			+ "matches the extension '" + extension + "'."
+
+	elif status == CheckStatus.PATH_NOT_FOUND:
+		return arg_name + ": " + str(Path(path)) + " does not exist."
+
+	elif status == CheckStatus.NOT_A_DIR:
+		return arg_name + " must be the path to a directory."
+
+	elif status == CheckStatus.NOT_A_FILE:
+		return arg_name + " must be the path to a file."
+
+	elif status == CheckStatus.NOT_LISTABLE:
+		return arg_name + " must be the path to a directory that can be "\
+			+ "listed."
+
+	return None
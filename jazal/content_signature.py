@@ -0,0 +1,240 @@
+from collections import OrderedDict
+from os import stat
+from stat import S_ISREG
+from threading import Lock
+from .extension_set import ExtensionSet
+
+
+__all__ = [
+	"HEADER_SIZE",
+	"SIGNATURES",
+	"ContentSignatureCache",
+	"header_matches",
+	"read_header"
+]
+
+
+# The number of bytes read at the beginning of a file. It covers the tar
+# signature, which ends at byte 262.
+HEADER_SIZE = 262
+
+_ZIP_SIGNATURES = ((0, b"PK\x03\x04"), (0, b"PK\x05\x06"), (0, b"PK\x07\x08"))
+
+# Each extension is mapped to the signatures that files with that extension
+# may start with. A signature is a tuple containing its offset and its bytes.
+SIGNATURES = {
+	".7z": ((0, b"7z\xbc\xaf\x27\x1c"),),
+	".bz2": ((0, b"BZh"),),
+	".docx": _ZIP_SIGNATURES,
+	".gif": ((0, b"GIF87a"), (0, b"GIF89a")),
+	".gz": ((0, b"\x1f\x8b"),),
+	".jar": _ZIP_SIGNATURES,
+	".jpeg": ((0, b"\xff\xd8\xff"),),
+	".jpg": ((0, b"\xff\xd8\xff"),),
+	".odt": _ZIP_SIGNATURES,
+	".pdf": ((0, b"%PDF-"),),
+	".png": ((0, b"\x89PNG\r\n\x1a\n"),),
+	".pptx": _ZIP_SIGNATURES,
+	".tar": ((257, b"ustar"),),
+	".tgz": ((0, b"\x1f\x8b"),),
+	".xlsx": _ZIP_SIGNATURES,
+	".xz": ((0, b"\xfd7zXZ\x00"),),
+	".zip": _ZIP_SIGNATURES,
+	".zst": ((0, b"\x28\xb5\x2f\xfd"),)
+}
+
+
+class ContentSignatureCache:
+	"""
+	This class verifies whether the content of files matches their expected
+	extension by comparing their first bytes with the signatures of module
+	dictionary SIGNATURES. Only the first HEADER_SIZE bytes of a file are
+	read, into a small buffer.
+
+	The headers read are kept in a cache whose key is the file's device,
+	inode, size and modification time. A file that did not change since its
+	header was read is thus verified again with a single os.stat call. At
+	most max_files headers are kept. When a new header must be kept, the
+	least recently used one is discarded. An instance can be shared by many
+	threads.
+	"""
+
+	def __init__(self, max_files=4096):
+		"""
+		The constructor sets the size of the cache.
+
+		Args:
+			max_files (int): the maximum number of file headers kept.
+				Defaults to 4096.
+
+		Raises:
+			ValueError: if max_files is smaller than 1
+		"""
+		if max_files < 1:
+			raise ValueError(
+				"The maximum number of files must be at least 1.")
+
+		self._max_files = max_files
+		self._headers = OrderedDict()
+		self._lock = Lock()
+		self._read_count = 0
+
+	def __len__(self):
+		return len(self._headers)
+
+	def clear(self):
+		"""
+		Discards all the file headers.
+		"""
+		with self._lock:
+			self._headers.clear()
+
+	def content_matches(self, path, extension):
+		"""
+		Indicates whether a file's content matches an expected extension. If
+		no signature is known for that extension, the content cannot be
+		refuted and is considered correct.
+
+		Args:
+			path (pathlib.Path or str): the path to a file
+			extension (str or ExtensionSet): the expected extension or the
+				allowed extensions
+
+		Returns:
+			bool: True if path points to a file whose content matches
+				extension or one of the allowed extensions, False otherwise
+		"""
+		header = self.get_header(path)
+
+		if header is None:
+			return False
+
+		if isinstance(extension, ExtensionSet):
+			return any(header_matches(header, an_exten)
+				for an_exten in extension)
+
+		return header_matches(header, extension)
+
+	def get_header(self, path):
+		"""
+		Provides the first bytes of a file. The file is read only if its
+		header is not in the cache or if the file changed since it was read.
+
+		Args:
+			path (pathlib.Path or str): the path to a file
+
+		Returns:
+			bytes: at most HEADER_SIZE bytes from the beginning of the file or
+				None if path does not point to a readable file
+		"""
+		try:
+			stat_result = stat(path)
+
+		except (OSError, ValueError):
+			return None
+
+		if not S_ISREG(stat_result.st_mode):
+			return None
+
+		key = (stat_result.st_dev, stat_result.st_ino, stat_result.st_size,
+			stat_result.st_mtime_ns)
+
+		with self._lock:
+			header = self._headers.get(key)
+
+			if header is not None:
+				self._headers.move_to_end(key)
+				return header
+
+		try:
+			header = read_header(path)
+
+		except OSError:
+			return None
+
+		with self._lock:
+			self._read_count += 1
+			self._headers[key] = header
+
+			if len(self._headers) > self._max_files:
+				self._headers.popitem(last=False)
+
+		return header
+
+	@property
+	def max_files(self):
+		"""
+		This read-only property is the maximum number (int) of file headers
+		kept.
+		"""
+		return self._max_files
+
+	@property
+	def read_count(self):
+		"""
+		This read-only property is the number (int) of file headers read from
+		the file system since this object was created.
+		"""
+		return self._read_count
+
+
+def header_matches(header, extension):
+	"""
+	Indicates whether a file header matches one of the signatures of an
+	extension. If the whole extension, such as '.tar.gz', has no known
+	signature, its last suffix is used. If neither has a known signature,
+	the header is considered correct.
+
+	Args:
+		header (bytes): the first bytes of a file
+		extension (str): an extension starting with a '.' or an empty string
+
+	Returns:
+		bool: True if header matches extension or if no signature is known
+			for extension, False otherwise
+	"""
+	signatures = SIGNATURES.get(extension)
+
+	if signatures is None:
+		last_dot = extension.rfind(".")
+		signatures = SIGNATURES.get(extension[last_dot:])\
+			if last_dot > 0 else None
+
+	if signatures is None:
+		return True
+
+	return any(header.startswith(signature, offset)
+		for offset, signature in signatures)
+
+
+def read_header(path, size=HEADER_SIZE):
+	"""
+	Reads the first bytes of a file into a buffer of the given size without
+	reading the rest of the file.
+
+	Args:
+		path (pathlib.Path or str): the path to a file
+		size (int): the maximum number of bytes to read. Defaults to
+			HEADER_SIZE.
+
+	Returns:
+		bytes: the first bytes of the file, fewer than size if the file is
+			shorter
+
+	Raises:
+		OSError: if the file cannot be opened or read
+	"""
+	buffer = bytearray(size)
+	byte_count = 0
+
+	with open(path, mode="rb", buffering=0) as file,\
+			memoryview(buffer) as view:
+		while byte_count < size:
+			read_count = file.readinto(view[byte_count:])
+
+			if not read_count:
+				break
+
+			byte_count += read_count
+
+	return bytes(buffer[:byte_count])
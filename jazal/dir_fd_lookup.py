@@ -0,0 +1,390 @@
+import os
+from collections import OrderedDict
+from errno import ENOENT, ENOTDIR
+from stat import S_ISDIR, S_ISREG
+from threading import Lock
+from time import monotonic
+from .path_util import stat_or_none
+
+
+# The flags used to open directories. O_PATH, where it exists, requires only
+# the permission to search the directory.
+_OPEN_FLAGS = getattr(os, "O_PATH", os.O_RDONLY)\
+	| getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_CLOEXEC", 0)
+
+_MISSING_DIR = object()
+_UNAVAILABLE = object()
+
+
+class DirFdLookup:
+	"""
+	This class answers whether paths exist and whether they point to
+	directories or files with os.stat calls relative to a file descriptor of
+	their parent directory. Each parent directory is opened once, when a path
+	that it contains is first queried, so that the kernel resolves the
+	parent's path only once instead of once per query. This makes the
+	queries on paths deep in a tree cheaper.
+
+	Since the descriptor designates the directory itself, the queries on the
+	paths that a directory contains are not affected by the renaming of the
+	directory's ancestors after it has been opened. A batch of queries on
+	the paths in a directory thus gives consistent answers even if an
+	ancestor is renamed meanwhile.
+
+	When a descriptor is reused revalidation_delay seconds or more after its
+	last verification, os.fstat verifies that its directory was not deleted
+	and os.stat verifies that the directory's path still leads to it, which
+	is not the case if the directory was renamed or replaced or if the
+	working directory changed for a relative path. The directory is opened
+	again if it was deleted or if its path leads elsewhere. Between two
+	verifications, queries use the descriptor without any other system
+	call. Method invalidate discards a descriptor immediately.
+
+	At most max_fds directory descriptors are kept open. When a new directory
+	must be opened, a descriptor that was not used recently is closed. A
+	PathChecker uses an instance of this class if it is given to method
+	PathChecker.set_lookup. An instance can be shared by many checkers and by
+	many threads. Paths whose name is empty or '..', paths in directories
+	that cannot be opened and all paths on platforms where os.stat does not
+	support argument dir_fd are checked with pathlib.Path's methods.
+
+	This class can be used as a context manager. Leaving the context closes
+	all the descriptors.
+	"""
+
+	def __init__(self, max_fds=64, revalidation_delay=1.0):
+		"""
+		The constructor sets the maximum number of open directory
+		descriptors and the revalidation delay.
+
+		Args:
+			max_fds (int): the maximum number of directory descriptors kept
+				open. Defaults to 64.
+			revalidation_delay (float): the minimum number of seconds between
+				two verifications that a directory's path still leads to the
+				opened directory. If it is 0, the path is verified on each
+				query. If it is None, it is never verified and descriptors
+				must be discarded with method invalidate. Defaults to 1.0.
+
+		Raises:
+			ValueError: if max_fds is smaller than 1 or revalidation_delay is
+				negative
+		"""
+		if max_fds < 1:
+			raise ValueError(
+				"The maximum number of descriptors must be at least 1.")
+
+		if revalidation_delay is not None and revalidation_delay < 0:
+			raise ValueError("The revalidation delay cannot be negative.")
+
+		self._max_fds = max_fds
+		self._revalidation_delay = revalidation_delay
+		self._dir_fds = OrderedDict()
+		self._lock = Lock()
+		self._open_count = 0
+		self._syscall_count = 0
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.clear()
+
+	def __len__(self):
+		return len(self._dir_fds)
+
+	def clear(self):
+		"""
+		Closes all the directory descriptors. The queries in progress in
+		other threads open their directory again.
+		"""
+		with self._lock:
+			dir_fds = list(self._dir_fds.values())
+			self._dir_fds.clear()
+
+			for dir_fd in dir_fds:
+				dir_fd.close()
+
+	def invalidate(self, dir_path):
+		"""
+		Closes the descriptor of a directory. The directory will be opened
+		again when a path that it contains is queried.
+
+		Args:
+			dir_path (pathlib.Path or str): the directory whose descriptor
+				must be closed
+		"""
+		with self._lock:
+			dir_fd = self._dir_fds.pop(str(dir_path), None)
+
+			if dir_fd is not None:
+				dir_fd.close()
+
+	@property
+	def max_fds(self):
+		"""
+		This read-only property is the maximum number (int) of directory
+		descriptors kept open.
+		"""
+		return self._max_fds
+
+	@property
+	def open_count(self):
+		"""
+		This read-only property is the number (int) of directories opened
+		since this object was created.
+		"""
+		return self._open_count
+
+	def path_exists(self, path):
+		"""
+		Indicates whether a path points to an existent directory or file.
+
+		Args:
+			path (pathlib.Path): the path to check
+
+		Returns:
+			bool: True if path exists, False otherwise
+		"""
+		stat_result = self._stat(path)
+
+		if stat_result is _UNAVAILABLE:
+			return path.exists()
+
+		return stat_result is not None
+
+	def path_is_dir(self, path):
+		"""
+		Indicates whether a path points to a directory.
+
+		Args:
+			path (pathlib.Path): the path to check
+
+		Returns:
+			bool: True if path exists and is a directory, False otherwise
+		"""
+		stat_result = self._stat(path)
+
+		if stat_result is _UNAVAILABLE:
+			return path.is_dir()
+
+		return stat_result is not None and S_ISDIR(stat_result.st_mode)
+
+	def path_is_file(self, path):
+		"""
+		Indicates whether a path points to a file.
+
+		Args:
+			path (pathlib.Path): the path to check
+
+		Returns:
+			bool: True if path exists and is a file, False otherwise
+		"""
+		stat_result = self._stat(path)
+
+		if stat_result is _UNAVAILABLE:
+			return path.is_file()
+
+		return stat_result is not None and S_ISREG(stat_result.st_mode)
+
+	@property
+	def revalidation_delay(self):
+		"""
+		This read-only property is the minimum number of seconds (float)
+		between two verifications that a directory's path still leads to the
+		opened directory. If it is None, the paths are never verified.
+		"""
+		return self._revalidation_delay
+
+	@property
+	def syscall_count(self):
+		"""
+		This read-only property is the number (int) of system calls made to
+		answer the queries since this object was created: the calls to
+		os.stat, including those made by pathlib.Path's methods, to os.fstat
+		and to os.open. It is not protected by a lock, so it can miss calls
+		made by threads that query this object at the same time.
+		"""
+		return self._syscall_count
+
+	def _acquire(self, dir_key, dir_fd):
+		"""
+		Provides the descriptor of a directory that is not in the pool or
+		whose descriptor must be verified. The directory is opened if it is
+		not in the pool or if its descriptor is outdated.
+
+		Args:
+			dir_key (str): the path to the directory
+			dir_fd (_DirFd): the directory's descriptor to verify or None if
+				the directory is not in the pool
+
+		Returns:
+			_DirFd: the directory's descriptor, _MISSING_DIR if the directory
+				does not exist or _UNAVAILABLE if it cannot be opened
+		"""
+		now = monotonic()
+
+		if dir_fd is not None:
+			if self._is_current(dir_key, dir_fd, now):
+				return dir_fd
+
+			with self._lock:
+				if self._dir_fds.get(dir_key) is dir_fd:
+					del self._dir_fds[dir_key]
+					dir_fd.close()
+
+		self._syscall_count += 1
+
+		try:
+			fd = os.open(dir_key, _OPEN_FLAGS)
+
+		except OSError as e:
+			if e.errno in (ENOENT, ENOTDIR):
+				return _MISSING_DIR
+
+			return _UNAVAILABLE
+
+		with self._lock:
+			self._open_count += 1
+			dir_fd = self._dir_fds.get(dir_key)
+
+			if dir_fd is not None:
+				# Another thread opened the directory in the meantime.
+				os.close(fd)
+				return dir_fd
+
+			while len(self._dir_fds) >= self._max_fds:
+				# The descriptors used since the last eviction get a second
+				# chance, which approximates the least recently used one.
+				old_key, old_fd = self._dir_fds.popitem(last=False)
+
+				if old_fd.used:
+					old_fd.used = False
+					self._dir_fds[old_key] = old_fd
+
+				else:
+					old_fd.close()
+
+			dir_fd = _DirFd(fd, now)
+			self._dir_fds[dir_key] = dir_fd
+			return dir_fd
+
+	def _is_current(self, dir_key, dir_fd, now):
+		"""
+		Verifies that a directory descriptor can be reused: its directory
+		was not deleted and its path still leads to it.
+
+		Args:
+			dir_key (str): the path to the directory
+			dir_fd (_DirFd): a descriptor from the pool
+			now (float): the current time given by time.monotonic
+
+		Returns:
+			bool: True if the descriptor can be reused, False otherwise
+		"""
+		self._syscall_count += 2
+
+		try:
+			fd_stat = os.fstat(dir_fd.fd)
+
+		except OSError:
+			return False
+
+		if dir_fd.closed or fd_stat.st_nlink == 0:
+			return False
+
+		path_stat = stat_or_none(dir_key)
+
+		if path_stat is None or path_stat.st_dev != fd_stat.st_dev\
+				or path_stat.st_ino != fd_stat.st_ino:
+			return False
+
+		dir_fd.checked_time = now
+		return True
+
+	def _stat(self, path):
+		"""
+		Calls os.stat on a path relative to its parent's descriptor. The
+		descriptor is verified if the revalidation delay has elapsed and is
+		used without acquiring the lock. If another thread closed it
+		meanwhile, its number may designate another file, so the call is made
+		again with a current descriptor.
+
+		Args:
+			path (pathlib.Path): the path to stat
+
+		Returns:
+			os.stat_result: path's status, None if path does not exist or
+				_UNAVAILABLE if path must be checked with pathlib
+		"""
+		path_str = str(path)
+		dir_key, _, name = path_str.rpartition(os.sep)
+
+		if not _DIR_FD_SUPPORTED\
+				or name == "" or name == "." or name == "..":
+			# The caller calls a method of pathlib.Path.
+			self._syscall_count += 1
+			return _UNAVAILABLE
+
+		if dir_key == "":
+			dir_key = os.sep if path_str.startswith(os.sep) else "."
+
+		delay = self._revalidation_delay
+
+		while True:
+			dir_fd = self._dir_fds.get(dir_key)
+
+			if dir_fd is None or (delay is not None
+					and monotonic() - dir_fd.checked_time >= delay):
+				dir_fd = self._acquire(dir_key, dir_fd)
+
+				if dir_fd is _MISSING_DIR:
+					return None
+
+				elif dir_fd is _UNAVAILABLE:
+					self._syscall_count += 1
+					return _UNAVAILABLE
+
+			dir_fd.used = True
+			self._syscall_count += 1
+
+			try:
+				stat_result = stat_or_none(name, dir_fd.fd)
+
+			except OSError:
+				if not dir_fd.closed:
+					raise
+
+				continue
+
+			if not dir_fd.closed:
+				return stat_result
+
+
+class _DirFd:
+	"""
+	This class holds an open directory descriptor, the time when it was last
+	verified, whether it was used since the pool's last eviction and whether
+	it was closed. Since the descriptor is used without acquiring the pool's
+	lock, it is marked as closed before being closed, and its number does
+	not change. Method close must be called while the pool's lock is
+	acquired.
+	"""
+
+	__slots__ = ("checked_time", "closed", "fd", "used")
+
+	def __init__(self, fd, checked_time):
+		self.checked_time = checked_time
+		self.closed = False
+		self.fd = fd
+		self.used = False
+
+	def close(self):
+		"""
+		Marks the descriptor as closed and closes it.
+		"""
+		self.closed = True
+		os.close(self.fd)
+
+
+_DIR_FD_SUPPORTED = os.stat in os.supports_dir_fd
@@ -0,0 +1,332 @@
+from collections import OrderedDict
+from os import scandir
+from threading import Lock
+from time import monotonic
+from .path_util import stat_or_none
+
+
+_UNINDEXABLE = object()
+
+
+class DirectoryIndex:
+	"""
+	This class answers whether paths exist and whether they point to
+	directories or files by listing their parent directory with os.scandir
+	instead of calling os.stat on each path. Each parent directory is listed
+	once, when a path that it contains is first queried, and its entries
+	(os.DirEntry) are kept with the file type that the listing provides.
+
+	At most max_dirs listings are kept. When a new directory must be listed,
+	the least recently used listing is discarded. A listing is revalidated
+	at most once every revalidation_delay seconds by comparing the
+	directory's modification time with the one recorded when it was listed.
+	The directory is listed again only if its modification time changed.
+
+	A PathChecker uses an instance of this class if it is given to method
+	PathChecker.set_lookup. An instance can be shared by many checkers and by
+	many threads. Paths whose name is empty or '..' and paths in directories
+	that cannot be listed are checked with pathlib.Path's methods. Since names
+	are compared exactly, paths on case-insensitive file systems must have
+	the same case as the file names.
+	"""
+
+	def __init__(self, max_dirs=1024, revalidation_delay=1.0):
+		"""
+		The constructor sets the size of the index and the revalidation
+		delay.
+
+		Args:
+			max_dirs (int): the maximum number of directory listings kept.
+				Defaults to 1024.
+			revalidation_delay (float): the minimum number of seconds between
+				two verifications of a directory's modification time. If it is
+				0, the modification time is verified on each query. If it is
+				None, listings are never revalidated and must be discarded
+				with method invalidate. Defaults to 1.0.
+
+		Raises:
+			ValueError: if max_dirs is smaller than 1 or revalidation_delay is
+				negative
+		"""
+		if max_dirs < 1:
+			raise ValueError(
+				"The maximum number of directories must be at least 1.")
+
+		if revalidation_delay is not None and revalidation_delay < 0:
+			raise ValueError("The revalidation delay cannot be negative.")
+
+		self._max_dirs = max_dirs
+		self._revalidation_delay = revalidation_delay
+		self._listings = OrderedDict()
+		self._lock = Lock()
+		self._scan_count = 0
+		self._invalidation_count = 0
+
+	def __len__(self):
+		return len(self._listings)
+
+	def clear(self):
+		"""
+		Discards all directory listings.
+		"""
+		with self._lock:
+			dir_keys = list(self._listings)
+			self._listings.clear()
+			self._invalidation_count += 1
+
+		for dir_key in dir_keys:
+			self._on_discard(dir_key)
+
+	def invalidate(self, dir_path):
+		"""
+		Discards the listing of a directory. It will be listed again when a
+		path that it contains is queried.
+
+		Args:
+			dir_path (pathlib.Path or str): the directory whose listing must
+				be discarded
+		"""
+		dir_key = str(dir_path)
+
+		if self._forget(dir_key):
+			self._on_discard(dir_key)
+
+	@property
+	def max_dirs(self):
+		"""
+		This read-only property is the maximum number (int) of directory
+		listings kept.
+		"""
+		return self._max_dirs
+
+	def path_exists(self, path):
+		"""
+		Indicates whether a path points to an existent directory or file.
+
+		Args:
+			path (pathlib.Path): the path to check
+
+		Returns:
+			bool: True if path exists, False otherwise
+		"""
+		entries = self._get_entries(path)
+
+		if entries is _UNINDEXABLE:
+			return path.exists()
+
+		entry = entries.get(path.name)
+
+		if entry is None:
+			return False
+
+		elif entry.is_symlink():
+			# Like pathlib.Path.exists, a broken symbolic link is considered
+			# inexistent.
+			return entry.is_dir() or entry.is_file()\
+				or stat_or_none(entry.path) is not None
+
+		return True
+
+	def path_is_dir(self, path):
+		"""
+		Indicates whether a path points to a directory.
+
+		Args:
+			path (pathlib.Path): the path to check
+
+		Returns:
+			bool: True if path exists and is a directory, False otherwise
+		"""
+		entries = self._get_entries(path)
+
+		if entries is _UNINDEXABLE:
+			return path.is_dir()
+
+		entry = entries.get(path.name)
+		return entry is not None and entry.is_dir()
+
+	def path_is_file(self, path):
+		"""
+		Indicates whether a path points to a file.
+
+		Args:
+			path (pathlib.Path): the path to check
+
+		Returns:
+			bool: True if path exists and is a file, False otherwise
+		"""
+		entries = self._get_entries(path)
+
+		if entries is _UNINDEXABLE:
+			return path.is_file()
+
+		entry = entries.get(path.name)
+		return entry is not None and entry.is_file()
+
+	@property
+	def revalidation_delay(self):
+		"""
+		This read-only property is the minimum number of seconds (float)
+		between two verifications of a directory's modification time. If it
+		is None, listings are never revalidated.
+		"""
+		return self._revalidation_delay
+
+	@property
+	def scan_count(self):
+		"""
+		This read-only property is the number (int) of directory listings
+		made by this object.
+		"""
+		return self._scan_count
+
+	def _forget(self, dir_key):
+		"""
+		Discards the listing of a directory without calling method
+		_on_discard.
+
+		Args:
+			dir_key (str): the directory's path
+
+		Returns:
+			bool: True if the listing was in the index, False otherwise
+		"""
+		with self._lock:
+			self._invalidation_count += 1
+			return self._listings.pop(dir_key, None) is not None
+
+	def _get_entries(self, path):
+		"""
+		Provides the entries of the directory containing a path. The directory
+		is listed if it is not in the index or if its listing is outdated.
+
+		Args:
+			path (pathlib.Path): a path in the directory
+
+		Returns:
+			dict: the directory's entries (os.DirEntry) mapped to their name.
+				The dictionary is empty if the directory does not exist.
+				_UNINDEXABLE is returned if the path cannot be found by name
+				in its parent's listing.
+		"""
+		name = path.name
+
+		if name == "" or name == "..":
+			return _UNINDEXABLE
+
+		dir_key = str(path.parent)
+
+		with self._lock:
+			listing = self._listings.get(dir_key)
+
+			if listing is not None:
+				self._listings.move_to_end(dir_key)
+
+		now = monotonic()
+
+		if listing is not None:
+			mtime_ns, checked_time, entries = listing
+
+			if self._revalidation_delay is None\
+					or now - checked_time < self._revalidation_delay:
+				return entries
+
+			stat_result = stat_or_none(dir_key)
+			current_mtime = None if stat_result is None\
+				else stat_result.st_mtime_ns
+
+			if current_mtime == mtime_ns:
+				with self._lock:
+					if dir_key in self._listings:
+						self._listings[dir_key] = (mtime_ns, now, entries)
+
+				return entries
+
+		with self._lock:
+			invalidation_count = self._invalidation_count
+
+		keep_listing = self._on_scan(dir_key)
+		mtime_ns, entries = self._scan(dir_key)
+		discarded_keys = list()
+
+		with self._lock:
+			self._scan_count += 1
+
+			# A listing invalidated during the scan may be outdated.
+			if keep_listing\
+					and invalidation_count == self._invalidation_count:
+				self._listings[dir_key] = (mtime_ns, now, entries)
+				self._listings.move_to_end(dir_key)
+
+			elif keep_listing and dir_key not in self._listings:
+				# The resources acquired by _on_scan must be released. The
+				# invalidation prevents other threads from keeping a listing
+				# of the directory while they are released.
+				self._invalidation_count += 1
+				discarded_keys.append(dir_key)
+
+			while len(self._listings) > self._max_dirs:
+				discarded_keys.append(self._listings.popitem(last=False)[0])
+
+		for discarded_key in discarded_keys:
+			self._on_discard(discarded_key)
+
+		return entries
+
+	def _on_discard(self, dir_key):
+		"""
+		This method is called when the listing of a directory is removed from
+		the index because of its size or by methods clear and invalidate, and
+		when a listing for which method _on_scan returned True is not kept
+		because the directory was invalidated during the scan. Subclasses can
+		override it to release resources associated with the directory. This
+		implementation does nothing.
+
+		Args:
+			dir_key (str): the directory's path
+		"""
+		pass
+
+	def _on_scan(self, dir_key):
+		"""
+		This method is called before a directory is listed. Subclasses can
+		override it to start monitoring the directory. This implementation
+		does nothing.
+
+		Args:
+			dir_key (str): the directory's path
+
+		Returns:
+			bool: True if the listing can be kept in the index, False if it
+				must be used only once
+		"""
+		return True
+
+	def _scan(self, dir_key):
+		"""
+		Lists a directory.
+
+		Args:
+			dir_key (str): the directory's path
+
+		Returns:
+			tuple: the directory's modification time in nanoseconds, or None
+				if it does not exist, and its entries mapped to their name or
+				_UNINDEXABLE if it cannot be listed
+		"""
+		stat_result = stat_or_none(dir_key)
+
+		if stat_result is None:
+			return None, dict()
+
+		try:
+			with scandir(dir_key) as dir_entries:
+				entries = dict((entry.name, entry) for entry in dir_entries)
+
+		except NotADirectoryError:
+			entries = dict()
+
+		except OSError:
+			entries = _UNINDEXABLE
+
+		return stat_result.st_mtime_ns, entries
@@ -0,0 +1,165 @@
+class ExtensionSet:
+	"""
+	This immutable class represents several extensions that a path is allowed
+	to have. It can be given to PathChecker, ReactivePathChecker and
+	MissingPathArgWarner instead of a single extension. As everywhere in
+	Jazal, an extension is the concatenation of all the suffixes of a file
+	name, so a path matches if its whole extension is one of the allowed
+	ones. The extensions are indexed in a hash set: once a path's extension
+	is known, finding whether it is allowed takes constant time, however many
+	extensions are allowed.
+
+	The extensions keep the order in which they were given, without
+	duplicates. The first one (property default) is used when a path must be
+	given an allowed extension and none is chosen. Since the order matters,
+	two instances are equal only if they have the same extensions in the
+	same order.
+	"""
+
+	__slots__ = ("_extensions", "_index")
+
+	def __init__(self, extensions):
+		"""
+		The constructor needs the allowed extensions. Each of them must start
+		with a '.', except the empty string, which allows paths without an
+		extension.
+
+		Args:
+			extensions (iterable): the allowed extensions (str)
+
+		Raises:
+			TypeError: if an extension is not a string
+			ValueError: if no extension is given
+		"""
+		if isinstance(extensions, str):
+			extensions = (extensions,)
+
+		unique_extensions = list()
+		index = set()
+
+		for extension in extensions:
+			if not isinstance(extension, str):
+				raise TypeError("The extensions must be strings.")
+
+			if extension not in index:
+				index.add(extension)
+				unique_extensions.append(extension)
+
+		if len(unique_extensions) == 0:
+			raise ValueError("At least one extension must be given.")
+
+		self._extensions = tuple(unique_extensions)
+		self._index = frozenset(index)
+
+	def __contains__(self, extension):
+		return extension in self._index
+
+	def __eq__(self, other):
+		if not isinstance(other, self.__class__):
+			return False
+
+		return self._extensions == other._extensions
+
+	def __hash__(self):
+		return hash(self._extensions)
+
+	def __iter__(self):
+		return iter(self._extensions)
+
+	def __len__(self):
+		return len(self._extensions)
+
+	def __reduce__(self):
+		return self.__class__, (self._extensions,)
+
+	def __repr__(self):
+		return self.__class__.__name__ + "(" + repr(self._extensions) + ")"
+
+	@property
+	def default(self):
+		"""
+		This read-only property is the first extension (str) given to the
+		constructor.
+		"""
+		return self._extensions[0]
+
+	@property
+	def extensions(self):
+		"""
+		This read-only property is the tuple of allowed extensions (str) in
+		the order in which they were given.
+		"""
+		return self._extensions
+
+	def to_quoted_list(self):
+		"""
+		Makes a string listing the allowed extensions between quotes and
+		separated by commas, for instance "'.pdf', '.tar.gz'". It is meant for
+		messages.
+
+		Returns:
+			str: the list of allowed extensions
+		"""
+		return ", ".join("'" + extension + "'"
+			for extension in self._extensions)
+
+
+def extension_matches(path_exten, expected):
+	"""
+	Indicates whether a path's extension is the expected extension or one of
+	the allowed extensions.
+
+	Args:
+		path_exten (str): a path's extension
+		expected (str or ExtensionSet): the expected extension or the allowed
+			extensions
+
+	Returns:
+		bool: True if path_exten matches expected, False otherwise
+	"""
+	if isinstance(expected, str):
+		return path_exten == expected
+
+	return path_exten in expected
+
+
+def repr_expected_extension(expected):
+	"""
+	Makes the representation of an expected extension used in the __repr__
+	methods of Jazal's classes. A string is put between single quotes, while
+	an ExtensionSet gives its own representation.
+
+	Args:
+		expected (str or ExtensionSet): the expected extension or the allowed
+			extensions
+
+	Returns:
+		str: the representation of expected
+	"""
+	if isinstance(expected, str):
+		return "'" + expected + "'"
+
+	return repr(expected)
+
+
+def to_expected_extension(extension):
+	"""
+	Converts the value of an extension argument to the form stored by
+	Jazal's classes. A string is kept as it is, while any other collection of
+	strings is converted to an ExtensionSet.
+
+	Args:
+		extension (str, ExtensionSet or iterable): an extension or a
+			collection of allowed extensions
+
+	Returns:
+		str or ExtensionSet: the expected extension or the allowed extensions
+
+	Raises:
+		TypeError: if an allowed extension is not a string
+		ValueError: if the collection is empty
+	"""
+	if isinstance(extension, (str, ExtensionSet)):
+		return extension
+
+	return ExtensionSet(extension)
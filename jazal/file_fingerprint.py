@@ -0,0 +1,205 @@
+from collections import OrderedDict
+from hashlib import blake2b
+from os import fstat, stat
+from threading import Lock, local
+
+
+__all__ = [
+	"FingerprintCache",
+	"hash_file"
+]
+
+
+_DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+class FingerprintCache:
+	"""
+	This class computes fingerprints of files: BLAKE2b digests of their
+	content. The files are read in chunks of chunk_size bytes into a buffer
+	that each thread reuses, so that no memory is allocated per chunk.
+
+	The digests are kept in a cache whose key is the file's device, inode,
+	size and modification time in nanoseconds. The fingerprint of a file that
+	did not change since it was hashed is thus provided after a single
+	os.stat call. A digest is not kept if the file was modified while it was
+	read. At most max_files digests are kept. When a new digest must be
+	kept, the least recently used one is discarded. An instance can be shared
+	by many threads.
+	"""
+
+	def __init__(self, max_files=4096, chunk_size=_DEFAULT_CHUNK_SIZE,
+			digest_size=32):
+		"""
+		The constructor sets the size of the cache, the size of the chunks
+		read and the size of the digests.
+
+		Args:
+			max_files (int): the maximum number of digests kept. Defaults to
+				4096.
+			chunk_size (int): the number of bytes read at once. Defaults to
+				1 MiB.
+			digest_size (int): the size of the digests in bytes, between 1
+				and 64. Defaults to 32.
+
+		Raises:
+			ValueError: if max_files or chunk_size is smaller than 1 or if
+				digest_size is not between 1 and 64
+		"""
+		if max_files < 1:
+			raise ValueError(
+				"The maximum number of files must be at least 1.")
+
+		if chunk_size < 1:
+			raise ValueError("The chunk size must be at least 1.")
+
+		if not 1 <= digest_size <= 64:
+			raise ValueError("The digest size must be between 1 and 64.")
+
+		self._max_files = max_files
+		self._chunk_size = chunk_size
+		self._digest_size = digest_size
+		self._digests = OrderedDict()
+		self._lock = Lock()
+		self._hash_count = 0
+		self._thread_data = local()
+
+	def __len__(self):
+		return len(self._digests)
+
+	@property
+	def chunk_size(self):
+		"""
+		This read-only property is the number (int) of bytes read at once.
+		"""
+		return self._chunk_size
+
+	def clear(self):
+		"""
+		Discards all the digests.
+		"""
+		with self._lock:
+			self._digests.clear()
+
+	@property
+	def digest_size(self):
+		"""
+		This read-only property is the size (int) of the digests in bytes.
+		"""
+		return self._digest_size
+
+	def fingerprint(self, path):
+		"""
+		Provides the fingerprint of a file. The file is read only if its
+		digest is not in the cache or if the file changed since it was
+		hashed.
+
+		Args:
+			path (pathlib.Path or str): the path to a file
+
+		Returns:
+			bytes: the BLAKE2b digest of the file's content
+
+		Raises:
+			OSError: if the file cannot be reached or read, for instance
+				FileNotFoundError if it does not exist
+		"""
+		key = _make_key(stat(path))
+
+		with self._lock:
+			digest = self._digests.get(key)
+
+			if digest is not None:
+				self._digests.move_to_end(key)
+				return digest
+
+		with open(path, mode="rb", buffering=0) as file:
+			digest = hash_file(file, self._get_buffer(), self._digest_size)
+			unchanged = _make_key(fstat(file.fileno())) == key
+
+		with self._lock:
+			self._hash_count += 1
+
+			if unchanged:
+				self._digests[key] = digest
+
+				if len(self._digests) > self._max_files:
+					self._digests.popitem(last=False)
+
+		return digest
+
+	@property
+	def hash_count(self):
+		"""
+		This read-only property is the number (int) of files read and hashed
+		since this object was created.
+		"""
+		return self._hash_count
+
+	@property
+	def max_files(self):
+		"""
+		This read-only property is the maximum number (int) of digests kept.
+		"""
+		return self._max_files
+
+	def _get_buffer(self):
+		"""
+		Provides the current thread's read buffer, which is created when
+		first requested.
+
+		Returns:
+			bytearray: a buffer of chunk_size bytes
+		"""
+		buffer = getattr(self._thread_data, "buffer", None)
+
+		if buffer is None:
+			buffer = bytearray(self._chunk_size)
+			self._thread_data.buffer = buffer
+
+		return buffer
+
+
+def hash_file(file, buffer, digest_size=32):
+	"""
+	Computes the BLAKE2b digest of a binary file's content from its current
+	position to its end. The content is read in chunks into the given buffer.
+
+	Args:
+		file (io.RawIOBase or io.BufferedIOBase): a file opened in binary
+			mode
+		buffer (bytearray): the buffer to read the chunks into. Its size is
+			the chunk size.
+		digest_size (int): the size of the digest in bytes, between 1 and
+			64. Defaults to 32.
+
+	Returns:
+		bytes: the digest of the file's content
+	"""
+	hasher = blake2b(digest_size=digest_size)
+
+	with memoryview(buffer) as view:
+		while True:
+			read_count = file.readinto(view)
+
+			if not read_count:
+				break
+
+			hasher.update(view[:read_count])
+
+	return hasher.digest()
+
+
+def _make_key(stat_result):
+	"""
+	Makes the key that identifies a version of a file in the cache.
+
+	Args:
+		stat_result (os.stat_result): the file's status
+
+	Returns:
+		tuple: the file's device, inode, size and modification time in
+			nanoseconds
+	"""
+	return (stat_result.st_dev, stat_result.st_ino, stat_result.st_size,
+		stat_result.st_mtime_ns)
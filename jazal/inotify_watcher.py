@@ -0,0 +1,355 @@
+from ctypes import\
+	CDLL,\
+	c_char_p,\
+	c_int,\
+	c_uint32,\
+	get_errno
+from ctypes.util import find_library
+from os import\
+	close,\
+	fsencode,\
+	pipe,\
+	read,\
+	strerror,\
+	write
+from select import select
+from struct import Struct
+from sys import platform
+from threading import Lock, Thread
+from .directory_index import DirectoryIndex
+
+
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+_IN_ATTRIB = 0x00000004
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+
+_WATCH_MASK = _IN_ATTRIB | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF\
+	| _IN_MOVED_FROM | _IN_MOVED_TO | _IN_MOVE_SELF | _IN_ONLYDIR
+
+_EVENT_HEADER = Struct("iIII")
+_READ_SIZE = 65536
+
+_libc = None
+
+
+class InotifyWatcher:
+	"""
+	This class monitors directories with Linux's inotify interface, accessed
+	through ctypes. A thread reads the events and, each time a directory's
+	content changes, calls a function with the path of that directory. If the
+	kernel's event queue overflows, the function is called with None because
+	any watched directory may have changed.
+
+	The monitored changes are the creation, the deletion and the renaming of
+	entries, changes of their metadata and the deletion or the renaming of
+	the watched directory itself. A directory is watched under the path
+	given to method watch. Several paths to the same directory can be
+	watched.
+
+	This class can be used as a context manager. Leaving the context calls
+	method close.
+	"""
+
+	def __init__(self, on_change):
+		"""
+		The constructor opens an inotify instance and starts the thread that
+		reads its events.
+
+		Args:
+			on_change (callable): a function called in the reading thread with
+				the path (str) of a directory whose content changed or None if
+				events were lost
+
+		Raises:
+			OSError: if inotify is not available
+		"""
+		libc = _load_libc()
+		fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+
+		if fd < 0:
+			_raise_errno()
+
+		self._libc = libc
+		self._fd = fd
+		self._on_change = on_change
+		self._lock = Lock()
+		self._dir_keys = dict()
+		self._watch_descs = dict()
+		self._stop_read, self._stop_write = pipe()
+		self._closed = False
+		self._thread = Thread(target=self._read_events,
+			name="InotifyWatcher", daemon=True)
+		self._thread.start()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+	def close(self):
+		"""
+		Stops the reading thread and closes the inotify instance. Calling this
+		method more than once has no effect.
+		"""
+		with self._lock:
+			if self._closed:
+				return
+
+			self._closed = True
+
+		write(self._stop_write, b"\0")
+		self._thread.join()
+		close(self._fd)
+		close(self._stop_read)
+		close(self._stop_write)
+
+	def is_watched(self, dir_path):
+		"""
+		Indicates whether a directory path is watched.
+
+		Args:
+			dir_path (pathlib.Path or str): a directory path
+
+		Returns:
+			bool: True if dir_path is watched, False otherwise
+		"""
+		with self._lock:
+			return str(dir_path) in self._watch_descs
+
+	def unwatch(self, dir_path):
+		"""
+		Stops watching a directory path. If it is not watched, this method
+		does nothing.
+
+		Args:
+			dir_path (pathlib.Path or str): a directory path
+		"""
+		dir_key = str(dir_path)
+
+		with self._lock:
+			watch_desc = self._watch_descs.pop(dir_key, None)
+
+			if watch_desc is None:
+				return
+
+			dir_keys = self._dir_keys.get(watch_desc)
+			dir_keys.discard(dir_key)
+
+			if len(dir_keys) == 0:
+				del self._dir_keys[watch_desc]
+				self._libc.inotify_rm_watch(self._fd, watch_desc)
+
+	def watch(self, dir_path):
+		"""
+		Starts watching a directory path.
+
+		Args:
+			dir_path (pathlib.Path or str): a directory path
+
+		Returns:
+			bool: True if the directory is watched, False if it does not
+				exist, is not a directory or cannot be watched
+		"""
+		dir_key = str(dir_path)
+
+		with self._lock:
+			if dir_key in self._watch_descs:
+				return True
+
+			watch_desc = self._libc.inotify_add_watch(
+				self._fd, fsencode(dir_key), _WATCH_MASK)
+
+			if watch_desc < 0:
+				return False
+
+			self._watch_descs[dir_key] = watch_desc
+			self._dir_keys.setdefault(watch_desc, set()).add(dir_key)
+
+		return True
+
+	@property
+	def watched_count(self):
+		"""
+		This read-only property is the number (int) of watched directory
+		paths.
+		"""
+		with self._lock:
+			return len(self._watch_descs)
+
+	def _handle_event(self, watch_desc, mask):
+		"""
+		Calls on_change for each path of the directory concerned by an event.
+
+		Args:
+			watch_desc (int): the watch descriptor of the event
+			mask (int): the event's mask
+		"""
+		if mask & _IN_Q_OVERFLOW:
+			self._on_change(None)
+			return
+
+		with self._lock:
+			dir_keys = tuple(self._dir_keys.get(watch_desc, ()))
+
+			if mask & _IN_IGNORED:
+				# The kernel removed the watch, for instance because the
+				# directory was deleted.
+				self._dir_keys.pop(watch_desc, None)
+
+				for dir_key in dir_keys:
+					self._watch_descs.pop(dir_key, None)
+
+		for dir_key in dir_keys:
+			self._on_change(dir_key)
+
+	def _read_events(self):
+		"""
+		Reads inotify events until method close is called. This method runs
+		in the reading thread.
+		"""
+		while True:
+			readable, _, _ = select((self._fd, self._stop_read), (), ())
+
+			if self._stop_read in readable:
+				return
+
+			try:
+				data = read(self._fd, _READ_SIZE)
+
+			except BlockingIOError:
+				continue
+
+			offset = 0
+
+			while offset < len(data):
+				watch_desc, mask, _, name_length =\
+					_EVENT_HEADER.unpack_from(data, offset)
+				offset += _EVENT_HEADER.size + name_length
+				self._handle_event(watch_desc, mask)
+
+
+class WatchedDirectoryIndex(DirectoryIndex):
+	"""
+	This subclass of DirectoryIndex keeps directory listings until an
+	InotifyWatcher reports that the directory changed. Since listings are
+	never revalidated by the index itself, a query about a listed directory
+	is a dictionary lookup without any system call. A directory is watched
+	before it is listed so that no change is missed. Listings of directories
+	that cannot be watched, such as inexistent ones, are not kept.
+
+	A change becomes visible once the watcher's thread has processed the
+	event, which takes a short time after the change happens. Renaming an
+	ancestor of a listed directory is not detected. This class can be used as
+	a context manager. Leaving the context calls method close.
+	"""
+
+	def __init__(self, max_dirs=1024):
+		"""
+		The constructor creates the InotifyWatcher used by this index.
+
+		Args:
+			max_dirs (int): the maximum number of directory listings kept.
+				Defaults to 1024.
+
+		Raises:
+			OSError: if inotify is not available
+			ValueError: if max_dirs is smaller than 1
+		"""
+		DirectoryIndex.__init__(self, max_dirs, None)
+		self._watcher = InotifyWatcher(self._handle_change)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+	def close(self):
+		"""
+		Stops watching the directories and discards all listings.
+		"""
+		self._watcher.close()
+
+		with self._lock:
+			self._listings.clear()
+			self._invalidation_count += 1
+
+	@property
+	def watcher(self):
+		"""
+		This read-only property is the InotifyWatcher used by this index.
+		"""
+		return self._watcher
+
+	def _handle_change(self, dir_key):
+		"""
+		Discards the listing of a changed directory or all listings if dir_key
+		is None, and stops watching the directories whose listing is
+		discarded.
+
+		Args:
+			dir_key (str): the path of the directory that changed or None
+		"""
+		if dir_key is None:
+			self.clear()
+
+		else:
+			self._forget(dir_key)
+			self._watcher.unwatch(dir_key)
+
+	def _on_discard(self, dir_key):
+		self._watcher.unwatch(dir_key)
+
+	def _on_scan(self, dir_key):
+		return self._watcher.watch(dir_key)
+
+
+def _load_libc():
+	"""
+	Loads the C library and declares the signatures of the inotify functions.
+
+	Returns:
+		ctypes.CDLL: the C library
+
+	Raises:
+		OSError: if inotify is not available
+	"""
+	global _libc
+
+	if _libc is not None:
+		return _libc
+
+	if not platform.startswith("linux"):
+		raise OSError("inotify is only available on Linux.")
+
+	libc = CDLL(find_library("c") or "libc.so.6", use_errno=True)
+	libc.inotify_init1.argtypes = (c_int,)
+	libc.inotify_init1.restype = c_int
+	libc.inotify_add_watch.argtypes = (c_int, c_char_p, c_uint32)
+	libc.inotify_add_watch.restype = c_int
+	libc.inotify_rm_watch.argtypes = (c_int, c_int)
+	libc.inotify_rm_watch.restype = c_int
+	_libc = libc
+	return libc
+
+
+def _raise_errno():
+	"""
+	Raises an OSError matching the C library's errno.
+
+	Raises:
+		OSError: always
+	"""
+	errno = get_errno()
+	raise OSError(errno, strerror(errno))
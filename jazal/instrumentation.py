@@ -0,0 +1,388 @@
+from collections import OrderedDict
+from os.path import ismount
+from threading import Lock
+from time import perf_counter_ns
+from .path_checker import PathChecker
+
+
+__all__ = [
+	"CheckInstrument",
+	"disable_instrumentation",
+	"enable_instrumentation",
+	"get_instrumentation"
+]
+
+
+_BUCKET_COUNT = 64
+_MAX_MOUNT_POINT_DIRS = 4096
+
+
+class CheckInstrument:
+	"""
+	This class measures the file system queries of PathChecker and
+	ReactivePathChecker: methods path_exists, path_is_dir, path_is_file and
+	the check methods of ReactivePathChecker. Once it is enabled by function
+	enable_instrumentation, it counts the calls to each of these operations,
+	counts the system calls that they make and records their latency in
+	histograms per operation and per mount point. It also calls the functions
+	registered with method add_callback after each measured call.
+
+	The system calls are the os.stat calls made by the checkers themselves,
+	either directly or to take a snapshot, and the system calls reported by
+	the property syscall_count of a lookup object such as a DirFdLookup or a
+	NegativeLookupCache. For a lookup object without that property, such as
+	a DirectoryIndex, the directory scans reported by its property
+	scan_count are counted. They are attributed to path_exists, path_is_dir and path_is_file, including
+	when a check method calls them, so that they are not counted twice.
+
+	The latency histograms have one bucket per power of 2: bucket i counts
+	the calls that lasted less than 2**i nanoseconds and at least
+	2**(i - 1) nanoseconds.
+
+	The measurements are protected by a lock, so one instrument can record
+	the queries of several threads. The file system is never queried while
+	the lock is held. The mount points of the last 4096 directories are
+	remembered.
+	"""
+
+	__slots__ = ("_call_counts", "_callbacks", "_histograms", "_lock",
+		"_mount_points", "_syscall_counts")
+
+	def __init__(self):
+		self._call_counts = dict()
+		self._callbacks = list()
+		self._histograms = dict()
+		self._lock = Lock()
+		self._mount_points = OrderedDict()
+		self._syscall_counts = dict()
+
+	def add_callback(self, callback):
+		"""
+		Registers a function to call after each measured call. The function
+		receives the operation's name (str), the checker, the call's duration
+		in nanoseconds (int), the number of system calls that it made (int)
+		and the mount point (pathlib.Path) of the checked path.
+
+		Args:
+			callback (callable): the function to register
+		"""
+		with self._lock:
+			self._callbacks.append(callback)
+
+	def call_count(self, operation=None):
+		"""
+		Provides the number of measured calls to an operation.
+
+		Args:
+			operation (str): the name of an operation, such as "path_exists".
+				If it is None, the calls to all operations are counted.
+				Defaults to None.
+
+		Returns:
+			int: the number of measured calls
+		"""
+		with self._lock:
+			return _sum_counts(self._call_counts, operation)
+
+	def histogram(self, operation=None, mount_point=None):
+		"""
+		Provides a latency histogram.
+
+		Args:
+			operation (str): the name of an operation. If it is None, the
+				calls to all operations are included. Defaults to None.
+			mount_point (pathlib.Path): a mount point. If it is None, the
+				calls on all mount points are included. Defaults to None.
+
+		Returns:
+			dict: the number of calls (int) that lasted less than an upper
+				bound in nanoseconds (int) and at least half of it mapped to
+				that bound. Empty buckets are omitted.
+		"""
+		counts = [0] * _BUCKET_COUNT
+
+		with self._lock:
+			for (hist_operation, hist_mount), buckets\
+					in self._histograms.items():
+				if (operation is None or hist_operation == operation)\
+						and (mount_point is None or hist_mount == mount_point):
+					for i, count in enumerate(buckets):
+						counts[i] += count
+
+		return {1 << i: count for i, count in enumerate(counts) if count > 0}
+
+	def measure(self, operation, checker, function, counts_syscalls):
+		"""
+		Calls a function on a checker and records the call. PathChecker and
+		ReactivePathChecker call this method when this instrument is enabled.
+		If the function raises an exception, the call is recorded and the
+		exception is propagated.
+
+		Args:
+			operation (str): the name of the measured operation
+			checker (PathChecker): the checker given to function
+			function (callable): the uninstrumented implementation of the
+				operation
+			counts_syscalls (bool): True if the system calls made by function
+				must be counted, False if they are counted by another
+				operation
+
+		Returns:
+			the value returned by function
+		"""
+		snapshot = checker._snapshot
+		lookup = checker._lookup
+		snapshot_time = None
+		lookup_count = None
+
+		if counts_syscalls:
+			if snapshot is not None:
+				snapshot_time = snapshot.time
+
+			elif lookup is not None:
+				lookup_count = _get_lookup_syscall_count(lookup)
+
+		start = perf_counter_ns()
+
+		try:
+			return function(checker)
+
+		finally:
+			duration = perf_counter_ns() - start
+
+			if not counts_syscalls:
+				syscall_count = 0
+
+			elif snapshot is not None:
+				syscall_count = 0 if snapshot.time == snapshot_time else 1
+
+			elif lookup is not None:
+				syscall_count = 0 if lookup_count is None\
+					else _get_lookup_syscall_count(lookup) - lookup_count
+
+			else:
+				syscall_count = 1
+
+			self._record(operation, checker, duration, syscall_count)
+
+	def mount_points(self):
+		"""
+		Provides the mount points of the paths checked by measured calls.
+
+		Returns:
+			list: the mount points (pathlib.Path) in sorted order
+		"""
+		with self._lock:
+			return sorted({mount_point
+				for _, mount_point in self._histograms})
+
+	def operations(self):
+		"""
+		Provides the names of the operations that were measured.
+
+		Returns:
+			list: the names (str) of the operations in sorted order
+		"""
+		with self._lock:
+			return sorted(self._call_counts)
+
+	def remove_callback(self, callback):
+		"""
+		Unregisters a function given to method add_callback.
+
+		Args:
+			callback (callable): the function to unregister
+
+		Raises:
+			ValueError: if callback is not registered
+		"""
+		with self._lock:
+			try:
+				self._callbacks.remove(callback)
+
+			except ValueError:
+				raise ValueError("This callback is not registered.")
+
+	def reset(self):
+		"""
+		Discards all the measurements. The callbacks stay registered.
+		"""
+		with self._lock:
+			self._call_counts.clear()
+			self._histograms.clear()
+			self._syscall_counts.clear()
+
+	def syscall_count(self, operation=None):
+		"""
+		Provides the number of system calls made by an operation.
+
+		Args:
+			operation (str): the name of an operation. If it is None, the
+				system calls of all operations are counted. Defaults to None.
+
+		Returns:
+			int: the number of system calls
+		"""
+		with self._lock:
+			return _sum_counts(self._syscall_counts, operation)
+
+	def _find_mount_point(self, path):
+		"""
+		Finds the mount point of a path's file system. The mount point of each
+		directory is stored, so that the file system is queried only for new
+		directories. The lock is acquired only to access the stored mount
+		points, not while the file system is queried.
+
+		Args:
+			path (pathlib.Path): a path checked by a PathChecker
+
+		Returns:
+			pathlib.Path: the mount point of path's file system
+		"""
+		directory = path.absolute().parent
+		unknown_dirs = list()
+		mount_point = None
+
+		for a_dir in (directory, *directory.parents):
+			with self._lock:
+				mount_point = self._mount_points.get(a_dir)
+
+				if mount_point is not None:
+					self._mount_points.move_to_end(a_dir)
+
+			if mount_point is not None:
+				break
+
+			unknown_dirs.append(a_dir)
+
+			if ismount(a_dir):
+				mount_point = a_dir
+				break
+
+		if mount_point is None:
+			mount_point = unknown_dirs[-1]
+
+		with self._lock:
+			for a_dir in unknown_dirs:
+				self._mount_points[a_dir] = mount_point
+
+			while len(self._mount_points) > _MAX_MOUNT_POINT_DIRS:
+				self._mount_points.popitem(last=False)
+
+		return mount_point
+
+	def _record(self, operation, checker, duration, syscall_count):
+		"""
+		Records a measured call and passes it to the callbacks.
+
+		Args:
+			operation (str): the name of the measured operation
+			checker (PathChecker): the checker that performed the operation
+			duration (int): the call's duration in nanoseconds
+			syscall_count (int): the number of system calls made by the call
+		"""
+		mount_point = self._find_mount_point(checker.path)
+
+		with self._lock:
+			self._call_counts[operation]\
+				= self._call_counts.get(operation, 0) + 1
+			self._syscall_counts[operation]\
+				= self._syscall_counts.get(operation, 0) + syscall_count
+			key = (operation, mount_point)
+			buckets = self._histograms.get(key)
+
+			if buckets is None:
+				buckets = [0] * _BUCKET_COUNT
+				self._histograms[key] = buckets
+
+			buckets[min(duration.bit_length(), _BUCKET_COUNT - 1)] += 1
+			callbacks = tuple(self._callbacks)
+
+		for callback in callbacks:
+			callback(operation, checker, duration, syscall_count, mount_point)
+
+
+def disable_instrumentation():
+	"""
+	Stops the measurement of the checkers' queries. The disabled instrument
+	keeps its measurements.
+
+	Returns:
+		CheckInstrument: the instrument that was enabled or None
+	"""
+	instrument = PathChecker._instrument
+	PathChecker._instrument = None
+	return instrument
+
+
+def enable_instrumentation(instrument=None):
+	"""
+	Makes an instrument measure the queries of all PathChecker and
+	ReactivePathChecker instances. It replaces the instrument that was
+	enabled, if any.
+
+	Args:
+		instrument (CheckInstrument): the instrument to enable. If it is None,
+			a new instrument is made. Defaults to None.
+
+	Returns:
+		CheckInstrument: the enabled instrument
+
+	Raises:
+		TypeError: if instrument is not None or a CheckInstrument
+	"""
+	if instrument is None:
+		instrument = CheckInstrument()
+
+	elif not isinstance(instrument, CheckInstrument):
+		raise TypeError("The instrument must be a CheckInstrument.")
+
+	PathChecker._instrument = instrument
+	return instrument
+
+
+def get_instrumentation():
+	"""
+	Provides the enabled instrument.
+
+	Returns:
+		CheckInstrument: the enabled instrument or None if instrumentation is
+			disabled
+	"""
+	return PathChecker._instrument
+
+
+def _get_lookup_syscall_count(lookup):
+	"""
+	Provides the number of system calls that a lookup object reports.
+
+	Args:
+		lookup: the lookup object of a checker
+
+	Returns:
+		int: the value of lookup's property syscall_count or, if it has none,
+			of its property scan_count. None if lookup has neither.
+	"""
+	syscall_count = getattr(lookup, "syscall_count", None)
+
+	if syscall_count is None:
+		syscall_count = getattr(lookup, "scan_count", None)
+
+	return syscall_count
+
+
+def _sum_counts(counts, operation):
+	"""
+	Sums the counts of all operations or provides the count of one.
+
+	Args:
+		counts (dict): counts (int) mapped to operation names
+		operation (str): an operation's name or None to sum all counts
+
+	Returns:
+		int: the requested count
+	"""
+	if operation is None:
+		return sum(counts.values())
+
+	return counts.get(operation, 0)
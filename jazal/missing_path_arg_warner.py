@@ -1,3 +1,8 @@
+from .check_plan import CheckPlan
+from .extension_set import\
+	ExtensionSet,\
+	repr_expected_extension,\
+	to_expected_extension
 from .path_checker import PathChecker
 from .reactive_path_checker import ReactivePathChecker
 
@@ -12,6 +17,8 @@ class MissingPathArgWarner:
 	(property extension).
 	"""
 
+	__slots__ = ("_arg_name", "_extension")
+
 	def __init__(self, arg_name, extension):
 		"""
 		The constructor requires a path argument name and the file extension
@@ -19,13 +26,29 @@ class MissingPathArgWarner:
 
 		Args:
 			arg_name (str): the name of a path argument
-			extension (str): the extension expected from the path argument. It
-				must start with a '.'. If the path is not supposed to have an
-				extension, set this argument to an empty string.
+			extension (str, ExtensionSet or iterable): the extension expected
+				from the path argument. It must start with a '.'. If the path
+				is not supposed to have an extension, set this argument to an
+				empty string. If several extensions are allowed, give an
+				ExtensionSet or another collection of strings.
 		"""
-		self._extension = extension
+		self._extension = to_expected_extension(extension)
 		self._arg_name = arg_name
 
+	def __eq__(self, other):
+		if not isinstance(other, self.__class__):
+			return False
+
+		return self._arg_name == other._arg_name\
+			and self._extension == other._extension
+
+	def __hash__(self):
+		return hash((self._arg_name, self._extension))
+
+	def __repr__(self):
+		return self.__class__.__name__ + "('" + self._arg_name + "', "\
+			+ repr_expected_extension(self._extension) + ")"
+
 	@property
 	def arg_name(self):
 		"""
@@ -39,10 +62,33 @@ class MissingPathArgWarner:
 		"""
 		This read-only property is the extension (str) that the path argument
 		is supposed to have. If that path is not supposed to have an extension,
-		this property is an empty string.
+		this property is an empty string. If several extensions are allowed,
+		this property is an ExtensionSet.
 		"""
 		return self._extension
 
+	def make_check_plan(self, must_exist=True, must_be_dir=False,
+			must_be_file=False):
+		"""
+		Creates a CheckPlan with properties arg_name and extension and the
+		given requirements about the path's existence and type.
+
+		Args:
+			must_exist (bool): True if the path must exist. Defaults to True.
+			must_be_dir (bool): True if the path must point to a directory.
+				Defaults to False.
+			must_be_file (bool): True if the path must point to a file.
+				Defaults to False.
+
+		Returns:
+			CheckPlan: a plan able to verify any value of the path argument
+
+		Raises:
+			ValueError: if must_be_dir and must_be_file are both True
+		"""
+		return CheckPlan(self._arg_name, self._extension,
+			must_exist, must_be_dir, must_be_file)
+
 	def make_missing_arg_msg(self):
 		"""
 		The message created by this method tells that the argument named
@@ -52,6 +98,11 @@ class MissingPathArgWarner:
 		Returns:
 			str: a message telling that the argument is needed
 		"""
+		if isinstance(self._extension, ExtensionSet):
+			return self._arg_name + ": the path to a file with one of the "\
+				+ "extensions " + self._extension.to_quoted_list()\
+				+ " must be provided."
+
 		return self._arg_name + ": the path to a file with extension '"\
 			+ self._extension + "' must be provided."
 
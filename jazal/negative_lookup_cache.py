@@ -0,0 +1,484 @@
+from collections import OrderedDict
+from os import sep
+from pathlib import Path
+from stat import S_ISDIR, S_ISREG
+from threading import Lock
+from time import monotonic
+from .path_util import stat_or_none
+
+
+# The states of the paths in the cache. A path is _MISSING if it does not
+# exist, _NOT_A_DIR if it exists and is not a directory and _IS_DIR if it is
+# a directory. The descendants of a _MISSING or _NOT_A_DIR path do not exist.
+_MISSING = 0
+_NOT_A_DIR = 1
+_IS_DIR = 2
+
+
+class NegativeLookupCache:
+	"""
+	This class answers whether paths exist and whether they point to
+	directories or files while remembering the paths that do not exist and
+	the paths that are not directories. Once a directory is known not to
+	exist or not to be a directory, the queries on all the paths that it
+	would contain are answered without any system call.
+
+	When a queried path does not exist, its ancestors are verified from the
+	parent up to the first one that is a directory, so that the highest
+	missing ancestor of a missing subtree is known after the first query in
+	that subtree. The directories found are remembered too, so that the
+	queries on other missing paths in them do not verify them again. When a
+	queried path exists, its parent is remembered as a directory, so that
+	the queries on its siblings look up a single ancestor.
+
+	Each result is kept for ttl seconds. At most max_entries results are
+	kept. When a new result must be kept, the least recently used one is
+	discarded. Since the results can become outdated before they expire,
+	method invalidate should be called on a path after it is created or
+	deleted.
+
+	The queries that the cache cannot answer are made with os.stat or, if a
+	lookup object is given to the constructor, with that object's methods.
+	Properties hit_count and miss_count tell how many queries were answered
+	from the cache and how many needed the file system, and property
+	syscall_count tells how many system calls they made.
+
+	A PathChecker uses an instance of this class if it is given to method
+	PathChecker.set_lookup. An instance can be shared by many checkers and by
+	many threads.
+	"""
+
+	def __init__(self, lookup=None, max_entries=4096, ttl=1.0):
+		"""
+		The constructor sets the size of the cache, the lifetime of its
+		results and the object that answers the other queries.
+
+		Args:
+			lookup: an object with methods path_exists, path_is_dir and
+				path_is_file, such as a DirectoryIndex, that answers the
+				queries that the cache cannot answer. If it is None, they are
+				answered with os.stat. Defaults to None.
+			max_entries (int): the maximum number of results kept. Defaults
+				to 4096.
+			ttl (float): the number of seconds for which a result is kept. If
+				it is None, results are kept until they are discarded because
+				of the cache's size or by methods clear and invalidate.
+				Defaults to 1.0.
+
+		Raises:
+			ValueError: if max_entries is smaller than 1 or ttl is negative
+		"""
+		if max_entries < 1:
+			raise ValueError(
+				"The maximum number of entries must be at least 1.")
+
+		if ttl is not None and ttl < 0:
+			raise ValueError("The time to live cannot be negative.")
+
+		self._lookup = lookup
+		self._max_entries = max_entries
+		self._ttl = ttl
+		self._entries = OrderedDict()
+		self._lock = Lock()
+		self._hit_count = 0
+		self._miss_count = 0
+		self._syscall_count = 0
+
+	def __len__(self):
+		return len(self._entries)
+
+	def clear(self):
+		"""
+		Discards all the results. The counters are not reset.
+		"""
+		with self._lock:
+			self._entries.clear()
+
+	@property
+	def hit_count(self):
+		"""
+		This read-only property is the number (int) of queries answered from
+		the cache since this object was created.
+		"""
+		return self._hit_count
+
+	def invalidate(self, path):
+		"""
+		Discards the results about a path, its ancestors and its descendants.
+		This method should be called after the path is created or deleted.
+
+		Args:
+			path (pathlib.Path or str): the path whose results must be
+				discarded
+		"""
+		path_key = str(path)
+		prefix = path_key.rstrip(sep) + sep
+
+		with self._lock:
+			outdated_keys = [key for key in self._entries
+				if key == path_key or key.startswith(prefix)
+				or path_key.startswith(key.rstrip(sep) + sep)]
+
+			for key in outdated_keys:
+				del self._entries[key]
+
+	@property
+	def lookup(self):
+		"""
+		This read-only property is the object that answers the queries that
+		the cache cannot answer or None if they are answered with os.stat.
+		"""
+		return self._lookup
+
+	@property
+	def max_entries(self):
+		"""
+		This read-only property is the maximum number (int) of results kept.
+		"""
+		return self._max_entries
+
+	@property
+	def miss_count(self):
+		"""
+		This read-only property is the number (int) of queries that the cache
+		could not answer since this object was created.
+		"""
+		return self._miss_count
+
+	def path_exists(self, path):
+		"""
+		Indicates whether a path points to an existent directory or file.
+
+		Args:
+			path (pathlib.Path): the path to check
+
+		Returns:
+			bool: True if path exists, False otherwise
+		"""
+		if self._is_known_missing(path):
+			return False
+
+		if self._lookup is not None:
+			exists = self._lookup.path_exists(path)
+
+			if exists:
+				self._learn_existing(path, None)
+
+			else:
+				self._learn_missing(path)
+
+			return exists
+
+		return self._stat(path) is not None
+
+	def path_is_dir(self, path):
+		"""
+		Indicates whether a path points to a directory.
+
+		Args:
+			path (pathlib.Path): the path to check
+
+		Returns:
+			bool: True if path exists and is a directory, False otherwise
+		"""
+		if self._is_known_missing(path, True):
+			return False
+
+		if self._lookup is not None:
+			is_dir = self._lookup.path_is_dir(path)
+
+			if is_dir:
+				self._learn_existing(path, _IS_DIR)
+
+			return is_dir
+
+		stat_result = self._stat(path)
+		return stat_result is not None and S_ISDIR(stat_result.st_mode)
+
+	def path_is_file(self, path):
+		"""
+		Indicates whether a path points to a file.
+
+		Args:
+			path (pathlib.Path): the path to check
+
+		Returns:
+			bool: True if path exists and is a file, False otherwise
+		"""
+		if self._is_known_missing(path):
+			return False
+
+		if self._lookup is not None:
+			is_file = self._lookup.path_is_file(path)
+
+			if is_file:
+				self._learn_existing(path, _NOT_A_DIR)
+
+			return is_file
+
+		stat_result = self._stat(path)
+		return stat_result is not None and S_ISREG(stat_result.st_mode)
+
+	@property
+	def syscall_count(self):
+		"""
+		This read-only property is the number (int) of system calls made to
+		answer the queries since this object was created: the os.stat calls
+		made by this cache and the calls reported by the lookup object's
+		property syscall_count or, if it has none, scan_count. The os.stat
+		calls are counted without a lock, so the count can miss calls made
+		by threads that query this object at the same time.
+		"""
+		lookup_count = getattr(self._lookup, "syscall_count", None)
+
+		if lookup_count is None:
+			lookup_count = getattr(self._lookup, "scan_count", 0)
+
+		return self._syscall_count + lookup_count
+
+	@property
+	def ttl(self):
+		"""
+		This read-only property is the number of seconds (float) for which a
+		result is kept or None if results do not expire.
+		"""
+		return self._ttl
+
+	def _get_state(self, key, now):
+		"""
+		Provides the state of a path in the cache and discards it if it
+		expired. The lock must be acquired by the caller.
+
+		Args:
+			key (str): the path
+			now (float): the current time given by time.monotonic
+
+		Returns:
+			int: the path's state or None if it is unknown
+		"""
+		entry = self._entries.get(key)
+
+		if entry is None:
+			return None
+
+		state, expiry = entry
+
+		if expiry is not None and now >= expiry:
+			del self._entries[key]
+			return None
+
+		self._entries.move_to_end(key)
+		return state
+
+	def _is_known_missing(self, path, not_a_dir_suffices=False):
+		"""
+		Indicates whether the cache knows that a path does not exist because
+		it or one of its ancestors is missing or one of its ancestors is not
+		a directory. If the path's state is known, its ancestors are not
+		looked up. Otherwise, they are looked up from the parent to the first
+		one whose state is known. The hit or miss is counted.
+
+		Args:
+			path (pathlib.Path): the queried path
+			not_a_dir_suffices (bool): True if knowing that path is not a
+				directory suffices, False otherwise. Defaults to False.
+
+		Returns:
+			bool: True if path is known not to exist, False otherwise
+		"""
+		path_key = str(path)
+		now = monotonic()
+
+		with self._lock:
+			state = self._get_state(path_key, now)
+
+			if state is None:
+				known_missing = False
+
+				for key in _iter_ancestor_keys(path_key, len(path.anchor)):
+					state = self._get_state(key, now)
+
+					if state is not None:
+						known_missing = state != _IS_DIR
+						break
+
+			else:
+				known_missing = state == _MISSING\
+					or (not_a_dir_suffices and state == _NOT_A_DIR)
+
+			if known_missing:
+				self._hit_count += 1
+
+			else:
+				self._miss_count += 1
+
+			return known_missing
+
+	def _learn_existing(self, path, state):
+		"""
+		Records the state of a path that exists and that its parent is a
+		directory.
+
+		Args:
+			path (pathlib.Path): a path that exists
+			state (int): the path's state or None if it is unknown
+		"""
+		path_key = str(path)
+		parent_key = _get_parent_key(path_key, len(path.anchor))
+		now = monotonic()
+
+		with self._lock:
+			if parent_key is not None:
+				self._store(parent_key, _IS_DIR, now)
+
+			if state is not None:
+				self._store(path_key, state, now)
+
+	def _learn_missing(self, path):
+		"""
+		Records that a path does not exist and verifies its ancestors up to
+		the first one that is known or found to be a directory.
+
+		Args:
+			path (pathlib.Path): a path that does not exist
+		"""
+		path_key = str(path)
+		now = monotonic()
+		self._put(path_key, _MISSING, now)
+
+		for key in _iter_ancestor_keys(path_key, len(path.anchor)):
+			with self._lock:
+				state = self._get_state(key, now)
+
+			if state is not None:
+				break
+
+			if self._lookup is not None:
+				state = _IS_DIR if self._lookup.path_is_dir(Path(key))\
+					else _NOT_A_DIR
+
+			else:
+				self._syscall_count += 1
+				state = _get_stat_state(stat_or_none(key))
+
+			self._put(key, state, now)
+
+			if state == _IS_DIR:
+				break
+
+	def _put(self, key, state, now):
+		"""
+		Records the state of a path and discards the least recently used
+		results beyond max_entries.
+
+		Args:
+			key (str): the path
+			state (int): the path's state
+			now (float): the current time given by time.monotonic
+		"""
+		with self._lock:
+			self._store(key, state, now)
+
+	def _store(self, key, state, now):
+		"""
+		Records the state of a path and discards the least recently used
+		results beyond max_entries. The lock must be acquired by the caller.
+
+		Args:
+			key (str): the path
+			state (int): the path's state
+			now (float): the current time given by time.monotonic
+		"""
+		self._entries[key] = (state, None if self._ttl is None
+			else now + self._ttl)
+		self._entries.move_to_end(key)
+
+		while len(self._entries) > self._max_entries:
+			self._entries.popitem(last=False)
+
+	def _stat(self, path):
+		"""
+		Calls os.stat on a path and records the result.
+
+		Args:
+			path (pathlib.Path): the path to stat
+
+		Returns:
+			os.stat_result: path's status or None if path does not exist
+		"""
+		self._syscall_count += 1
+		stat_result = stat_or_none(path)
+
+		if stat_result is None:
+			self._learn_missing(path)
+
+		else:
+			self._learn_existing(path, _get_stat_state(stat_result))
+
+		return stat_result
+
+
+def _get_stat_state(stat_result):
+	"""
+	Provides the state of a path given by its status.
+
+	Args:
+		stat_result (os.stat_result): the path's status or None if the path
+			does not exist
+
+	Returns:
+		int: _MISSING, _NOT_A_DIR or _IS_DIR
+	"""
+	if stat_result is None:
+		return _MISSING
+
+	return _IS_DIR if S_ISDIR(stat_result.st_mode) else _NOT_A_DIR
+
+
+def _get_parent_key(path_key, anchor_length):
+	"""
+	Provides the parent of a path that the cache can reason about by
+	slicing the path's string. A path named '..' and a parent named '..'
+	are not reasoned about because the path's parent is not determined by
+	its name. The anchor, such as the root directory, and the working
+	directory, which is the parent of a relative path's first name, are
+	not reasoned about either.
+
+	Args:
+		path_key (str): the string of a pathlib.Path
+		anchor_length (int): the length of the path's anchor
+
+	Returns:
+		str: the string of the path's parent, which is equal to that of the
+			pathlib.Path object in property parent, or None
+	"""
+	end = path_key.rfind(sep)
+
+	if end <= 0 or end < anchor_length or path_key[end + 1:] == "..":
+		return None
+
+	parent_key = path_key[:end]
+
+	if parent_key[parent_key.rfind(sep) + 1:] == "..":
+		return None
+
+	return parent_key
+
+
+def _iter_ancestor_keys(path_key, anchor_length):
+	"""
+	Generates the ancestors of a path that the cache can reason about, from
+	the parent to the root, with function _get_parent_key.
+
+	Args:
+		path_key (str): the string of a pathlib.Path
+		anchor_length (int): the length of the path's anchor
+
+	Returns:
+		generator: the strings of the ancestors of the path
+	"""
+	key = _get_parent_key(path_key, anchor_length)
+
+	while key is not None:
+		yield key
+		key = _get_parent_key(key, anchor_length)
@@ -0,0 +1,99 @@
+from .str_path_util import split_name
+
+
+class ParsedPath:
+	"""
+	This immutable class holds a pathlib.Path object (property path) and the
+	parts of it that Jazal uses: the file name, the suffixes, the extension,
+	the stem and the parent directory. The name, the extension and the stem
+	are computed once, when the object is created. The suffixes and the
+	parent are computed once, when they are first requested.
+
+	As in module path_util, an extension is the concatenation of the
+	suffixes and a stem is a file name without the extension. The functions
+	of module path_util accept a ParsedPath wherever they accept a
+	pathlib.Path and then reuse its parts instead of computing them again.
+	"""
+
+	__slots__ = (
+		"_extension", "_name", "_parent", "_path", "_stem", "_suffixes")
+
+	def __init__(self, path):
+		"""
+		The constructor parses the given path.
+
+		Args:
+			path (pathlib.Path): the path to parse
+		"""
+		self._path = path
+		self._name = path.name
+		self._stem, self._extension = split_name(self._name)
+		self._parent = None
+		self._suffixes = None
+
+	def __eq__(self, other):
+		if not isinstance(other, self.__class__):
+			return False
+
+		return self._path == other._path
+
+	def __hash__(self):
+		return hash(self._path)
+
+	def __repr__(self):
+		return self.__class__.__name__ + "('" + str(self._path) + "')"
+
+	@property
+	def extension(self):
+		"""
+		This read-only property is the extension (str) of path. If path has no
+		extension, this property is an empty string.
+		"""
+		return self._extension
+
+	@property
+	def name(self):
+		"""
+		This read-only property is the name (str) of the file that path points
+		to.
+		"""
+		return self._name
+
+	@property
+	def parent(self):
+		"""
+		This read-only property is the path (pathlib.Path) of the directory
+		containing path.
+		"""
+		if self._parent is None:
+			self._parent = self._path.parent
+
+		return self._parent
+
+	@property
+	def path(self):
+		"""
+		This read-only property is the parsed path (pathlib.Path).
+		"""
+		return self._path
+
+	@property
+	def stem(self):
+		"""
+		This read-only property is the stem (str) of the file that path points
+		to, that is its name without the extension.
+		"""
+		return self._stem
+
+	@property
+	def suffixes(self):
+		"""
+		This read-only property is the tuple of suffixes (str) that make
+		path's extension. They are identical to pathlib.Path.suffixes.
+		"""
+		if self._suffixes is None:
+			self._suffixes = () if len(self._extension) == 0\
+				else tuple("." + suffix
+				for suffix in self._extension[1:].split("."))
+
+		return self._suffixes
@@ -1,7 +1,27 @@
 from pathlib import Path
-from .path_util import\
-	extension_to_str,\
-	get_file_stem
+from stat import S_ISDIR, S_ISREG
+from time import monotonic
+from .extension_set import\
+	extension_matches,\
+	repr_expected_extension,\
+	to_expected_extension
+from .parsed_path import ParsedPath
+from .path_util import stat_or_none
+
+
+# The cache used by PathChecker.content_is_correct if no cache is given. It
+# is created when it is first needed, so that importing this module does not
+# import module content_signature.
+_default_content_cache = None
+
+# The cache used by PathChecker.get_fingerprint if no cache is given. It is
+# created when it is first needed, so that importing this module does not
+# import hashlib.
+_default_fingerprint_cache = None
+
+# The slots that PathChecker.__getstate__ does not put in the state.
+_UNPICKLED_SLOTS = ("__dict__", "__weakref__", "_lookup", "_parsed_path",
+	"_snapshot")
 
 
 class PathChecker:
@@ -9,13 +29,39 @@ class PathChecker:
 	This class contains a pathlib.Path object (property path) and the extension
 	that the path is supposed to have (property extension). PathChecker can
 	verify whether the path has the right extension, whether it exists and
-	whether it is a directory or a file.
+	whether it is a directory or a file. If the path is allowed to have one of
+	several extensions, property extension is an ExtensionSet.
 
 	In Pathlib, a file's stem is defined as its name without the extension's
 	last suffix. In this class, however, a stem is a file name without the
 	extension.
+
+	By default, each of methods path_exists, path_is_dir and path_is_file
+	queries the file system. In snapshot mode, enabled by method
+	enable_snapshot, the result of one os.stat call is kept and reused by all
+	of them until method refresh is called or the snapshot's time to live
+	expires. Outside snapshot mode, the file system queries can be delegated
+	to a lookup object, such as a DirectoryIndex, given to method set_lookup.
+
+	The file system queries of all checkers can be measured by a
+	CheckInstrument enabled by function instrumentation.enable_instrumentation.
+	While instrumentation is disabled, it costs one attribute check per query.
+
+	Instances store their attributes in slots rather than in a dictionary.
+	Subclasses that do not declare __slots__ get a dictionary as usual. When
+	an instance is pickled, for instance to be sent to a worker process, or
+	deep-copied, the copy has no lookup object and, in snapshot mode, no
+	stored os.stat result. A shallow copy made with copy.copy shares the
+	original's lookup object. The other attributes, including those of
+	subclasses, are kept.
 	"""
 
+	__slots__ = ("_extension", "_lookup", "_parsed_path", "_path", "_snapshot")
+
+	# The CheckInstrument that measures the queries of all checkers or None.
+	# It is set by module instrumentation.
+	_instrument = None
+
 	def __init__(self, a_path, extension):
 		"""
 		The constructor needs a file path and the expected extension. If a_path
@@ -26,15 +72,28 @@ class PathChecker:
 		Args:
 			a_path (pathlib.Path or str): the path that this instance will
 				check
-			extension (str): the extension that the path is supposed to have.
-				If the path is not supposed to have an extension, set this
-				argument to an empty string.
+			extension (str, ExtensionSet or iterable): the extension that the
+				path is supposed to have. If the path is not supposed to have
+				an extension, set this argument to an empty string. If several
+				extensions are allowed, give an ExtensionSet or another
+				collection of strings, which will be converted to an
+				ExtensionSet.
 
 		Raises:
 			TypeError: if a_path is not an instance of str or pathlib.Path
 		"""
-		self._extension = extension
+		self._extension = to_expected_extension(extension)
 		self._set_path(a_path)
+		self._snapshot = None
+		self._lookup = None
+		self._parsed_path = None
+
+	def __copy__(self):
+		# A copy in the same process can share the lookup object.
+		a_copy = self.__class__.__new__(self.__class__)
+		a_copy.__setstate__(self.__getstate__())
+		a_copy._lookup = self._lookup
+		return a_copy
 
 	def __eq__(self, other):
 		if not isinstance(other, self.__class__):
@@ -43,27 +102,111 @@ class PathChecker:
 		return self._path == other._path\
 			and self._extension == other._extension
 
+	def __hash__(self):
+		return hash((self._path, self._extension))
+
+	def __getstate__(self):
+		# The lookup object can hold locks and open descriptors, and it may
+		# not be valid in another process. The snapshot's os.stat result is
+		# discarded because its time is not comparable across processes. The
+		# parsed path is computed again when it is needed. Method
+		# __setstate__ restores the omitted attributes' default values.
+		state = dict()
+
+		for a_class in self.__class__.__mro__:
+			for name in a_class.__dict__.get("__slots__", ()):
+				if name not in _UNPICKLED_SLOTS and hasattr(self, name):
+					state[name] = getattr(self, name)
+
+		state.update(getattr(self, "__dict__", ()))
+
+		if self._snapshot is not None:
+			state["_snapshot"] = _StatSnapshot(self._snapshot.ttl)
+
+		return state
+
 	def __repr__(self):
-		return self.__class__.__name__ + "('" + str(self._path) + "', '"\
-			+ self._extension + "')"
+		return self.__class__.__name__ + "('" + str(self._path) + "', "\
+			+ repr_expected_extension(self._extension) + ")"
+
+	def __setstate__(self, state):
+		self._lookup = None
+		self._parsed_path = None
+		self._snapshot = None
+
+		for name, value in state.items():
+			setattr(self, name, value)
+
+	def content_is_correct(self, cache=None):
+		"""
+		Indicates whether the content of the file that path points to matches
+		the expected extension or one of the allowed extensions. Unlike
+		extension_is_correct, this method reads the first bytes of the file
+		and compares them with the signatures of module content_signature. If
+		no signature is known for the expected extension, the content is
+		considered correct.
+
+		Args:
+			cache (ContentSignatureCache): the cache of file headers to use.
+				If it is None, a cache shared by all checkers is used.
+				Defaults to None.
+
+		Returns:
+			bool: True if path points to a file whose content matches the
+				expected extension, False otherwise
+		"""
+		if cache is None:
+			cache = _get_default_content_cache()
+
+		return cache.content_matches(self._path, self._extension)
+
+	def disable_snapshot(self):
+		"""
+		Leaves snapshot mode and discards the stored os.stat result. Methods
+		path_exists, path_is_dir and path_is_file query the file system again
+		on each call.
+		"""
+		self._snapshot = None
+
+	def enable_snapshot(self, ttl=None):
+		"""
+		Enters snapshot mode. The next call to path_exists, path_is_dir or
+		path_is_file takes one os.stat result, which all three methods reuse
+		afterwards. Calling this method again discards the stored result.
+
+		Args:
+			ttl (float): the number of seconds during which a snapshot stays
+				valid. When it expires, the next query takes a new snapshot.
+				If it is None, the snapshot is kept until method refresh is
+				called. Defaults to None.
+
+		Raises:
+			ValueError: if ttl is negative
+		"""
+		if ttl is not None and ttl < 0:
+			raise ValueError("The snapshot's time to live cannot be negative.")
+
+		self._snapshot = _StatSnapshot(ttl)
 
 	@property
 	def extension(self):
 		"""
 		This read-only property is the extension (str) that path is supposed to
 		have. If path is not supposed to have an extension, this property is an
-		empty string.
+		empty string. If path is allowed to have one of several extensions,
+		this property is an ExtensionSet.
 		"""
 		return self._extension
 
 	def extension_is_correct(self):
 		"""
-		Indicates whether path's extension matches the expected extension.
+		Indicates whether path's extension matches the expected extension or
+		is one of the allowed extensions.
 
 		Returns:
 			bool: True if path has the right extension, False otherwise
 		"""
-		return extension_to_str(self._path) == self._extension
+		return extension_matches(self.parsed_path.extension, self._extension)
 
 	def get_file_name(self):
 		"""
@@ -72,7 +215,7 @@ class PathChecker:
 		Returns:
 			str: the name of the file that path points to
 		"""
-		return self._path.name
+		return self.parsed_path.name
 
 	def get_file_stem(self):
 		"""
@@ -82,7 +225,50 @@ class PathChecker:
 		Returns:
 			str: the stem of the file that path points to
 		"""
-		return get_file_stem(self._path)
+		return self.parsed_path.stem
+
+	def get_fingerprint(self, cache=None):
+		"""
+		Provides the fingerprint of the file that path points to: a BLAKE2b
+		digest of its content. The digest is kept in a cache and the file is
+		read again only if it changed.
+
+		Args:
+			cache (FingerprintCache): the cache of digests to use. If it is
+				None, a cache shared by all checkers is used. Defaults to None.
+
+		Returns:
+			bytes: the digest of the file's content
+
+		Raises:
+			OSError: if the file cannot be reached or read, for instance
+				FileNotFoundError if it does not exist
+		"""
+		if cache is None:
+			cache = _get_default_fingerprint_cache()
+
+		return cache.fingerprint(self._path)
+
+	@property
+	def lookup(self):
+		"""
+		This read-only property is the object that answers the file system
+		queries of this checker outside snapshot mode or None if this checker
+		uses pathlib.Path's methods. It is set by method set_lookup.
+		"""
+		return self._lookup
+
+	@property
+	def parsed_path(self):
+		"""
+		This read-only property is a ParsedPath made from path when it is
+		first requested. It provides path's name, suffixes, extension, stem
+		and parent without computing them again.
+		"""
+		if self._parsed_path is None:
+			self._parsed_path = ParsedPath(self._path)
+
+		return self._parsed_path
 
 	@property
 	def path(self):
@@ -99,7 +285,11 @@ class PathChecker:
 		Returns:
 			bool: True if path exists, False otherwise
 		"""
-		return self._path.exists()
+		if self._instrument is not None:
+			return self._instrument.measure(
+				"path_exists", self, PathChecker._query_exists, True)
+
+		return self._query_exists()
 
 	def path_is_dir(self):
 		"""
@@ -108,7 +298,11 @@ class PathChecker:
 		Returns:
 			bool: True if path exists and is a directory, False otherwise
 		"""
-		return self._path.is_dir()
+		if self._instrument is not None:
+			return self._instrument.measure(
+				"path_is_dir", self, PathChecker._query_is_dir, True)
+
+		return self._query_is_dir()
 
 	def path_is_file(self):
 		"""
@@ -117,6 +311,102 @@ class PathChecker:
 		Returns:
 			bool: True if path exists and is a file, False otherwise
 		"""
+		if self._instrument is not None:
+			return self._instrument.measure(
+				"path_is_file", self, PathChecker._query_is_file, True)
+
+		return self._query_is_file()
+
+	def refresh(self):
+		"""
+		In snapshot mode, replaces the stored os.stat result with a new one.
+		Outside snapshot mode, this method does nothing.
+		"""
+		if self._snapshot is not None:
+			self._snapshot.take(self._path)
+
+	def set_lookup(self, lookup):
+		"""
+		Sets the object that answers the file system queries of this checker
+		outside snapshot mode. That object must have methods path_exists,
+		path_is_dir and path_is_file, which take a pathlib.Path and return a
+		bool. The lookup object is not taken into account by __eq__.
+
+		Args:
+			lookup: an object such as a DirectoryIndex or None to make this
+				checker use pathlib.Path's methods
+		"""
+		self._lookup = lookup
+
+	@property
+	def snapshot_enabled(self):
+		"""
+		This read-only property is True if this object is in snapshot mode,
+		False otherwise.
+		"""
+		return self._snapshot is not None
+
+	def _get_snapshot(self):
+		"""
+		Provides the stored os.stat result. A new one is taken if none is
+		stored yet or if the stored one has expired.
+
+		Returns:
+			os.stat_result: path's status or None if path does not exist
+		"""
+		snapshot = self._snapshot
+
+		if snapshot.time is None or (snapshot.ttl is not None
+				and monotonic() - snapshot.time > snapshot.ttl):
+			snapshot.take(self._path)
+
+		return snapshot.stat_result
+
+	def _query_exists(self):
+		"""
+		Queries whether path exists, without instrumentation.
+
+		Returns:
+			bool: True if path exists, False otherwise
+		"""
+		if self._snapshot is not None:
+			return self._get_snapshot() is not None
+
+		if self._lookup is not None:
+			return self._lookup.path_exists(self._path)
+
+		return self._path.exists()
+
+	def _query_is_dir(self):
+		"""
+		Queries whether path is a directory, without instrumentation.
+
+		Returns:
+			bool: True if path exists and is a directory, False otherwise
+		"""
+		if self._snapshot is not None:
+			stat_result = self._get_snapshot()
+			return stat_result is not None and S_ISDIR(stat_result.st_mode)
+
+		if self._lookup is not None:
+			return self._lookup.path_is_dir(self._path)
+
+		return self._path.is_dir()
+
+	def _query_is_file(self):
+		"""
+		Queries whether path is a file, without instrumentation.
+
+		Returns:
+			bool: True if path exists and is a file, False otherwise
+		"""
+		if self._snapshot is not None:
+			stat_result = self._get_snapshot()
+			return stat_result is not None and S_ISREG(stat_result.st_mode)
+
+		if self._lookup is not None:
+			return self._lookup.path_is_file(self._path)
+
 		return self._path.is_file()
 
 	def _set_path(self, a_path):
@@ -140,3 +430,61 @@ class PathChecker:
 		else:
 			raise TypeError(
 				"The given path must be an instance of pathlib.Path or str.")
+
+
+class _StatSnapshot:
+	"""
+	This class stores the os.stat result used by a PathChecker in snapshot
+	mode, the time when it was taken and its time to live.
+	"""
+
+	__slots__ = ("stat_result", "time", "ttl")
+
+	def __init__(self, ttl):
+		self.stat_result = None
+		self.time = None
+		self.ttl = ttl
+
+	def take(self, path):
+		"""
+		Stores a new os.stat result of a path and the time when it was taken.
+
+		Args:
+			path (pathlib.Path): the path to stat
+		"""
+		self.stat_result = stat_or_none(path)
+		self.time = monotonic()
+
+
+def _get_default_content_cache():
+	"""
+	Provides the content signature cache shared by all checkers and creates
+	it if it does not exist yet.
+
+	Returns:
+		ContentSignatureCache: the shared cache
+	"""
+	global _default_content_cache
+
+	if _default_content_cache is None:
+		from .content_signature import ContentSignatureCache
+		_default_content_cache = ContentSignatureCache()
+
+	return _default_content_cache
+
+
+def _get_default_fingerprint_cache():
+	"""
+	Provides the fingerprint cache shared by all checkers and creates it if
+	it does not exist yet.
+
+	Returns:
+		FingerprintCache: the shared cache
+	"""
+	global _default_fingerprint_cache
+
+	if _default_fingerprint_cache is None:
+		from .file_fingerprint import FingerprintCache
+		_default_fingerprint_cache = FingerprintCache()
+
+	return _default_fingerprint_cache
@@ -0,0 +1,157 @@
+from itertools import islice
+
+
+class PathPipeline:
+	"""
+	This class lazily validates the paths provided by any iterable, such as a
+	file containing one path per line or the output of a command like find.
+	The paths are taken one at a time and each of them is checked by a
+	ReactivePathChecker made by a MissingPathArgWarner, which provides the
+	argument name and the expected extension. Since no checker is kept after
+	its result is consumed, the memory used does not depend on the number of
+	paths.
+
+	The verifications are methods of ReactivePathChecker such as
+	check_path_exists. They are applied in the given order and the first one
+	that raises an exception stops the verification of a path.
+	"""
+
+	def __init__(self, warner, checks):
+		"""
+		The constructor needs the warner that makes the checkers and the
+		verifications to perform.
+
+		Args:
+			warner (MissingPathArgWarner): the object that makes a checker for
+				each path
+			checks (sequence): functions taking a ReactivePathChecker as their
+				only argument, such as ReactivePathChecker.check_path_exists
+		"""
+		self._warner = warner
+		self._checks = tuple(checks)
+
+	@property
+	def checks(self):
+		"""
+		This read-only property is the tuple of verifications applied to each
+		path.
+		"""
+		return self._checks
+
+	def chunks(self, paths, chunk_size):
+		"""
+		Validates paths and groups the results in lists so that a consumer can
+		process them in batches. A chunk is made only when the consumer
+		requests it.
+
+		Args:
+			paths (iterable): pathlib.Path objects or strings
+			chunk_size (int): the maximum number of results in a chunk
+
+		Returns:
+			generator: lists of at most chunk_size tuples such as those
+				generated by method validate
+
+		Raises:
+			ValueError: if chunk_size is smaller than 1
+		"""
+		if chunk_size < 1:
+			raise ValueError("The chunk size must be at least 1.")
+
+		return self._make_chunks(paths, chunk_size)
+
+	def failures(self, paths):
+		"""
+		Validates paths and generates only the results of the invalid ones.
+
+		Args:
+			paths (iterable): pathlib.Path objects or strings
+
+		Returns:
+			generator: tuples containing a ReactivePathChecker and the
+				exception raised by its verification
+		"""
+		for checker, error in self.validate(paths):
+			if error is not None:
+				yield checker, error
+
+	def valid_paths(self, paths):
+		"""
+		Validates paths and generates only the valid ones.
+
+		Args:
+			paths (iterable): pathlib.Path objects or strings
+
+		Returns:
+			generator: the pathlib.Path objects that passed all checks
+		"""
+		for checker, error in self.validate(paths):
+			if error is None:
+				yield checker.path
+
+	def validate(self, paths):
+		"""
+		Validates paths one at a time.
+
+		Args:
+			paths (iterable): pathlib.Path objects or strings
+
+		Returns:
+			generator: tuples containing a ReactivePathChecker and the
+				exception raised by its verification or None if the path
+				passed all checks
+
+		Raises:
+			TypeError: if a path is not an instance of str or pathlib.Path
+		"""
+		for path in paths:
+			checker = self._warner.make_reactive_path_checker(path)
+
+			try:
+				for check in self._checks:
+					check(checker)
+
+			except Exception as e:
+				yield checker, e
+				continue
+
+			yield checker, None
+
+	@property
+	def warner(self):
+		"""
+		This read-only property is the MissingPathArgWarner that makes the
+		checkers.
+		"""
+		return self._warner
+
+	def _make_chunks(self, paths, chunk_size):
+		"""
+		Generates the chunks of method chunks.
+		"""
+		results = self.validate(paths)
+		chunk = list(islice(results, chunk_size))
+
+		while len(chunk) > 0:
+			yield chunk
+			chunk = list(islice(results, chunk_size))
+
+
+def read_path_lines(stream):
+	"""
+	Generates the paths contained in a text stream, one path per line. Line
+	terminators are removed and empty lines are skipped. The stream is read
+	lazily.
+
+	Args:
+		stream (io.TextIOBase): a text stream such as an opened manifest file
+			or sys.stdin
+
+	Returns:
+		generator: the paths (str) in the stream
+	"""
+	for line in stream:
+		line = line.rstrip("\r\n")
+
+		if len(line) > 0:
+			yield line
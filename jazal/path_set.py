@@ -0,0 +1,398 @@
+from array import array
+from operator import index as to_index
+from os import altsep, fsencode, sep
+from pathlib import PurePath
+from re import compile as compile_regex, escape
+from stat import S_ISDIR, S_ISREG
+from sys import getfilesystemencodeerrors, getfilesystemencoding
+from .extension_set import\
+	extension_matches,\
+	to_expected_extension
+from .path_checker import PathChecker
+from .path_util import stat_or_none
+from .str_path_util import str_extension
+
+
+_FS_ENCODING = getfilesystemencoding()
+_FS_ENCODE_ERRORS = getfilesystemencodeerrors()
+_REPEATED_SEPS = compile_regex(escape(sep) + "{2,}")
+
+# The initial size of the hash table of path indices. It must be a power of 2.
+_MIN_TABLE_SIZE = 8
+
+
+class PathSet:
+	"""
+	This class stores a large number of distinct paths compactly. Each
+	directory path is stored once in a table and every path refers to its
+	directory by index. The file names are encoded in one contiguous buffer
+	delimited by an array of offsets. A path is thus stored in a few bytes
+	beside its name instead of being a pathlib.Path object. The paths are
+	found by a hash table with open addressing stored in an array of path
+	indices, which at most two thirds of the entries occupy.
+
+	Paths are kept in insertion order and can be accessed by index as
+	strings, which PathChecker accepts. Method check verifies all paths like
+	BatchPathChecker and stores the results in bytearrays (properties exists,
+	is_dir, is_file and extension_ok).
+
+	Paths given as strings are stored as they are, except for trailing
+	separators and repeated separators, which are merged into one. Like in
+	pathlib, exactly two leading separators are kept. Two strings that still
+	differ, like 'a/./b' and 'a/b', are two different paths even if they
+	point to the same file.
+	"""
+
+	__slots__ = ("_dir_ids", "_dirs", "_exists", "_extension_ok",
+		"_index_table", "_is_dir", "_is_file", "_name_ends", "_names",
+		"_path_dirs")
+
+	def __init__(self, paths=()):
+		"""
+		The constructor adds the given paths to the set.
+
+		Args:
+			paths (iterable): pathlib.Path objects or strings. Defaults to an
+				empty tuple.
+
+		Raises:
+			TypeError: if a path is not an instance of str or pathlib.PurePath
+		"""
+		self._dirs = list()
+		self._dir_ids = dict()
+		self._names = bytearray()
+		self._name_ends = array("Q")
+		self._path_dirs = array("I")
+		# Entry i is 0 if it is empty or a path's index plus 1.
+		self._index_table = array("I", (0,)) * _MIN_TABLE_SIZE
+		self._exists = None
+		self._is_dir = None
+		self._is_file = None
+		self._extension_ok = None
+
+		for path in paths:
+			self.add(path)
+
+	def __contains__(self, path):
+		return self.index(path) >= 0
+
+	def __getitem__(self, index):
+		path_count = len(self._path_dirs)
+		index = to_index(index)
+
+		if index < 0:
+			index += path_count
+
+		if index < 0 or index >= path_count:
+			raise IndexError("The path index is out of range.")
+
+		dir_path = self._dirs[self._path_dirs[index]]
+		name = self._get_name(index)
+
+		if len(dir_path) == 0:
+			return name
+
+		elif dir_path.endswith(sep):
+			return dir_path + name
+
+		return dir_path + sep + name
+
+	def __iter__(self):
+		for i in range(len(self._path_dirs)):
+			yield self[i]
+
+	def __len__(self):
+		return len(self._path_dirs)
+
+	def __repr__(self):
+		return self.__class__.__name__ + "(<" + str(len(self)) + " paths in "\
+			+ str(len(self._dirs)) + " directories>)"
+
+	def add(self, path):
+		"""
+		Adds a path to this set if it is not in the set yet. Adding a path
+		discards the stored verification results.
+
+		Args:
+			path (pathlib.PurePath or str): the path to add
+
+		Returns:
+			int: the path's index in this set
+
+		Raises:
+			TypeError: if path is not an instance of str or pathlib.PurePath
+		"""
+		dir_path, name = _split_path(path)
+		encoded_name = fsencode(name)
+		dir_id = self._dir_ids.get(dir_path)
+
+		if dir_id is None:
+			dir_id = len(self._dirs)
+			self._dirs.append(dir_path)
+			self._dir_ids[dir_path] = dir_id
+
+		index = len(self._path_dirs)
+
+		if 3 * (index + 1) > 2 * len(self._index_table):
+			self._resize_table(2 * len(self._index_table))
+
+		found_index, slot = self._find(dir_id, encoded_name)
+
+		if found_index >= 0:
+			return found_index
+
+		self._names += encoded_name
+		self._name_ends.append(len(self._names))
+		self._path_dirs.append(dir_id)
+		self._index_table[slot] = index + 1
+		self._exists = None
+		self._is_dir = None
+		self._is_file = None
+		self._extension_ok = None
+		return index
+
+	def check(self, extension):
+		"""
+		Verifies every path in this set like BatchPathChecker does and stores
+		the results in properties exists, is_dir, is_file and extension_ok.
+		The file system is queried once per path.
+
+		Args:
+			extension (str, ExtensionSet or iterable): the extension that the
+				paths are supposed to have. If they are not supposed to have an
+				extension, set this argument to an empty string. If several
+				extensions are allowed, give an ExtensionSet or another
+				collection of strings.
+		"""
+		extension = to_expected_extension(extension)
+		path_count = len(self)
+		exists = bytearray(path_count)
+		is_dir = bytearray(path_count)
+		is_file = bytearray(path_count)
+		extension_ok = bytearray(path_count)
+
+		for i, path in enumerate(self):
+			if extension_matches(str_extension(path), extension):
+				extension_ok[i] = 1
+
+			stat_result = stat_or_none(path)
+
+			if stat_result is not None:
+				exists[i] = 1
+
+				if S_ISDIR(stat_result.st_mode):
+					is_dir[i] = 1
+
+				elif S_ISREG(stat_result.st_mode):
+					is_file[i] = 1
+
+		self._exists = exists
+		self._is_dir = is_dir
+		self._is_file = is_file
+		self._extension_ok = extension_ok
+
+	@property
+	def dir_count(self):
+		"""
+		This read-only property is the number (int) of distinct directories
+		containing the paths of this set.
+		"""
+		return len(self._dirs)
+
+	@property
+	def exists(self):
+		"""
+		This read-only property is a bytearray where item i is 1 if path i
+		existed when method check was last called, 0 otherwise. It is None if
+		the paths have not been checked since the last addition.
+		"""
+		return self._exists
+
+	@property
+	def extension_ok(self):
+		"""
+		This read-only property is a bytearray where item i is 1 if path i had
+		the expected extension when method check was last called, 0
+		otherwise. It is None if the paths have not been checked since the
+		last addition.
+		"""
+		return self._extension_ok
+
+	def index(self, path):
+		"""
+		Provides the index of a path in this set.
+
+		Args:
+			path (pathlib.PurePath or str): a path
+
+		Returns:
+			int: the path's index or -1 if the path is not in this set
+		"""
+		dir_path, name = _split_path(path)
+		dir_id = self._dir_ids.get(dir_path)
+
+		if dir_id is None:
+			return -1
+
+		try:
+			encoded_name = fsencode(name)
+
+		except UnicodeEncodeError:
+			# Such a name cannot have been added.
+			return -1
+
+		return self._find(dir_id, encoded_name)[0]
+
+	@property
+	def is_dir(self):
+		"""
+		This read-only property is a bytearray where item i is 1 if path i was
+		a directory when method check was last called, 0 otherwise. It is
+		None if the paths have not been checked since the last addition.
+		"""
+		return self._is_dir
+
+	@property
+	def is_file(self):
+		"""
+		This read-only property is a bytearray where item i is 1 if path i was
+		a file when method check was last called, 0 otherwise. It is None if
+		the paths have not been checked since the last addition.
+		"""
+		return self._is_file
+
+	def make_path_checker(self, index, extension):
+		"""
+		Creates a PathChecker for one path of this set.
+
+		Args:
+			index (int): the path's index
+			extension (str or ExtensionSet): the extension that the path is
+				supposed to have
+
+		Returns:
+			PathChecker: an object able to verify the path
+		"""
+		return PathChecker(self[index], extension)
+
+	def _find(self, dir_id, encoded_name):
+		"""
+		Searches a path by directory and name in the hash table with linear
+		probing.
+
+		Args:
+			dir_id (int): the index of the path's directory
+			encoded_name (bytes): the path's encoded file name
+
+		Returns:
+			tuple: the path's index (int) or -1 if the path is not in this
+				set and the position (int) of the path's entry in the hash
+				table or of the empty entry where it would be stored
+		"""
+		table = self._index_table
+		mask = len(table) - 1
+		slot = hash((dir_id, encoded_name)) & mask
+
+		while True:
+			entry = table[slot]
+
+			if entry == 0:
+				return -1, slot
+
+			index = entry - 1
+
+			if self._path_dirs[index] == dir_id\
+					and self._get_encoded_name(index) == encoded_name:
+				return index, slot
+
+			slot = (slot + 1) & mask
+
+	def _get_encoded_name(self, index):
+		"""
+		Extracts the encoded file name of a path from the name buffer.
+
+		Args:
+			index (int): the path's index
+
+		Returns:
+			bytes: the path's encoded file name
+		"""
+		start = 0 if index == 0 else self._name_ends[index - 1]
+		return bytes(self._names[start:self._name_ends[index]])
+
+	def _get_name(self, index):
+		"""
+		Decodes the file name of a path from the name buffer.
+
+		Args:
+			index (int): the path's index
+
+		Returns:
+			str: the path's file name
+		"""
+		return self._get_encoded_name(index).decode(
+			_FS_ENCODING, _FS_ENCODE_ERRORS)
+
+	def _resize_table(self, size):
+		"""
+		Replaces the hash table by a table of another size where all the
+		paths are stored again.
+
+		Args:
+			size (int): the new table's size, a power of 2
+		"""
+		table = array("I", (0,)) * size
+		mask = size - 1
+
+		for index in range(len(self._path_dirs)):
+			slot = hash((self._path_dirs[index],
+				self._get_encoded_name(index))) & mask
+
+			while table[slot] != 0:
+				slot = (slot + 1) & mask
+
+			table[slot] = index + 1
+
+		self._index_table = table
+
+
+def _split_path(path):
+	"""
+	Splits a path into its directory and its file name.
+
+	Args:
+		path (pathlib.PurePath or str): a path
+
+	Returns:
+		tuple: the directory (str) and the file name (str)
+
+	Raises:
+		TypeError: if path is not an instance of str or pathlib.PurePath
+	"""
+	if isinstance(path, PurePath):
+		path = str(path)
+
+	elif not isinstance(path, str):
+		raise TypeError(
+			"The given path must be an instance of pathlib.Path or str.")
+
+	if altsep is not None:
+		path = path.replace(altsep, sep)
+
+	if sep + sep in path:
+		start = 2 if path.startswith(sep + sep)\
+			and not path.startswith(sep + sep + sep) else 0
+		path = path[:start] + _REPEATED_SEPS.sub(sep, path[start:])
+
+	stripped_path = path.rstrip(sep)
+
+	if len(stripped_path) == 0:
+		# The path is empty or made of separators only.
+		return "", path[:1]
+
+	dir_path, separator, name = stripped_path.rpartition(sep)
+
+	if len(dir_path) == 0 and len(separator) > 0:
+		dir_path = separator
+
+	return dir_path, name
@@ -1,6 +1,7 @@
 """
 The present module contains functions meant to help handling file paths, which
-must be provided as pathlib.Path objects.
+must be provided as pathlib.Path objects or as ParsedPath objects. The parts of
+a ParsedPath are reused instead of being computed again.
 
 Library Pathlib represents file extensions as lists of suffixes starting with a
 '.' and it defines a file stem as a file name without the last suffix. In this
@@ -8,6 +9,25 @@ module, however, a stem is a file name without the extension.
 """
 
 
+from errno import EBADF, ELOOP, ENOENT, ENOTDIR
+from os import stat
+from .parsed_path import ParsedPath
+from .str_path_util import split_name
+
+
+__all__ = [
+	"extension_to_str",
+	"get_file_stem",
+	"make_altered_name",
+	"make_altered_path",
+	"make_altered_stem",
+	"stat_or_none"
+]
+
+_IGNORED_ERRNOS = (EBADF, ELOOP, ENOENT, ENOTDIR)
+_IGNORED_WINERRORS = (21, 123, 1921)
+
+
 def extension_to_str(path):
 	"""
 	Pathlib represents file extensions as lists of suffixes starting with a
@@ -15,12 +35,12 @@ def extension_to_str(path):
 	given path.
 
 	Args:
-		path (pathlib.Path): the path whose extension is needed
+		path (pathlib.Path or ParsedPath): the path whose extension is needed
 
 	Returns:
 		str: the path's extension as one string
 	"""
-	return "".join(path.suffixes)
+	return _split_file_name(path)[1]
 
 
 def get_file_stem(path):
@@ -29,19 +49,12 @@ def get_file_stem(path):
 	name without the extension.
 
 	Args:
-		path (pathlib.Path): the file path whose stem is needed
+		path (pathlib.Path or ParsedPath): the file path whose stem is needed
 
 	Returns:
 		str: the file's stem
 	"""
-	file_stem = path.name
-
-	suffixes = path.suffixes
-	if len(suffixes) > 0:
-		exten_index = file_stem.index(suffixes[0])
-		file_stem = file_stem[:exten_index]
-
-	return file_stem
+	return _split_file_name(path)[0]
 
 
 def make_altered_name(path, before_stem=None, after_stem=None, extension=None):
@@ -53,7 +66,8 @@ def make_altered_name(path, before_stem=None, after_stem=None, extension=None):
 	instead if you do not want to append an extension.
 
 	Args:
-		path (pathlib.Path): the file path that provides the original name
+		path (pathlib.Path or ParsedPath): the file path that provides the
+			original name
 		before_stem (str): the string to add to the beginning of the path's
 			stem. If it is None, nothing is added to the stem's beginning.
 			Defaults to None.
@@ -67,10 +81,11 @@ def make_altered_name(path, before_stem=None, after_stem=None, extension=None):
 	Returns:
 		str: a new file name with the specified additions
 	"""
-	stem = make_altered_stem(path, before_stem, after_stem)
+	stem, path_exten = _split_file_name(path)
+	stem = _alter_stem(stem, before_stem, after_stem)
 
 	if extension is None:
-		name = stem + extension_to_str(path)
+		name = stem + path_exten
 	else:
 		name = stem + extension
 
@@ -85,7 +100,8 @@ def make_altered_path(path, before_stem=None, after_stem=None, extension=None):
 	stem. This function does not change the given path.
 
 	Args:
-		path (pathlib.Path): the file path of which an altered form is needed
+		path (pathlib.Path or ParsedPath): the file path of which an altered
+			form is needed
 		before_stem (str): the string to add to the beginning of the path's
 			stem. If it is None, nothing is added to the stem's beginning.
 			Defaults to None.
@@ -100,7 +116,7 @@ def make_altered_path(path, before_stem=None, after_stem=None, extension=None):
 		pathlib.Path: a new file path with the specified additions
 	"""
 	name = make_altered_name(path, before_stem, after_stem, extension)
-	return path.parents[0]/name
+	return path.parent/name
 
 
 def make_altered_stem(path, before_stem=None, after_stem=None):
@@ -111,7 +127,8 @@ def make_altered_stem(path, before_stem=None, after_stem=None):
 	make_altered_name instead to append an extension.
 
 	Args:
-		path (pathlib.Path): the file path that provides the original stem
+		path (pathlib.Path or ParsedPath): the file path that provides the
+			original stem
 		before_stem (str): the string to add to the beginning of the path's
 			stem. If it is None, nothing is added to the stem's beginning.
 			Defaults to None.
@@ -121,8 +138,55 @@ def make_altered_stem(path, before_stem=None, after_stem=None):
 	Returns:
 		str: a new file stem with the specified additions
 	"""
-	stem = get_file_stem(path)
+	return _alter_stem(get_file_stem(path), before_stem, after_stem)
+
+
+def stat_or_none(path, dir_fd=None):
+	"""
+	Calls os.stat on a path and tolerates the same errors as
+	pathlib.Path.exists. If the path does not exist or cannot be reached
+	through its parents, this function returns None instead of raising an
+	exception.
+
+	Args:
+		path (pathlib.Path or str): the path to stat
+		dir_fd (int): a file descriptor of the directory that path is
+			relative to, as in os.stat. If it is None, path is relative to
+			the working directory. Defaults to None.
+
+	Returns:
+		os.stat_result: the path's status or None if the path does not exist
+
+	Raises:
+		OSError: if the stat call fails for another reason, such as a denied
+			permission
+	"""
+	try:
+		return stat(path, dir_fd=dir_fd)
+
+	except OSError as e:
+		if getattr(e, "errno", None) in _IGNORED_ERRNOS\
+				or getattr(e, "winerror", None) in _IGNORED_WINERRORS:
+			return None
+
+		raise
 
+	except ValueError:
+		return None
+
+
+def _alter_stem(stem, before_stem, after_stem):
+	"""
+	Adds strings to the beginning and/or the end of a file stem.
+
+	Args:
+		stem (str): a file stem
+		before_stem (str): the string to add to the stem's beginning or None
+		after_stem (str): the string to add to the stem's end or None
+
+	Returns:
+		str: the altered stem
+	"""
 	if before_stem is not None:
 		stem = before_stem + stem
 
@@ -130,3 +194,20 @@ def make_altered_stem(path, before_stem=None, after_stem=None):
 		stem += after_stem
 
 	return stem
+
+
+def _split_file_name(path):
+	"""
+	Provides the stem and the extension of a path's file name. If path is a
+	ParsedPath, its parts are reused.
+
+	Args:
+		path (pathlib.Path or ParsedPath): a file path
+
+	Returns:
+		tuple: the stem (str) and the extension (str) of path's file name
+	"""
+	if isinstance(path, ParsedPath):
+		return path.stem, path.extension
+
+	return split_name(path.name)
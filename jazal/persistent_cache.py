@@ -0,0 +1,409 @@
+from os import fsencode, fstat, fspath, stat
+from os.path import abspath
+from sqlite3 import connect
+from stat import S_ISREG
+from threading import Lock, local
+from time import time
+from .content_signature import\
+	header_matches,\
+	read_header
+from .extension_set import ExtensionSet
+from .file_fingerprint import hash_file
+
+
+# The number of writes of pending results after which the old results are
+# evicted.
+_WRITES_PER_EVICTION = 16
+
+_CHUNK_SIZE = 1 << 20
+_HEADER_KIND = "header"
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS results ("\
+	+ "path BLOB NOT NULL, kind TEXT NOT NULL, device INTEGER NOT NULL, "\
+	+ "inode INTEGER NOT NULL, size INTEGER NOT NULL, "\
+	+ "mtime_ns INTEGER NOT NULL, result BLOB NOT NULL, "\
+	+ "time REAL NOT NULL, PRIMARY KEY (path, kind))"
+_TIME_INDEX = "CREATE INDEX IF NOT EXISTS results_time ON results (time)"
+_SELECT = "SELECT device, inode, size, mtime_ns, result FROM results "\
+	+ "WHERE path = ? AND kind = ?"
+_UPSERT = "INSERT OR REPLACE INTO results "\
+	+ "(path, kind, device, inode, size, mtime_ns, result, time) "\
+	+ "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+_TOUCH = "UPDATE results SET time = ? WHERE path = ? AND kind = ?"
+
+
+class PersistentCheckCache:
+	"""
+	This class keeps the results of the verifications that require reading
+	files in a SQLite database, so that they survive the process that
+	computed them. It stores the headers read to verify the content of files
+	and the fingerprints of files. It can be given to PathChecker's methods
+	content_is_correct and get_fingerprint and to ReactivePathChecker's
+	methods check_content_correct and validate_content instead of a
+	ContentSignatureCache or a FingerprintCache.
+
+	Each result is stored with the absolute path of the file, encoded like
+	os.fsencode does so that any file name can be stored, and the file's
+	device, inode, size and modification time in nanoseconds. A stored result
+	is used only if a single os.stat call shows that the file did not change.
+
+	The database uses write-ahead logging, so that several processes can
+	read it while one of them writes. New results and the times when stored
+	results were last used are buffered and written in a single transaction
+	when batch_size of them are pending or when method flush or close is
+	called. Every 16 writes and when method evict or close is called, the
+	results unused for max_age seconds and the least recently used results
+	beyond max_entries are deleted. The database can thus temporarily hold
+	more than max_entries results.
+
+	An instance can be shared by many threads. It can be used as a context
+	manager, which closes it on exit.
+	"""
+
+	def __init__(self, db_path, max_entries=100000, max_age=None,
+			batch_size=256):
+		"""
+		The constructor opens or creates the database.
+
+		Args:
+			db_path (pathlib.Path or str): the path to the SQLite database
+			max_entries (int): the maximum number of results kept in the
+				database. Defaults to 100000.
+			max_age (float): the number of seconds after which an unused
+				result is evicted. If it is None, results are evicted only
+				when there are too many of them. Defaults to None.
+			batch_size (int): the number of pending results and uses that
+				triggers a write. Defaults to 256.
+
+		Raises:
+			ValueError: if max_entries or batch_size is smaller than 1 or if
+				max_age is negative
+			sqlite3.Error: if the database cannot be opened
+		"""
+		if max_entries < 1:
+			raise ValueError(
+				"The maximum number of entries must be at least 1.")
+
+		if max_age is not None and max_age < 0:
+			raise ValueError("The maximum age cannot be negative.")
+
+		if batch_size < 1:
+			raise ValueError("The batch size must be at least 1.")
+
+		self._max_entries = max_entries
+		self._max_age = max_age
+		self._batch_size = batch_size
+		self._pending = dict()
+		self._touched = set()
+		self._write_count = 0
+		self._lock = Lock()
+		self._hit_count = 0
+		self._miss_count = 0
+		self._thread_data = local()
+		self._connection = connect(fspath(db_path), timeout=10.0,
+			check_same_thread=False)
+		self._connection.execute("PRAGMA journal_mode=WAL")
+		self._connection.execute("PRAGMA synchronous=NORMAL")
+
+		with self._connection:
+			self._connection.execute(_SCHEMA)
+			self._connection.execute(_TIME_INDEX)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+	def __len__(self):
+		with self._lock:
+			self._write_pending()
+			return self._connection.execute(
+				"SELECT COUNT(*) FROM results").fetchone()[0]
+
+	def close(self):
+		"""
+		Writes the pending results and closes the database. This object cannot
+		be used afterwards.
+		"""
+		with self._lock:
+			self._write_pending()
+			self._evict()
+			self._connection.close()
+
+	def content_matches(self, path, extension):
+		"""
+		Indicates whether a file's content matches an expected extension like
+		ContentSignatureCache.content_matches does. The file's header is read
+		only if it is not stored or if the file changed.
+
+		Args:
+			path (pathlib.Path or str): the path to a file
+			extension (str or ExtensionSet): the expected extension or the
+				allowed extensions
+
+		Returns:
+			bool: True if path points to a file whose content matches
+				extension or one of the allowed extensions, False otherwise
+		"""
+		try:
+			stat_result = stat(path)
+
+		except (OSError, ValueError):
+			return False
+
+		if not S_ISREG(stat_result.st_mode):
+			return False
+
+		header = self._get(path, _HEADER_KIND, stat_result)
+
+		if header is None:
+			try:
+				header = read_header(path)
+
+			except OSError:
+				return False
+
+			self._put(path, _HEADER_KIND, stat_result, header)
+
+		if isinstance(extension, ExtensionSet):
+			return any(header_matches(header, an_exten)
+				for an_exten in extension)
+
+		return header_matches(header, extension)
+
+	def evict(self):
+		"""
+		Writes the pending results, then deletes the results unused for
+		max_age seconds and the least recently used results beyond
+		max_entries.
+		"""
+		with self._lock:
+			self._write_pending()
+			self._evict()
+
+	def fingerprint(self, path, digest_size=32):
+		"""
+		Provides the BLAKE2b digest of a file's content like
+		FingerprintCache.fingerprint does. The file is read only if its digest
+		is not stored or if the file changed.
+
+		Args:
+			path (pathlib.Path or str): the path to a file
+			digest_size (int): the size of the digest in bytes, between 1 and
+				64. Defaults to 32.
+
+		Returns:
+			bytes: the digest of the file's content
+
+		Raises:
+			OSError: if the file cannot be reached or read, for instance
+				FileNotFoundError if it does not exist
+		"""
+		kind = "blake2b-" + str(digest_size)
+		stat_result = stat(path)
+		digest = self._get(path, kind, stat_result)
+
+		if digest is not None:
+			return digest
+
+		with open(path, mode="rb", buffering=0) as file:
+			digest = hash_file(file, self._get_buffer(), digest_size)
+			current_stat = fstat(file.fileno())
+
+		if _make_identity(current_stat) == _make_identity(stat_result):
+			self._put(path, kind, stat_result, digest)
+
+		return digest
+
+	def flush(self):
+		"""
+		Writes the pending results to the database in a single transaction.
+		"""
+		with self._lock:
+			self._write_pending()
+
+	@property
+	def hit_count(self):
+		"""
+		This read-only property is the number (int) of results found in this
+		cache since this object was created.
+		"""
+		return self._hit_count
+
+	@property
+	def max_age(self):
+		"""
+		This read-only property is the number of seconds (float) after which
+		an unused result is evicted or None if results are not evicted by
+		age.
+		"""
+		return self._max_age
+
+	@property
+	def max_entries(self):
+		"""
+		This read-only property is the maximum number (int) of results kept
+		in the database.
+		"""
+		return self._max_entries
+
+	@property
+	def miss_count(self):
+		"""
+		This read-only property is the number (int) of results that had to be
+		computed since this object was created.
+		"""
+		return self._miss_count
+
+	def _evict(self):
+		"""
+		Deletes the results unused for max_age seconds and the least recently
+		used results beyond max_entries. The lock must be acquired by the
+		caller.
+		"""
+		with self._connection:
+			if self._max_age is not None:
+				self._connection.execute("DELETE FROM results WHERE time < ?",
+					(time() - self._max_age,))
+
+			self._connection.execute("DELETE FROM results WHERE rowid IN "
+				+ "(SELECT rowid FROM results ORDER BY time DESC "
+				+ "LIMIT -1 OFFSET ?)", (self._max_entries,))
+
+	def _get(self, path, kind, stat_result):
+		"""
+		Provides a stored result if the file did not change since it was
+		computed and records that the result was used.
+
+		Args:
+			path (pathlib.Path or str): the path to a file
+			kind (str): the kind of result
+			stat_result (os.stat_result): the file's current status
+
+		Returns:
+			bytes: the stored result or None if there is no valid one
+		"""
+		key = (_make_path_key(path), kind)
+		identity = _make_identity(stat_result)
+
+		with self._lock:
+			row = self._pending.get(key)
+			stored = row is None
+
+			if stored:
+				row = self._connection.execute(_SELECT, key).fetchone()
+
+			else:
+				row = row[2:7]
+
+			if row is not None and tuple(row[:4]) == identity:
+				self._hit_count += 1
+
+				if stored:
+					self._touched.add(key)
+					self._write_if_full()
+
+				return bytes(row[4])
+
+			self._miss_count += 1
+			return None
+
+	def _get_buffer(self):
+		"""
+		Provides the current thread's read buffer, which is created when
+		first requested.
+
+		Returns:
+			bytearray: a buffer of 1 MiB
+		"""
+		buffer = getattr(self._thread_data, "buffer", None)
+
+		if buffer is None:
+			buffer = bytearray(_CHUNK_SIZE)
+			self._thread_data.buffer = buffer
+
+		return buffer
+
+	def _put(self, path, kind, stat_result, result):
+		"""
+		Adds a result to the pending results and writes them if there are
+		batch_size of them.
+
+		Args:
+			path (pathlib.Path or str): the path to a file
+			kind (str): the kind of result
+			stat_result (os.stat_result): the file's status when the result
+				was computed
+			result (bytes): the result to store
+		"""
+		key = (_make_path_key(path), kind)
+		row = key + _make_identity(stat_result) + (result, time())
+
+		with self._lock:
+			self._pending[key] = row
+			self._touched.discard(key)
+			self._write_if_full()
+
+	def _write_if_full(self):
+		"""
+		Writes the pending results and uses if there are batch_size of them.
+		The lock must be acquired by the caller.
+		"""
+		if len(self._pending) + len(self._touched) >= self._batch_size:
+			self._write_pending()
+
+	def _write_pending(self):
+		"""
+		Writes the pending results and the times when stored results were
+		last used in a single transaction. Every _WRITES_PER_EVICTION writes,
+		the old results are evicted. The lock must be acquired by the caller.
+		"""
+		if len(self._pending) == 0 and len(self._touched) == 0:
+			return
+
+		now = time()
+
+		with self._connection:
+			self._connection.executemany(_UPSERT, self._pending.values())
+			self._connection.executemany(_TOUCH,
+				((now,) + key for key in self._touched))
+
+		self._pending.clear()
+		self._touched.clear()
+		self._write_count += 1
+
+		if self._write_count % _WRITES_PER_EVICTION == 0:
+			self._evict()
+
+
+def _make_identity(stat_result):
+	"""
+	Makes the tuple that identifies a version of a file. The values are
+	converted to signed 64-bit integers, which SQLite can store.
+
+	Args:
+		stat_result (os.stat_result): the file's status
+
+	Returns:
+		tuple: the file's device, inode, size and modification time in
+			nanoseconds
+	"""
+	return tuple(value - (1 << 64) if value >= 1 << 63 else value
+		for value in (stat_result.st_dev, stat_result.st_ino,
+			stat_result.st_size, stat_result.st_mtime_ns))
+
+
+def _make_path_key(path):
+	"""
+	Makes the absolute path under which a file's results are stored. It is
+	encoded with the file system's encoding, since file names that are not
+	valid in that encoding cannot be stored as SQLite text.
+
+	Args:
+		path (pathlib.Path or str): the path to a file
+
+	Returns:
+		bytes: the encoded absolute form of path
+	"""
+	return fsencode(abspath(fspath(path)))
@@ -0,0 +1,303 @@
+from concurrent.futures import\
+	FIRST_COMPLETED,\
+	ProcessPoolExecutor,\
+	wait
+from os import cpu_count, fspath
+from time import perf_counter
+from .check_status import CheckStatus
+
+
+_MAX_CHUNK_SIZE = 65536
+_PROBE_CHUNK_SIZE = 256
+
+
+class ProcessPoolChecker:
+	"""
+	This class validates large batches of paths in worker processes. It is
+	meant for verifications that a single interpreter cannot perform fast
+	enough, either because they use the processor or because they wait for
+	the file system.
+
+	The paths are split into chunks, and each chunk is validated by a worker
+	with a CheckPlan or with the validate methods of ReactivePathChecker. The
+	workers send back one compact array of CheckStatus values per chunk
+	rather than pickled objects, and the results are returned as a bytearray
+	where item i is the status of path i.
+
+	If no chunk size is given, it is tuned for each batch. The first chunks
+	have a small size. The time that the workers spend on them determines
+	the size of the following chunks, so that each chunk keeps a worker busy
+	for about property target_duration seconds while every worker receives
+	several chunks.
+
+	This class can be used as a context manager. If it created its own
+	executor, leaving the context shuts it down.
+	"""
+
+	def __init__(self, max_workers=None, chunk_size=None,
+			target_duration=0.05, executor=None):
+		"""
+		The constructor creates a ProcessPoolExecutor unless an executor is
+		given.
+
+		Args:
+			max_workers (int): the number of processes of the executor created
+				by this object or, if argument executor is not None, the
+				number of workers of that executor, which is used to tune the
+				chunk size. If it is None, the number of processors is used.
+				Defaults to None.
+			chunk_size (int): the number of paths sent to a worker at once. If
+				it is None, it is tuned for each batch. Defaults to None.
+			target_duration (float): the number of seconds that a chunk should
+				keep a worker busy when the chunk size is tuned. Defaults to
+				0.05.
+			executor (concurrent.futures.Executor): an executor that this
+				object will use instead of creating one. This object will not
+				shut it down. Defaults to None.
+
+		Raises:
+			ValueError: if max_workers or chunk_size is smaller than 1 or
+				target_duration is not positive
+		"""
+		if max_workers is None:
+			max_workers = cpu_count() or 1
+
+		elif max_workers < 1:
+			raise ValueError("The number of workers must be at least 1.")
+
+		if chunk_size is not None and chunk_size < 1:
+			raise ValueError("The chunk size must be at least 1.")
+
+		if target_duration <= 0:
+			raise ValueError("The target duration must be positive.")
+
+		if executor is None:
+			self._executor = ProcessPoolExecutor(max_workers=max_workers)
+			self._owns_executor = True
+
+		else:
+			self._executor = executor
+			self._owns_executor = False
+
+		self._worker_count = max_workers
+		self._chunk_size = chunk_size
+		self._target_duration = target_duration
+		self._last_chunk_size = chunk_size
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.shutdown()
+
+	@property
+	def chunk_size(self):
+		"""
+		This read-only property is the chunk size (int) given to the
+		constructor or None if the chunk size is tuned for each batch.
+		"""
+		return self._chunk_size
+
+	@property
+	def last_chunk_size(self):
+		"""
+		This read-only property is the size (int) of the chunks used for the
+		last batch after the first ones. It is None if the chunk size is
+		tuned and no batch has been validated yet.
+		"""
+		return self._last_chunk_size
+
+	@property
+	def max_workers(self):
+		"""
+		This read-only property is the number (int) of worker processes of
+		the executor.
+		"""
+		return self._worker_count
+
+	def shutdown(self):
+		"""
+		Shuts down the executor if this object created it. Otherwise, this
+		method does nothing.
+		"""
+		if self._owns_executor:
+			self._executor.shutdown()
+
+	@property
+	def target_duration(self):
+		"""
+		This read-only property is the number of seconds (float) that a chunk
+		should keep a worker busy when the chunk size is tuned.
+		"""
+		return self._target_duration
+
+	def validate(self, paths, plan):
+		"""
+		Applies a CheckPlan to each path in the worker processes.
+
+		Args:
+			paths (iterable): pathlib.Path objects or strings to check
+			plan (CheckPlan): the verifications to perform
+
+		Returns:
+			bytearray: item i is the CheckStatus value of path i
+		"""
+		return self._run(_validate_paths,
+			[fspath(path) for path in paths], plan)
+
+	def validate_checkers(self, checkers, validations):
+		"""
+		Calls validate methods of ReactivePathChecker, such as
+		validate_path_exists, on each checker in the worker processes. For a
+		given checker, the methods are called in the order of argument
+		validations and the first failure stops the verification. Only the
+		checkers' path, extension and argument name are sent to the workers.
+
+		Args:
+			checkers (iterable): ReactivePathChecker objects
+			validations (sequence): functions taking a checker as their only
+				argument and returning a CheckStatus, such as
+				ReactivePathChecker.validate_path_exists. They must be
+				picklable.
+
+		Returns:
+			bytearray: item i is the CheckStatus value of the first failed
+				validation of checker i or OK if all of them passed
+		"""
+		return self._run(
+			_validate_checkers, list(checkers), tuple(validations))
+
+	def _run(self, function, items, argument):
+		"""
+		Splits items into chunks, submits them to the executor and assembles
+		the results.
+
+		Args:
+			function (callable): a module-level function taking a chunk and
+				argument and returning a tuple containing a bytearray of
+				results and the time spent in seconds
+			items (list): the items to split into chunks
+			argument: the second argument of function
+
+		Returns:
+			bytearray: item i is the result for items[i]
+		"""
+		item_count = len(items)
+		results = bytearray(item_count)
+
+		if item_count == 0:
+			return results
+
+		pending = dict()
+		start = 0
+
+		if self._chunk_size is None:
+			chunk_size = min(_PROBE_CHUNK_SIZE, item_count)
+			probe_count = self._worker_count
+
+		else:
+			chunk_size = self._chunk_size
+			probe_count = 0
+
+		def submit(chunk_size):
+			nonlocal start
+			end = min(start + chunk_size, item_count)
+			future = self._executor.submit(
+				function, items[start:end], argument)
+			pending[future] = start
+			start = end
+
+		while start < item_count and probe_count > 0:
+			submit(chunk_size)
+			probe_count -= 1
+
+		if self._chunk_size is None and start < item_count:
+			done, _ = wait(pending, return_when=FIRST_COMPLETED)
+			future = next(iter(done))
+			chunk_results, duration = future.result()
+			chunk_size = tune_chunk_size(len(chunk_results), duration,
+				item_count - start, self._worker_count, self._target_duration)
+
+		while start < item_count:
+			submit(chunk_size)
+
+		for future, offset in pending.items():
+			chunk_results = future.result()[0]
+			results[offset:offset + len(chunk_results)] = chunk_results
+
+		self._last_chunk_size = chunk_size
+		return results
+
+
+def tune_chunk_size(
+		probe_size, probe_duration, item_count, worker_count, target_duration):
+	"""
+	Computes a chunk size from the time that a worker spent on a probe chunk.
+	The chunks should keep a worker busy for about target_duration seconds,
+	but each worker should receive at least four of them so that the load is
+	balanced.
+
+	Args:
+		probe_size (int): the number of items in the probe chunk
+		probe_duration (float): the time in seconds spent on the probe chunk
+		item_count (int): the number of items that remain to be submitted
+		worker_count (int): the number of worker processes
+		target_duration (float): the desired duration of a chunk in seconds
+
+	Returns:
+		int: the size of the next chunks, between 1 and 65536
+	"""
+	if probe_size < 1:
+		return _PROBE_CHUNK_SIZE
+
+	if probe_duration <= 0:
+		chunk_size = _MAX_CHUNK_SIZE
+
+	else:
+		chunk_size = int(target_duration * probe_size / probe_duration)
+
+	balanced_size = -(-item_count // (4 * worker_count))
+	return max(1, min(chunk_size, balanced_size, _MAX_CHUNK_SIZE))
+
+
+def _validate_checkers(checkers, validations):
+	"""
+	Validates a chunk of checkers in a worker process.
+
+	Args:
+		checkers (list): ReactivePathChecker objects
+		validations (tuple): functions returning a CheckStatus
+
+	Returns:
+		tuple: a bytearray of CheckStatus values and the time spent in
+			seconds
+	"""
+	start = perf_counter()
+	results = bytearray(len(checkers))
+
+	for i, checker in enumerate(checkers):
+		for validation in validations:
+			status = validation(checker)
+
+			if status != CheckStatus.OK:
+				results[i] = status
+				break
+
+	return results, perf_counter() - start
+
+
+def _validate_paths(paths, plan):
+	"""
+	Applies a CheckPlan to a chunk of paths in a worker process.
+
+	Args:
+		paths (list): paths (str) to check
+		plan (CheckPlan): the verifications to perform
+
+	Returns:
+		tuple: a bytearray of CheckStatus values and the time spent in
+			seconds
+	"""
+	start = perf_counter()
+	results = plan.validate_all(paths)
+	return results, perf_counter() - start
@@ -1,3 +1,7 @@
+from .check_status import\
+	CheckStatus,\
+	make_status_msg
+from .extension_set import repr_expected_extension
 from .path_checker import PathChecker
 
 
@@ -6,8 +10,16 @@ class ReactivePathChecker(PathChecker):
 	This subclass of PathChecker provides methods to react to invalid paths by
 	warning the user or making a correct path. It requires the name of the
 	checked path argument to make error messages.
+
+	Each check method, which raises an exception if the path is invalid, has
+	a validate counterpart that returns a CheckStatus instead. Method
+	make_status_msg makes the message that the exception would carry only
+	when it is requested, which spares the cost of exceptions and messages
+	when many paths are expected to be invalid.
 	"""
 
+	__slots__ = ("_arg_name",)
+
 	def __init__(self, a_path, extension, arg_name):
 		"""
 		The constructor needs a file path, the expected extension and the name
@@ -19,9 +31,11 @@ class ReactivePathChecker(PathChecker):
 		Args:
 			a_path (pathlib.Path or str): the path that this instance will
 				check
-			extension (str): the extension that the path is supposed to have.
-				If the path is not supposed to have an extension, set this
-				argument to an empty string.
+			extension (str, ExtensionSet or iterable): the extension that the
+				path is supposed to have. If the path is not supposed to have
+				an extension, set this argument to an empty string. If several
+				extensions are allowed, give an ExtensionSet or another
+				collection of strings.
 			arg_name (str): the name of the argument whose value is the
 				checked path
 
@@ -35,9 +49,13 @@ class ReactivePathChecker(PathChecker):
 		return PathChecker.__eq__(self, other)\
 			and self._arg_name == other._arg_name
 
+	def __hash__(self):
+		return hash((self._path, self._extension, self._arg_name))
+
 	def __repr__(self):
-		return self.__class__.__name__ + "('" + str(self._path) + "', '"\
-			+ self._extension + "', '" + self._arg_name + "')"
+		return self.__class__.__name__ + "('" + str(self._path) + "', "\
+			+ repr_expected_extension(self._extension) + ", '"\
+			+ self._arg_name + "')"
 
 	@property
 	def arg_name(self):
@@ -48,18 +66,36 @@ class ReactivePathChecker(PathChecker):
 		"""
 		return self._arg_name
 
+	def check_content_correct(self, cache=None):
+		"""
+		If the content of the file that path points to does not match property
+		extension, this method raises a ValueError.
+
+		Args:
+			cache (ContentSignatureCache): the cache of file headers to use.
+				If it is None, a cache shared by all checkers is used.
+				Defaults to None.
+
+		Raises:
+			ValueError: if self.content_is_correct(cache) returns False
+		"""
+		if not self.content_is_correct(cache):
+			raise ValueError(self.make_status_msg(CheckStatus.WRONG_CONTENT))
+
 	def check_extension_correct(self):
 		"""
 		If path's extension does not match property extension, this method
-		raises a ValueError.
+		raises a ValueError. If several extensions are allowed, the error
+		message lists them.
 
 		Raises:
 			ValueError: if self.extension_is_correct() returns False
 		"""
-		if not self.extension_is_correct():
-			raise ValueError(self._arg_name
-				+ " must be the path to a file with the extension '"
-				+ self._extension + "'.")
+		if self._instrument is not None:
+			return self._instrument.measure("check_extension_correct", self,
+				ReactivePathChecker._check_exten, False)
+
+		self._check_exten()
 
 	def check_path_exists(self):
 		"""
@@ -68,9 +104,11 @@ class ReactivePathChecker(PathChecker):
 		Raises:
 			FileNotFoundError: if self.path_exists() returns False
 		"""
-		if not self.path_exists():
-			raise FileNotFoundError(self._arg_name + ": "
-				+ str(self._path) + " does not exist.")
+		if self._instrument is not None:
+			return self._instrument.measure("check_path_exists", self,
+				ReactivePathChecker._check_exists, False)
+
+		self._check_exists()
 
 	def check_path_is_dir(self):
 		"""
@@ -80,9 +118,11 @@ class ReactivePathChecker(PathChecker):
 		Raises:
 			ValueError: if self.path_is_dir() returns False
 		"""
-		if not self.path_is_dir():
-			raise ValueError(
-				self._arg_name + " must be the path to a directory.")
+		if self._instrument is not None:
+			return self._instrument.measure("check_path_is_dir", self,
+				ReactivePathChecker._check_is_dir, False)
+
+		self._check_is_dir()
 
 	def check_path_is_file(self):
 		"""
@@ -92,25 +132,191 @@ class ReactivePathChecker(PathChecker):
 		Raises:
 			ValueError: if self.path_is_file() returns False
 		"""
-		if not self.path_is_file():
-			raise ValueError(self._arg_name + " must be the path to a file.")
+		if self._instrument is not None:
+			return self._instrument.measure("check_path_is_file", self,
+				ReactivePathChecker._check_is_file, False)
+
+		self._check_is_file()
+
+	def make_status_msg(self, status):
+		"""
+		Makes the message that describes a verification's outcome. For a
+		failure, it is the message of the exception raised by the
+		corresponding check method.
+
+		Args:
+			status (CheckStatus): a status returned by a validate method
 
-	def name_with_correct_exten(self):
+		Returns:
+			str: the message describing status or None if status is OK
+		"""
+		return make_status_msg(
+			status, self._arg_name, self._extension, self._path)
+
+	def name_with_correct_exten(self, extension=None):
 		"""
 		Creates a file name by appending the expected extension to path's stem.
+		If several extensions are allowed, one of them can be chosen.
+
+		Args:
+			extension (str): the allowed extension to append. If it is None,
+				property extension is appended or, if several extensions are
+				allowed, the first of them. Defaults to None.
 
 		Returns:
 			str: path's file name with the expected extension
+
+		Raises:
+			ValueError: if extension is not allowed
 		"""
-		return self.get_file_stem() + self._extension
+		return self.parsed_path.stem + self._choose_extension(extension)
 
-	def path_with_correct_exten(self):
+	def path_with_correct_exten(self, extension=None):
 		"""
 		Creates a file path by replacing path's extension with property
-		extension.
+		extension. If several extensions are allowed, one of them can be
+		chosen.
+
+		Args:
+			extension (str): the allowed extension to use. If it is None,
+				property extension is used or, if several extensions are
+				allowed, the first of them. Defaults to None.
 
 		Returns:
 			pathlib.Path: a path identical to property path, but with the
 				expected extension
+
+		Raises:
+			ValueError: if extension is not allowed
+		"""
+		return self.parsed_path.parent/self.name_with_correct_exten(extension)
+
+	def validate_content(self, cache=None):
+		"""
+		Performs the verification of check_content_correct without raising
+		an exception.
+
+		Args:
+			cache (ContentSignatureCache): the cache of file headers to use.
+				If it is None, a cache shared by all checkers is used.
+				Defaults to None.
+
+		Returns:
+			CheckStatus: OK if the file's content matches property extension,
+				WRONG_CONTENT otherwise
+		"""
+		if self.content_is_correct(cache):
+			return CheckStatus.OK
+
+		return CheckStatus.WRONG_CONTENT
+
+	def validate_extension(self):
+		"""
+		Performs the verification of check_extension_correct without raising
+		an exception.
+
+		Returns:
+			CheckStatus: OK if path's extension is correct, WRONG_EXTENSION
+				otherwise
 		"""
-		return self._path.parents[0]/self.name_with_correct_exten()
+		if self.extension_is_correct():
+			return CheckStatus.OK
+
+		return CheckStatus.WRONG_EXTENSION
+
+	def validate_path_exists(self):
+		"""
+		Performs the verification of check_path_exists without raising an
+		exception.
+
+		Returns:
+			CheckStatus: OK if path exists, PATH_NOT_FOUND otherwise
+		"""
+		if self.path_exists():
+			return CheckStatus.OK
+
+		return CheckStatus.PATH_NOT_FOUND
+
+	def validate_path_is_dir(self):
+		"""
+		Performs the verification of check_path_is_dir without raising an
+		exception.
+
+		Returns:
+			CheckStatus: OK if path is a directory, NOT_A_DIR otherwise
+		"""
+		if self.path_is_dir():
+			return CheckStatus.OK
+
+		return CheckStatus.NOT_A_DIR
+
+	def validate_path_is_file(self):
+		"""
+		Performs the verification of check_path_is_file without raising an
+		exception.
+
+		Returns:
+			CheckStatus: OK if path is a file, NOT_A_FILE otherwise
+		"""
+		if self.path_is_file():
+			return CheckStatus.OK
+
+		return CheckStatus.NOT_A_FILE
+
+	def _check_exten(self):
+		"""
+		Raises a ValueError if path's extension is incorrect, without
+		instrumentation.
+		"""
+		if not self.extension_is_correct():
+			raise ValueError(
+				self.make_status_msg(CheckStatus.WRONG_EXTENSION))
+
+	def _check_exists(self):
+		"""
+		Raises a FileNotFoundError if path does not exist, without
+		instrumentation.
+		"""
+		if not self.path_exists():
+			raise FileNotFoundError(
+				self.make_status_msg(CheckStatus.PATH_NOT_FOUND))
+
+	def _check_is_dir(self):
+		"""
+		Raises a ValueError if path is not a directory, without
+		instrumentation.
+		"""
+		if not self.path_is_dir():
+			raise ValueError(self.make_status_msg(CheckStatus.NOT_A_DIR))
+
+	def _check_is_file(self):
+		"""
+		Raises a ValueError if path is not a file, without instrumentation.
+		"""
+		if not self.path_is_file():
+			raise ValueError(self.make_status_msg(CheckStatus.NOT_A_FILE))
+
+	def _choose_extension(self, extension):
+		"""
+		Determines the extension to give to path.
+
+		Args:
+			extension (str): the chosen extension or None
+
+		Returns:
+			str: the chosen extension or the default one if extension is None
+
+		Raises:
+			ValueError: if extension is not allowed
+		"""
+		if isinstance(self._extension, str):
+			if extension is None or extension == self._extension:
+				return self._extension
+
+		elif extension is None:
+			return self._extension.default
+
+		elif extension in self._extension:
+			return extension
+
+		raise ValueError("Extension '" + extension + "' is not allowed.")
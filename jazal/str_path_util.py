@@ -0,0 +1,150 @@
+"""
+The present module contains functions that give the same results as those of
+module path_util without making pathlib.Path objects. They accept paths as
+strings, os.DirEntry objects or pathlib.PurePath objects and work only with
+string operations, which makes them faster when only the name, the extension
+or the stem of many paths is needed.
+
+As in module path_util, an extension is the concatenation of the suffixes
+given by pathlib.PurePath.suffixes and a stem is a file name without the
+extension.
+"""
+
+
+from os import altsep, sep
+from os.path import splitdrive
+
+
+__all__ = [
+	"get_str_name",
+	"split_name",
+	"str_altered_name",
+	"str_extension",
+	"str_file_stem"
+]
+
+
+def get_str_name(path):
+	"""
+	Provides the name of the file that a path points to, as
+	pathlib.PurePath.name would. If path is a string, its trailing separators
+	and components '.' are ignored.
+
+	Args:
+		path (str, os.DirEntry or pathlib.PurePath): a file path
+
+	Returns:
+		str: the name of the file that path points to
+	"""
+	if not isinstance(path, str):
+		return path.name
+
+	if altsep is not None:
+		path = splitdrive(path.replace(altsep, sep))[1]
+
+	end = len(path)
+
+	while True:
+		while end > 0 and path[end - 1] == sep:
+			end -= 1
+
+		start = path.rfind(sep, 0, end) + 1
+		name = path[start:end]
+
+		if name != ".":
+			return name
+
+		end = start
+
+
+def split_name(name):
+	"""
+	Splits a file name into its stem and its extension. Concatenating the two
+	strings gives the file name back, except if the name starts with dots.
+	The results match functions get_file_stem and extension_to_str of module
+	path_util.
+
+	Args:
+		name (str): a file name, as given by pathlib.PurePath.name
+
+	Returns:
+		tuple: the stem (str) and the extension (str) of name
+	"""
+	if name.endswith("."):
+		return name, ""
+
+	stripped_name = name.lstrip(".")
+	exten_index = stripped_name.find(".")
+
+	if exten_index < 0:
+		return name, ""
+
+	extension = stripped_name[exten_index:]
+	first_suffix_end = extension.find(".", 1)
+	first_suffix = extension if first_suffix_end < 0\
+		else extension[:first_suffix_end]
+
+	# Like path_util.get_file_stem, the stem ends where the first suffix
+	# first occurs.
+	return name[:name.index(first_suffix)], extension
+
+
+def str_altered_name(path, before_stem=None, after_stem=None, extension=None):
+	"""
+	Performs the same operation as function make_altered_name of module
+	path_util without making a pathlib.Path object.
+
+	Args:
+		path (str, os.DirEntry or pathlib.PurePath): the file path that
+			provides the original name
+		before_stem (str): the string to add to the beginning of the path's
+			stem. If it is None, nothing is added to the stem's beginning.
+			Defaults to None.
+		after_stem (str): the string to add to the end of the path's stem. If
+			it is None, nothing is added to the stem's end. Defaults to None.
+		extension (str): the extension to append to the new stem in order to
+			make the name. If None, the extension of argument path is
+			appended. Defaults to None.
+
+	Returns:
+		str: a new file name with the specified additions
+	"""
+	stem, path_exten = split_name(get_str_name(path))
+
+	if before_stem is not None:
+		stem = before_stem + stem
+
+	if after_stem is not None:
+		stem += after_stem
+
+	return stem + (path_exten if extension is None else extension)
+
+
+def str_extension(path):
+	"""
+	Provides the extension of a path like function extension_to_str of module
+	path_util does.
+
+	Args:
+		path (str, os.DirEntry or pathlib.PurePath): the path whose extension
+			is needed
+
+	Returns:
+		str: the path's extension as one string
+	"""
+	return split_name(get_str_name(path))[1]
+
+
+def str_file_stem(path):
+	"""
+	Provides the stem of the file that a path points to like function
+	get_file_stem of module path_util does.
+
+	Args:
+		path (str, os.DirEntry or pathlib.PurePath): the file path whose stem
+			is needed
+
+	Returns:
+		str: the file's stem
+	"""
+	return split_name(get_str_name(path))[0]
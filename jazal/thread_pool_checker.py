@@ -0,0 +1,202 @@
+from collections import deque
+from concurrent.futures import\
+	FIRST_COMPLETED,\
+	ThreadPoolExecutor,\
+	wait
+from os import cpu_count
+
+
+class ThreadPoolChecker:
+	"""
+	This class performs the verifications of many PathChecker or
+	ReactivePathChecker objects concurrently in a thread pool. It is meant for
+	file systems with a high latency, such as network mounts, where most of
+	the time spent by methods like path_exists is waiting for the file system.
+
+	The number of verifications submitted to the pool but not yet consumed is
+	bounded by property max_pending. Results are produced lazily, in the
+	order of the given checkers or in the order of completion.
+
+	This class can be used as a context manager. If it created its own
+	executor, leaving the context shuts it down.
+	"""
+
+	def __init__(self, max_workers=None, max_pending=None, executor=None):
+		"""
+		The constructor creates a ThreadPoolExecutor unless an executor is
+		given.
+
+		Args:
+			max_workers (int): the number of threads of the executor created
+				by this object or, if argument executor is not None, the
+				number of threads of that executor. If it is None, it is set
+				to min(32, number of processors + 4) like ThreadPoolExecutor's
+				default. Defaults to None.
+			max_pending (int): the maximum number of verifications submitted
+				to the executor and not yet consumed. If it is None, it is set
+				to four times max_workers. Defaults to None.
+			executor (concurrent.futures.Executor): an executor that this
+				object will use instead of creating one. This object will not
+				shut it down. Defaults to None.
+
+		Raises:
+			ValueError: if max_workers or max_pending is smaller than 1
+		"""
+		if max_workers is None:
+			max_workers = min(32, (cpu_count() or 1) + 4)
+
+		elif max_workers < 1:
+			raise ValueError("The number of workers must be at least 1.")
+
+		if max_pending is None:
+			max_pending = 4 * max_workers
+
+		elif max_pending < 1:
+			raise ValueError("The maximum number of pending verifications "
+				+ "must be at least 1.")
+
+		if executor is None:
+			self._executor = ThreadPoolExecutor(max_workers=max_workers)
+			self._owns_executor = True
+		else:
+			self._executor = executor
+			self._owns_executor = False
+
+		self._max_workers = max_workers
+		self._max_pending = max_pending
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.shutdown()
+
+	def check(self, checkers, checks, ordered=True):
+		"""
+		Calls methods of ReactivePathChecker such as check_path_exists on each
+		checker. For a given checker, the methods are called in the order of
+		argument checks and the first one that raises an exception stops the
+		verification. The exceptions are exactly those that the methods raise.
+
+		Args:
+			checkers (iterable): ReactivePathChecker objects
+			checks (sequence): functions taking a checker as their only
+				argument, such as ReactivePathChecker.check_path_exists
+			ordered (bool): if True, the results are generated in the order of
+				checkers. If False, they are generated as soon as they are
+				available. Defaults to True.
+
+		Returns:
+			generator: tuples containing a checker and the exception raised
+				by its verification or None if all checks passed
+		"""
+		checks = tuple(checks)
+
+		def run_checks(checker):
+			try:
+				for check in checks:
+					check(checker)
+
+			except Exception as e:
+				return e
+
+			return None
+
+		return self.map(run_checks, checkers, ordered)
+
+	def map(self, function, checkers, ordered=True):
+		"""
+		Calls a function, typically a method of PathChecker such as
+		path_exists, on each checker. If the function raises an exception, it
+		is raised again when the corresponding result is generated.
+
+		Args:
+			function (callable): a function taking a checker as its only
+				argument, such as PathChecker.path_exists
+			checkers (iterable): PathChecker objects
+			ordered (bool): if True, the results are generated in the order of
+				checkers. If False, they are generated as soon as they are
+				available. Defaults to True.
+
+		Returns:
+			generator: tuples containing a checker and the value that function
+				returned for it
+		"""
+		if ordered:
+			return self._map_ordered(function, checkers)
+
+		return self._map_unordered(function, checkers)
+
+	@property
+	def max_pending(self):
+		"""
+		This read-only property is the maximum number (int) of verifications
+		submitted to the executor and not yet consumed.
+		"""
+		return self._max_pending
+
+	@property
+	def max_workers(self):
+		"""
+		This read-only property is the number (int) of threads of the
+		executor.
+		"""
+		return self._max_workers
+
+	def shutdown(self):
+		"""
+		Shuts down the executor if this object created it. Otherwise, this
+		method does nothing.
+		"""
+		if self._owns_executor:
+			self._executor.shutdown()
+
+	def _map_ordered(self, function, checkers):
+		"""
+		Generates the results of method map in the order of the checkers.
+		"""
+		pending = deque()
+
+		for checker in checkers:
+			if len(pending) >= self._max_pending:
+				yield _pop_result(pending.popleft())
+
+			pending.append(
+				(checker, self._executor.submit(function, checker)))
+
+		while len(pending) > 0:
+			yield _pop_result(pending.popleft())
+
+	def _map_unordered(self, function, checkers):
+		"""
+		Generates the results of method map in the order of completion.
+		"""
+		pending = dict()
+
+		for checker in checkers:
+			if len(pending) >= self._max_pending:
+				done, _ = wait(pending, return_when=FIRST_COMPLETED)
+				for future in done:
+					yield _pop_result((pending.pop(future), future))
+
+			pending[self._executor.submit(function, checker)] = checker
+
+		while len(pending) > 0:
+			done, _ = wait(pending, return_when=FIRST_COMPLETED)
+			for future in done:
+				yield _pop_result((pending.pop(future), future))
+
+
+def _pop_result(checker_and_future):
+	"""
+	Waits for a future and pairs its result with the checker it concerns.
+
+	Args:
+		checker_and_future (tuple): a checker and the future of the function
+			called on it
+
+	Returns:
+		tuple: the checker and the future's result
+	"""
+	checker, future = checker_and_future
+	return checker, future.result()
@@ -0,0 +1,307 @@
+from collections import deque
+from os import fspath, scandir
+from pathlib import Path
+from queue import SimpleQueue
+from threading import Condition, Thread
+from .check_status import\
+	CheckStatus,\
+	make_status_msg
+from .extension_set import\
+	extension_matches,\
+	repr_expected_extension,\
+	to_expected_extension
+from .reactive_path_checker import ReactivePathChecker
+from .str_path_util import split_name
+
+
+class TreeValidator:
+	"""
+	This class verifies that every file in a directory tree is a file with the
+	expected extension (property extension), as PathChecker's methods
+	path_is_file and extension_is_correct would. The tree is walked with
+	os.scandir and the type of each entry is given by its os.DirEntry, so that
+	no entry is queried with os.stat, except symbolic links.
+
+	The subdirectories are listed in parallel by a pool of threads. Each
+	thread has a deque of directories to list. It lists the last directory of
+	its own deque and, when that deque is empty, steals the first directory of
+	another thread's deque. The violations are generated as soon as a
+	directory has been listed, in no particular order.
+
+	Each violation is described by a message in the style of
+	ReactivePathChecker where the path takes the place of the argument's
+	name. Symbolic links to directories are not followed. They are reported
+	as violations because they are not files. Directories that cannot be
+	listed, for instance because of their permissions or because they were
+	deleted during the walk, are reported as violations with status
+	NOT_LISTABLE, since the files that they contain could not be verified.
+	"""
+
+	__slots__ = ("_extension", "_max_workers")
+
+	def __init__(self, extension, max_workers=8):
+		"""
+		The constructor needs the extension that the files are supposed to
+		have and the number of threads.
+
+		Args:
+			extension (str, ExtensionSet or iterable): the extension that the
+				files are supposed to have. If they are not supposed to have
+				an extension, set this argument to an empty string. If several
+				extensions are allowed, give an ExtensionSet or another
+				collection of strings.
+			max_workers (int): the number of threads that list directories.
+				Defaults to 8.
+
+		Raises:
+			ValueError: if max_workers is smaller than 1
+		"""
+		if max_workers < 1:
+			raise ValueError("The number of workers must be at least 1.")
+
+		self._extension = to_expected_extension(extension)
+		self._max_workers = max_workers
+
+	def __repr__(self):
+		return self.__class__.__name__ + "("\
+			+ repr_expected_extension(self._extension) + ", "\
+			+ str(self._max_workers) + ")"
+
+	@property
+	def extension(self):
+		"""
+		This read-only property is the extension (str) that the files are
+		supposed to have. If they are not supposed to have an extension, this
+		property is an empty string. If several extensions are allowed, this
+		property is an ExtensionSet.
+		"""
+		return self._extension
+
+	@property
+	def max_workers(self):
+		"""
+		This read-only property is the number (int) of threads that list
+		directories.
+		"""
+		return self._max_workers
+
+	def validate(self, root):
+		"""
+		Walks a directory tree and generates its violations. If the generator
+		is closed before the walk ends, the threads stop after the directories
+		that they are listing.
+
+		Args:
+			root (pathlib.Path or str): the path to the tree's root directory
+
+		Returns:
+			generator: tuples containing the path (pathlib.Path) of an invalid
+				entry, its CheckStatus (WRONG_EXTENSION, NOT_A_FILE or
+				NOT_LISTABLE) and a message describing the violation
+
+		Raises:
+			ValueError: if root is not the path to a directory
+		"""
+		ReactivePathChecker(root, "", "root").check_path_is_dir()
+		return self._generate_violations(fspath(root))
+
+	def _generate_violations(self, root):
+		"""
+		Runs the walk and generates the violations found by the threads.
+		"""
+		walk = _TreeWalk(self._extension, self._max_workers)
+		walk.start(root)
+
+		try:
+			for path, status in walk.iter_violations():
+				path = Path(path)
+				yield path, status, make_status_msg(
+					status, str(path), self._extension, path)
+
+		finally:
+			walk.stop()
+
+
+class _TreeWalk:
+	"""
+	This class holds the state of one walk of TreeValidator: the threads'
+	deques of directories, the number of directories queued or being listed
+	and the queue of violations.
+	"""
+
+	__slots__ = ("_condition", "_deques", "_extension", "_outstanding",
+		"_results", "_stopped", "_threads")
+
+	def __init__(self, extension, worker_count):
+		self._condition = Condition()
+		self._deques = [deque() for _ in range(worker_count)]
+		self._extension = extension
+		self._outstanding = 0
+		self._results = SimpleQueue()
+		self._stopped = False
+		self._threads = [Thread(target=self._work, args=(i,), daemon=True)
+			for i in range(worker_count)]
+
+	def iter_violations(self):
+		"""
+		Generates the violations found by the threads until all of them have
+		finished.
+
+		Returns:
+			generator: tuples containing the path (str) of an invalid entry
+				and its CheckStatus
+		"""
+		running_count = len(self._threads)
+
+		while running_count > 0:
+			violations = self._results.get()
+
+			if violations is None:
+				running_count -= 1
+
+			else:
+				yield from violations
+
+	def start(self, root):
+		"""
+		Queues the root directory and starts the threads.
+
+		Args:
+			root (str): the path to the tree's root directory
+		"""
+		self._push(0, root)
+
+		for thread in self._threads:
+			thread.start()
+
+	def stop(self):
+		"""
+		Makes the threads stop and waits for them.
+		"""
+		with self._condition:
+			self._stopped = True
+			self._condition.notify_all()
+
+		for thread in self._threads:
+			thread.join()
+
+	def _finish_dir(self):
+		"""
+		Records that a directory has been listed and wakes the idle threads
+		if it was the last one.
+		"""
+		with self._condition:
+			self._outstanding -= 1
+
+			if self._outstanding == 0:
+				self._condition.notify_all()
+
+	def _list_dir(self, index, dir_path):
+		"""
+		Lists a directory, queues its subdirectories in the deque of thread
+		index and sends its violations to the queue of results. If the
+		directory cannot be listed entirely, it is a violation itself.
+
+		Args:
+			index (int): the number of the thread listing the directory
+			dir_path (str): the path to the directory
+		"""
+		extension = self._extension
+		violations = list()
+
+		try:
+			with scandir(dir_path) as entries:
+				for entry in entries:
+					if entry.is_dir(follow_symlinks=False):
+						self._push(index, entry.path)
+
+					elif not extension_matches(
+							split_name(entry.name)[1], extension):
+						violations.append(
+							(entry.path, CheckStatus.WRONG_EXTENSION))
+
+					elif not entry.is_file():
+						violations.append(
+							(entry.path, CheckStatus.NOT_A_FILE))
+
+		except OSError:
+			violations.append((dir_path, CheckStatus.NOT_LISTABLE))
+
+		if len(violations) > 0:
+			self._results.put(violations)
+
+	def _next_dir(self, index):
+		"""
+		Takes the next directory to list for thread index: the last one of its
+		own deque or the first one of another thread's deque. If all deques
+		are empty, the thread waits until a directory is queued or the walk
+		ends.
+
+		Args:
+			index (int): the number of the thread
+
+		Returns:
+			str: the path to a directory or None if the walk has ended
+		"""
+		deques = self._deques
+		own_deque = deques[index]
+
+		while not self._stopped:
+			try:
+				return own_deque.pop()
+
+			except IndexError:
+				pass
+
+			for offset in range(1, len(deques)):
+				try:
+					return deques[(index + offset) % len(deques)].popleft()
+
+				except IndexError:
+					pass
+
+			with self._condition:
+				if self._stopped or self._outstanding == 0:
+					return None
+
+				if not any(deques):
+					self._condition.wait()
+
+		return None
+
+	def _push(self, index, dir_path):
+		"""
+		Queues a directory in the deque of thread index.
+
+		Args:
+			index (int): the number of the thread that found the directory
+			dir_path (str): the path to the directory
+		"""
+		with self._condition:
+			self._deques[index].append(dir_path)
+			self._outstanding += 1
+			self._condition.notify()
+
+	def _work(self, index):
+		"""
+		Lists directories until the walk ends, then sends None to the queue of
+		results.
+
+		Args:
+			index (int): the number of the thread
+		"""
+		try:
+			while True:
+				dir_path = self._next_dir(index)
+
+				if dir_path is None:
+					break
+
+				try:
+					self._list_dir(index, dir_path)
+
+				finally:
+					self._finish_dir()
+
+		finally:
+			self._results.put(None)
@@ -30,6 +30,7 @@ setuptools.setup(
 		"Topic :: Utilities"
 	],
 	packages = setuptools.find_packages(),
+	python_requires = ">=3.7",
 	license = "MIT",
 	license_files = ("LICENSE",)
 )
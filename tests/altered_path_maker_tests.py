@@ -0,0 +1,77 @@
+import pytest
+from jazal import\
+	AlteredPathMaker,\
+	ParsedPath,\
+	make_altered_name,\
+	make_altered_path
+from pathlib import Path
+
+
+PATHS = (
+	Path("some_dir/gugusse.docx"),
+	Path("some_dir/archive.tar.gz"),
+	Path("other_dir/gugusse.pdf"),
+	Path("noexten"))
+
+
+def test_init():
+	apm = AlteredPathMaker(after_stem="_out", extension=".txt")
+	assert apm.before_stem is None
+	assert apm.after_stem == "_out"
+	assert apm.extension == ".txt"
+
+
+def test_repr():
+	apm = AlteredPathMaker("a", None, ".txt")
+	assert repr(apm) == "AlteredPathMaker('a', None, '.txt')"
+
+
+def test_names_match_path_util():
+	for before, after, exten in (
+			(None, None, None), ("a", "b", None), (None, "_x", ".pdf")):
+		apm = AlteredPathMaker(before, after, exten)
+		assert apm.make_names(PATHS)\
+			== [make_altered_name(p, before, after, exten) for p in PATHS]
+
+
+def test_paths_match_path_util():
+	apm = AlteredPathMaker("a", "b", ".pdf")
+	assert apm.make_paths(PATHS)\
+		== [make_altered_path(p, "a", "b", ".pdf") for p in PATHS]
+
+
+def test_parsed_paths():
+	apm = AlteredPathMaker(after_stem="_out")
+	parsed_paths = [ParsedPath(p) for p in PATHS]
+	assert apm.make_paths(parsed_paths) == apm.make_paths(PATHS)
+
+
+def test_lazy():
+	def paths():
+		yield Path("some_dir/gugusse.docx")
+		raise RuntimeError("The second path must not be requested.")
+
+	apm = AlteredPathMaker(after_stem="_out")
+	assert next(apm.iter_names(paths())) == "gugusse_out.docx"
+	assert next(apm.iter_paths(paths())) == Path("some_dir/gugusse_out.docx")
+
+
+def test_no_collisions():
+	apm = AlteredPathMaker(after_stem="_out")
+	assert apm.find_collisions(PATHS) == dict()
+
+
+def test_collisions():
+	paths = PATHS + (Path("some_dir/gugusse.odt"), Path("some_dir/gugusse"))
+	apm = AlteredPathMaker(extension=".txt")
+	collisions = apm.find_collisions(paths)
+	assert collisions == {Path("some_dir/gugusse.txt"): [
+		Path("some_dir/gugusse.docx"), Path("some_dir/gugusse.odt"),
+		Path("some_dir/gugusse")]}
+
+
+def test_collisions_duplicate_source():
+	apm = AlteredPathMaker(after_stem="_out")
+	path = Path("some_dir/gugusse.docx")
+	assert apm.find_collisions([path, path])\
+		== {Path("some_dir/gugusse_out.docx"): [path, path]}
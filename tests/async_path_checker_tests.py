@@ -0,0 +1,86 @@
+import pytest
+from asyncio import gather, run
+from jazal import\
+	AsyncPathChecker,\
+	PathChecker,\
+	ReactivePathChecker
+
+
+def test_init_max_concurrency_exception():
+	with pytest.raises(ValueError):
+		AsyncPathChecker(max_concurrency=0)
+
+
+def test_predicates():
+	apc = AsyncPathChecker(max_concurrency=2)
+	pc_file = PathChecker("some_dir/un_fichier_pdf.pdf", ".pdf")
+	pc_dir = PathChecker("some_dir", "")
+	pc_none = PathChecker("ajxoj/io.txt", ".pdf")
+
+	async def check():
+		return await gather(
+			apc.path_exists(pc_file), apc.path_is_file(pc_file),
+			apc.path_is_dir(pc_file), apc.path_is_dir(pc_dir),
+			apc.path_exists(pc_none))
+
+	assert run(check()) == [True, True, False, True, False]
+
+
+def test_check_path_exists():
+	apc = AsyncPathChecker()
+	rpc = ReactivePathChecker("ajxoj/io.txt", ".pdf", "awesomeArg")
+	with pytest.raises(FileNotFoundError) as exc_info:
+		run(apc.check_path_exists(rpc))
+
+	with pytest.raises(FileNotFoundError) as sync_exc_info:
+		rpc.check_path_exists()
+
+	assert str(exc_info.value) == str(sync_exc_info.value)
+
+
+def test_check_path_is_dir():
+	apc = AsyncPathChecker()
+	rpc = ReactivePathChecker(
+		"some_dir/un_fichier_pdf.pdf", ".pdf", "awesomeArg")
+	except_msg = "awesomeArg must be the path to a directory."
+	with pytest.raises(ValueError, match = except_msg):
+		run(apc.check_path_is_dir(rpc))
+
+
+def test_check_path_is_file():
+	apc = AsyncPathChecker()
+	rpc = ReactivePathChecker("some_dir", "", "awesomeArg")
+	except_msg = "awesomeArg must be the path to a file."
+	with pytest.raises(ValueError, match = except_msg):
+		run(apc.check_path_is_file(rpc))
+
+
+def test_check_extension_correct():
+	apc = AsyncPathChecker()
+	rpc = ReactivePathChecker("ajxoj/io.txt", ".pdf", "awesomeArg")
+	except_msg =\
+		"awesomeArg must be the path to a file with the extension '.pdf'."
+	with pytest.raises(ValueError, match = except_msg):
+		run(apc.check_extension_correct(rpc))
+
+
+def test_check_passes():
+	apc = AsyncPathChecker()
+	rpc = ReactivePathChecker(
+		"some_dir/un_fichier_pdf.pdf", ".pdf", "awesomeArg")
+	assert run(apc.check_path_exists(rpc)) is None
+	assert run(AsyncPathChecker().check_path_is_file(rpc)) is None
+
+
+def test_check_all():
+	apc = AsyncPathChecker(max_concurrency=1)
+	checkers = [
+		ReactivePathChecker("some_dir/un_fichier_pdf.pdf", ".pdf", "arg0"),
+		ReactivePathChecker("ajxoj/io.pdf", ".pdf", "arg1"),
+		ReactivePathChecker("some_dir", ".pdf", "arg2")]
+	checks = (ReactivePathChecker.check_path_exists,
+		ReactivePathChecker.check_path_is_file)
+	errors = run(apc.check_all(checkers, checks))
+	assert errors[0] is None
+	assert isinstance(errors[1], FileNotFoundError)
+	assert str(errors[2]) == "arg2 must be the path to a file."
@@ -0,0 +1,93 @@
+import pytest
+from jazal import BatchPathChecker, PathChecker
+from pathlib import Path
+
+
+PATHS = (
+	"some_dir/un_fichier_pdf.pdf",
+	"some_dir",
+	"ajxoj/io.txt",
+	"ajxoj/io.tar.gz",
+	Path("ajxoj/io"))
+
+
+def to_bools(results):
+	return [bool(result) for result in results]
+
+
+def assert_matches_path_checkers(paths, extension):
+	bpc = BatchPathChecker(paths, extension)
+	checkers = [PathChecker(path, extension) for path in paths]
+	assert to_bools(bpc.extension_is_correct())\
+		== [pc.extension_is_correct() for pc in checkers]
+	assert to_bools(bpc.path_exists())\
+		== [pc.path_exists() for pc in checkers]
+	assert to_bools(bpc.path_is_dir())\
+		== [pc.path_is_dir() for pc in checkers]
+	assert to_bools(bpc.path_is_file())\
+		== [pc.path_is_file() for pc in checkers]
+
+
+def test_init():
+	bpc = BatchPathChecker(PATHS, ".pdf")
+	assert len(bpc) == 5
+	assert bpc.extension == ".pdf"
+	assert bpc[0] == Path("some_dir/un_fichier_pdf.pdf")
+	assert bpc.paths[4] == Path("ajxoj/io")
+
+
+def test_init_path_exception():
+	except_msg = "The given path must be an instance of pathlib.Path or str."
+	with pytest.raises(TypeError, match = except_msg):
+		bpc = BatchPathChecker(["ajxoj/io.txt", 3.14159], ".pdf")
+
+
+def test_repr():
+	bpc = BatchPathChecker(PATHS, ".pdf")
+	assert repr(bpc) == "BatchPathChecker(<5 paths>, '.pdf')"
+
+
+def test_empty():
+	bpc = BatchPathChecker([], ".pdf")
+	assert len(bpc.path_exists()) == 0
+	assert len(bpc.extension_is_correct()) == 0
+
+
+def test_exten_is_correct():
+	bpc = BatchPathChecker(PATHS, ".tar.gz")
+	assert to_bools(bpc.extension_is_correct())\
+		== [False, False, False, True, False]
+
+
+def test_path_exists():
+	bpc = BatchPathChecker(PATHS, ".pdf")
+	assert to_bools(bpc.path_exists()) == [True, True, False, False, False]
+
+
+def test_path_is_dir():
+	bpc = BatchPathChecker(PATHS, ".pdf")
+	assert to_bools(bpc.path_is_dir()) == [False, True, False, False, False]
+
+
+def test_path_is_file():
+	bpc = BatchPathChecker(PATHS, ".pdf")
+	assert to_bools(bpc.path_is_file()) == [True, False, False, False, False]
+
+
+def test_matches_path_checker_pdf():
+	assert_matches_path_checkers(PATHS, ".pdf")
+
+
+def test_matches_path_checker_no_exten():
+	assert_matches_path_checkers(PATHS, "")
+
+
+def test_refresh(tmp_path):
+	file_path = tmp_path/"io.txt"
+	bpc = BatchPathChecker([file_path], ".txt")
+	assert to_bools(bpc.path_exists()) == [False]
+	file_path.write_text("io")
+	assert to_bools(bpc.path_exists()) == [False]
+	bpc.refresh()
+	assert to_bools(bpc.path_exists()) == [True]
+	assert to_bools(bpc.path_is_file()) == [True]
@@ -0,0 +1,118 @@
+import pytest
+from jazal import\
+	CheckPlan,\
+	CheckStatus,\
+	MissingPathArgWarner,\
+	ReactivePathChecker
+from pathlib import Path
+
+
+CHECKS = {
+	"exists": ReactivePathChecker.check_path_exists,
+	"dir": ReactivePathChecker.check_path_is_dir,
+	"file": ReactivePathChecker.check_path_is_file,
+	"exten": ReactivePathChecker.check_extension_correct
+}
+PATHS = ("some_dir", "some_dir/un_fichier_pdf.pdf", "ajxoj/io.txt",
+	"ajxoj/io.pdf", Path("some_dir/un_fichier_pdf.pdf"))
+
+
+def test_init_exception():
+	with pytest.raises(ValueError):
+		CheckPlan("arg", ".pdf", must_be_dir=True, must_be_file=True)
+
+
+def test_repr():
+	plan = CheckPlan("arg", ".pdf", must_be_file=True)
+	assert repr(plan) == "CheckPlan('arg', '.pdf', True, False, True)"
+
+
+def test_validate_file():
+	plan = CheckPlan("arg", ".pdf", must_be_file=True)
+	assert plan.validate("some_dir/un_fichier_pdf.pdf") is CheckStatus.OK
+	assert plan.validate("ajxoj/io.txt") is CheckStatus.WRONG_EXTENSION
+	assert plan.validate("ajxoj/io.pdf") is CheckStatus.PATH_NOT_FOUND
+
+
+def test_validate_dir():
+	plan = CheckPlan("arg", "", must_be_dir=True)
+	assert plan.validate("some_dir") is CheckStatus.OK
+	assert plan.validate(Path("some_dir")) is CheckStatus.OK
+	assert plan.validate("some_dir/un_fichier_pdf.pdf")\
+		is CheckStatus.WRONG_EXTENSION
+
+
+def test_validate_not_dir():
+	plan = CheckPlan("arg", ".pdf", must_be_dir=True)
+	assert plan.validate("some_dir/un_fichier_pdf.pdf")\
+		is CheckStatus.NOT_A_DIR
+
+
+def test_validate_may_not_exist():
+	plan = CheckPlan("arg", ".pdf", must_exist=False)
+	assert plan.validate("ajxoj/io.pdf") is CheckStatus.OK
+	plan = CheckPlan("arg", ".pdf", must_exist=False, must_be_file=True)
+	assert plan.validate("ajxoj/io.pdf") is CheckStatus.NOT_A_FILE
+
+
+def test_extension_checked_without_stat(monkeypatch):
+	import jazal.check_plan
+
+	def fail_stat(path):
+		raise AssertionError("The file system was queried.")
+
+	monkeypatch.setattr(jazal.check_plan, "stat_or_none", fail_stat)
+	plan = CheckPlan("arg", ".pdf", must_be_file=True)
+	assert plan.validate("some_dir/io.txt") is CheckStatus.WRONG_EXTENSION
+
+
+def test_messages_match_reactive_path_checker():
+	plans_and_checks = (
+		(CheckPlan("arg", ".pdf", must_be_file=True),
+			("exten", "exists", "file")),
+		(CheckPlan("arg", "", must_be_dir=True), ("exten", "exists", "dir")),
+		(CheckPlan("arg", (".pdf", ".txt")), ("exten", "exists")))
+
+	for plan, check_names in plans_and_checks:
+		for path in PATHS:
+			rpc = ReactivePathChecker(path, plan.extension, plan.arg_name)
+			expected_msg = None
+
+			for check_name in check_names:
+				try:
+					CHECKS[check_name](rpc)
+
+				except (FileNotFoundError, ValueError) as e:
+					expected_msg = str(e)
+					expected_type = type(e)
+					break
+
+			status = plan.validate(path)
+			assert plan.make_status_msg(path, status) == expected_msg
+
+			if expected_msg is None:
+				plan.check(path)
+
+			else:
+				with pytest.raises(expected_type) as error_info:
+					plan.check(path)
+
+				assert str(error_info.value) == expected_msg
+
+
+def test_validate_all():
+	plan = CheckPlan("arg", ".pdf", must_be_file=True)
+	statuses = plan.validate_all(PATHS)
+	assert list(statuses) == [CheckStatus.WRONG_EXTENSION, CheckStatus.OK,
+		CheckStatus.WRONG_EXTENSION, CheckStatus.PATH_NOT_FOUND,
+		CheckStatus.OK]
+
+
+def test_make_check_plan():
+	warner = MissingPathArgWarner("arg", ".pdf")
+	plan = warner.make_check_plan(must_be_file=True)
+	assert plan.arg_name == "arg"
+	assert plan.extension == ".pdf"
+	assert plan.must_exist
+	assert plan.must_be_file
+	assert not plan.must_be_dir
@@ -0,0 +1,20 @@
+from jazal import CheckStatus
+
+
+def test_ok_is_false():
+	assert not CheckStatus.OK
+	assert all(status
+		for status in CheckStatus if status is not CheckStatus.OK)
+
+
+def test_compact_values():
+	assert bytearray(CheckStatus) == bytearray(range(len(CheckStatus)))
+
+
+def test_error_type():
+	assert CheckStatus.OK.error_type is None
+	assert CheckStatus.WRONG_EXTENSION.error_type is ValueError
+	assert CheckStatus.PATH_NOT_FOUND.error_type is FileNotFoundError
+	assert CheckStatus.NOT_A_DIR.error_type is ValueError
+	assert CheckStatus.NOT_A_FILE.error_type is ValueError
+	assert CheckStatus.NOT_LISTABLE.error_type is OSError
@@ -0,0 +1,20 @@
+import pytest
+from jazal import PathChecker
+
+
+@pytest.fixture
+def make_checker():
+	def make_checker(path, lookup):
+		pc = PathChecker(path, "")
+		pc.set_lookup(lookup)
+		return pc
+
+	return make_checker
+
+
+@pytest.fixture
+def tree(tmp_path):
+	(tmp_path/"a_dir").mkdir()
+	(tmp_path/"a_file.txt").write_text("a")
+	(tmp_path/"a_dir"/"b_file.pdf").write_text("b")
+	return tmp_path
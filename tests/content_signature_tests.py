@@ -0,0 +1,70 @@
+import pytest
+from jazal import\
+	ContentSignatureCache,\
+	ExtensionSet,\
+	header_matches,\
+	read_header
+from jazal.content_signature import HEADER_SIZE
+
+
+PDF_PATH = "some_dir/un_fichier_pdf.pdf"
+
+
+def test_init_exception():
+	with pytest.raises(ValueError):
+		ContentSignatureCache(max_files=0)
+
+
+def test_read_header():
+	header = read_header(PDF_PATH)
+	assert header.startswith(b"%PDF-")
+	assert len(header) == HEADER_SIZE
+	assert read_header(PDF_PATH, 4) == b"%PDF"
+
+
+def test_read_header_short_file(tmp_path):
+	path = tmp_path/"short.bin"
+	path.write_bytes(b"\x1f\x8b")
+	assert read_header(path) == b"\x1f\x8b"
+
+
+def test_header_matches():
+	assert header_matches(b"%PDF-1.7", ".pdf")
+	assert not header_matches(b"%PDF-1.7", ".png")
+	assert header_matches(b"PK\x03\x04", ".zip")
+	assert header_matches(b"PK\x03\x04", ".docx")
+	assert header_matches(b"\x1f\x8b\x08", ".tar.gz")
+	assert header_matches(b"\x89PNG\r\n\x1a\n", ".png")
+	assert header_matches(b"\x00" * 257 + b"ustar", ".tar")
+
+
+def test_header_matches_unknown_extension():
+	assert header_matches(b"whatever", ".txt")
+	assert header_matches(b"whatever", "")
+
+
+def test_content_matches():
+	cache = ContentSignatureCache()
+	assert cache.content_matches(PDF_PATH, ".pdf")
+	assert not cache.content_matches(PDF_PATH, ".zip")
+	assert cache.content_matches(PDF_PATH, ExtensionSet((".zip", ".pdf")))
+	assert not cache.content_matches("some_dir", ".pdf")
+	assert not cache.content_matches("ajxoj/io.pdf", ".pdf")
+
+
+def test_cache(tmp_path):
+	cache = ContentSignatureCache(max_files=1)
+	path = tmp_path/"a_file.pdf"
+	path.write_bytes(b"%PDF-1.4")
+	assert cache.content_matches(path, ".pdf")
+	assert cache.content_matches(path, ".pdf")
+	assert cache.read_count == 1
+	assert len(cache) == 1
+
+	path.write_bytes(b"PK\x03\x04 not a PDF anymore")
+	assert not cache.content_matches(path, ".pdf")
+	assert cache.read_count == 2
+	assert len(cache) == 1
+
+	cache.clear()
+	assert len(cache) == 0
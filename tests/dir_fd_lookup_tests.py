@@ -0,0 +1,129 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from jazal import DirFdLookup
+from pathlib import Path
+from shutil import rmtree
+
+
+def test_init_exceptions():
+	with pytest.raises(ValueError):
+		DirFdLookup(max_fds=0)
+
+	with pytest.raises(ValueError):
+		DirFdLookup(revalidation_delay=-1)
+
+
+def test_one_open_per_dir(tree, make_checker):
+	with DirFdLookup() as lookup:
+		for name in ("a_dir", "a_file.txt", "x", "y", "z"):
+			pc = make_checker(tree/name, lookup)
+			pc.path_exists()
+			pc.path_is_file()
+
+		assert lookup.open_count == 1
+		assert len(lookup) == 1
+
+
+def test_max_fds(tmp_path):
+	dirs = [tmp_path/str(i) for i in range(5)]
+
+	for a_dir in dirs:
+		a_dir.mkdir()
+
+	with DirFdLookup(max_fds=2) as lookup:
+		for a_dir in dirs:
+			assert not lookup.path_exists(a_dir/"x")
+
+		assert len(lookup) == 2
+		assert lookup.open_count == 5
+		lookup.path_exists(dirs[-1]/"y")
+		assert lookup.open_count == 5
+		lookup.path_exists(dirs[0]/"y")
+		assert lookup.open_count == 6
+
+
+def test_siblings_consistent_during_rename(tree):
+	names = ["c_file_" + str(i) + ".txt" for i in range(10)]
+
+	for name in names:
+		(tree/"a_dir"/name).write_text("c")
+
+	with DirFdLookup(revalidation_delay=None) as lookup:
+		results = [lookup.path_is_file(tree/"a_dir"/names[0])]
+		(tree/"a_dir").rename(tree/"moved_dir")
+
+		try:
+			results.extend(lookup.path_is_file(tree/"a_dir"/name)
+				for name in names[1:])
+
+		finally:
+			(tree/"moved_dir").rename(tree/"a_dir")
+
+		assert results == [True] * len(names)
+		assert lookup.open_count == 1
+
+
+def test_dir_recreated(tree, make_checker):
+	with DirFdLookup(revalidation_delay=0) as lookup:
+		pc = make_checker(tree/"a_dir"/"result.txt", lookup)
+		assert not pc.path_exists()
+		rmtree(tree/"a_dir")
+		(tree/"a_dir").mkdir()
+		(tree/"a_dir"/"result.txt").write_text("r")
+		assert pc.path_exists()
+		assert lookup.open_count == 2
+
+
+def test_dir_replaced(tree):
+	with DirFdLookup(revalidation_delay=0) as lookup:
+		assert lookup.path_is_file(tree/"a_dir"/"b_file.pdf")
+		(tree/"a_dir").rename(tree/"moved_dir")
+		(tree/"a_dir").mkdir()
+		assert not lookup.path_exists(tree/"a_dir"/"b_file.pdf")
+		assert lookup.open_count == 2
+
+
+def test_working_dir_changed(tree, monkeypatch):
+	(tree/"a_dir"/"a_dir").mkdir()
+
+	with DirFdLookup(revalidation_delay=0) as lookup:
+		monkeypatch.chdir(tree)
+		assert lookup.path_is_file(Path("a_dir/b_file.pdf"))
+		monkeypatch.chdir(tree/"a_dir")
+		assert not lookup.path_exists(Path("a_dir/b_file.pdf"))
+
+
+def test_invalidate(tree):
+	with DirFdLookup(revalidation_delay=None) as lookup:
+		assert lookup.path_is_file(tree/"a_dir"/"b_file.pdf")
+		(tree/"a_dir").rename(tree/"moved_dir")
+		(tree/"a_dir").mkdir()
+		lookup.invalidate(tree/"a_dir")
+		assert len(lookup) == 0
+		assert not lookup.path_exists(tree/"a_dir"/"b_file.pdf")
+
+
+def test_clear(tree):
+	lookup = DirFdLookup()
+	lookup.path_exists(tree/"a_file.txt")
+	lookup.path_exists(tree/"a_dir"/"b_file.pdf")
+	assert len(lookup) == 2
+	lookup.clear()
+	assert len(lookup) == 0
+	assert lookup.path_is_file(tree/"a_file.txt")
+	assert lookup.open_count == 3
+	lookup.clear()
+
+
+def test_queries_during_clear(tree):
+	paths = [tree/"a_file.txt", tree/"a_dir"/"b_file.pdf",
+		tree/"a_dir"/"x"] * 200
+
+	with DirFdLookup(max_fds=1) as lookup:
+		with ThreadPoolExecutor(max_workers=2) as executor:
+			clearing = executor.submit(
+				lambda: [lookup.clear() for _ in range(200)])
+			results = [lookup.path_is_file(path) for path in paths]
+			clearing.result()
+
+	assert results == [True, True, False] * 200
@@ -0,0 +1,75 @@
+import pytest
+from jazal import DirectoryIndex
+from time import sleep
+
+
+def test_init_exceptions():
+	with pytest.raises(ValueError):
+		DirectoryIndex(max_dirs=0)
+
+	with pytest.raises(ValueError):
+		DirectoryIndex(revalidation_delay=-1)
+
+
+def test_one_scan_per_dir(tree, make_checker):
+	index = DirectoryIndex()
+
+	for name in ("a_dir", "a_file.txt", "x", "y", "z"):
+		pc = make_checker(tree/name, index)
+		pc.path_exists()
+		pc.path_is_file()
+
+	assert index.scan_count == 1
+	assert len(index) == 1
+
+
+def test_lru_eviction(tree, make_checker):
+	index = DirectoryIndex(max_dirs=1)
+	make_checker(tree/"a_file.txt", index).path_exists()
+	make_checker(tree/"a_dir"/"b_file.pdf", index).path_exists()
+	assert len(index) == 1
+	make_checker(tree/"a_file.txt", index).path_exists()
+	assert index.scan_count == 3
+
+
+def test_no_revalidation(tmp_path, make_checker):
+	index = DirectoryIndex(revalidation_delay=None)
+	pc = make_checker(tmp_path/"new.txt", index)
+	assert not pc.path_exists()
+	(tmp_path/"new.txt").write_text("new")
+	assert not pc.path_exists()
+	index.invalidate(tmp_path)
+	assert pc.path_exists()
+
+
+def test_revalidation_on_mtime_change(tree, make_checker):
+	index = DirectoryIndex(revalidation_delay=0)
+	pc = make_checker(tree/"new.txt", index)
+	assert not pc.path_exists()
+	make_checker(tree/"a_file.txt", index).path_exists()
+	assert index.scan_count == 1
+	sleep(0.01)
+	(tree/"new.txt").write_text("new")
+	assert pc.path_is_file()
+	assert index.scan_count == 2
+
+
+def test_clear(tmp_path, make_checker):
+	index = DirectoryIndex()
+	make_checker(tmp_path/"a_file.txt", index).path_exists()
+	index.clear()
+	assert len(index) == 0
+
+
+def test_snapshot_has_priority(tmp_path, make_checker):
+	index = DirectoryIndex(revalidation_delay=None)
+	pc = make_checker(tmp_path/"new.txt", index)
+	assert not pc.path_exists()
+	(tmp_path/"new.txt").write_text("new")
+	pc.enable_snapshot()
+	assert pc.path_exists()
+	pc.disable_snapshot()
+	assert not pc.path_exists()
+	pc.set_lookup(None)
+	assert pc.lookup is None
+	assert pc.path_exists()
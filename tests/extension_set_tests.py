@@ -0,0 +1,115 @@
+import pytest
+from jazal import\
+	BatchPathChecker,\
+	ExtensionSet,\
+	MissingPathArgWarner,\
+	PathChecker,\
+	PathSet,\
+	ReactivePathChecker
+from pathlib import Path
+
+
+ARCHIVE_EXTENS = (".tar.gz", ".zip", ".nii.gz", ".zip")
+
+
+def test_init():
+	exten_set = ExtensionSet(ARCHIVE_EXTENS)
+	assert exten_set.extensions == (".tar.gz", ".zip", ".nii.gz")
+	assert len(exten_set) == 3
+	assert exten_set.default == ".tar.gz"
+	assert ".zip" in exten_set
+	assert ".gz" not in exten_set
+
+
+def test_init_str():
+	assert ExtensionSet(".pdf").extensions == (".pdf",)
+
+
+def test_init_exceptions():
+	with pytest.raises(ValueError):
+		ExtensionSet(())
+
+	with pytest.raises(TypeError):
+		ExtensionSet((".pdf", 3))
+
+
+def test_eq_and_hash():
+	exten_set = ExtensionSet((".pdf", ".txt"))
+	assert exten_set == ExtensionSet((".pdf", ".txt", ".pdf"))
+	assert hash(exten_set) == hash(ExtensionSet((".pdf", ".txt", ".pdf")))
+	assert exten_set != ExtensionSet((".txt", ".pdf"))
+	assert exten_set != ExtensionSet((".pdf",))
+	assert exten_set != {".pdf", ".txt"}
+
+
+def test_repr():
+	assert repr(ExtensionSet((".pdf", ".txt")))\
+		== "ExtensionSet(('.pdf', '.txt'))"
+
+
+def test_quoted_list():
+	assert ExtensionSet((".pdf", "")).to_quoted_list() == "'.pdf', ''"
+
+
+def test_path_checker_exten_is_correct():
+	for path_str, expected in (("a/io.tar.gz", True), ("a/io.gz", False),
+			("a/io.zip", True), ("a/io", False), ("a/io.x.zip", False)):
+		pc = PathChecker(path_str, ARCHIVE_EXTENS)
+		assert pc.extension_is_correct() == expected
+
+
+def test_path_checker_converts_collection():
+	pc = PathChecker("a/io.zip", [".zip", ".tar.gz"])
+	assert pc.extension == ExtensionSet((".zip", ".tar.gz"))
+	assert repr(pc) in (
+		"PathChecker('a/io.zip', ExtensionSet(('.zip', '.tar.gz')))",
+		"PathChecker('a\\io.zip', ExtensionSet(('.zip', '.tar.gz')))")
+
+
+def test_check_extension_correct_lists_extensions():
+	rpc = ReactivePathChecker("a/io.txt", (".pdf", ".tar.gz"), "awesomeArg")
+	except_msg = "awesomeArg must be the path to a file with one of the "\
+		+ "extensions '.pdf', '.tar.gz'."
+	with pytest.raises(ValueError) as exc_info:
+		rpc.check_extension_correct()
+
+	assert str(exc_info.value) == except_msg
+
+
+def test_path_with_correct_exten_default():
+	rpc = ReactivePathChecker("a/io.txt", (".pdf", ".tar.gz"), "awesomeArg")
+	assert rpc.name_with_correct_exten() == "io.pdf"
+	assert rpc.path_with_correct_exten() == Path("a/io.pdf")
+
+
+def test_path_with_correct_exten_chosen():
+	rpc = ReactivePathChecker("a/io.txt", (".pdf", ".tar.gz"), "awesomeArg")
+	assert rpc.path_with_correct_exten(".tar.gz") == Path("a/io.tar.gz")
+
+
+def test_path_with_correct_exten_not_allowed():
+	rpc = ReactivePathChecker("a/io.txt", (".pdf", ".tar.gz"), "awesomeArg")
+	with pytest.raises(ValueError):
+		rpc.path_with_correct_exten(".docx")
+
+	rpc = ReactivePathChecker("a/io.txt", ".pdf", "awesomeArg")
+	with pytest.raises(ValueError):
+		rpc.name_with_correct_exten(".docx")
+
+	assert rpc.name_with_correct_exten(".pdf") == "io.pdf"
+
+
+def test_warner_missing_arg_msg():
+	warner = MissingPathArgWarner("arg", (".pdf", ".txt"))
+	assert warner.make_missing_arg_msg() == "arg: the path to a file with "\
+		+ "one of the extensions '.pdf', '.txt' must be provided."
+	assert warner.make_reactive_path_checker("a/io.txt").extension_is_correct()
+
+
+def test_batch_checkers():
+	paths = ("a/io.tar.gz", "a/io.gz", "a/io.zip")
+	bpc = BatchPathChecker(paths, ARCHIVE_EXTENS)
+	assert [bool(r) for r in bpc.extension_is_correct()] == [True, False, True]
+	ps = PathSet(paths)
+	ps.check(ARCHIVE_EXTENS)
+	assert list(ps.extension_ok) == [1, 0, 1]
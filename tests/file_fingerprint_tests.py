@@ -0,0 +1,76 @@
+import pytest
+from hashlib import blake2b
+from jazal import\
+	FingerprintCache,\
+	PathChecker,\
+	hash_file
+from os import stat, utime
+
+
+PDF_PATH = "some_dir/un_fichier_pdf.pdf"
+
+
+def expected_digest(path, digest_size=32):
+	with open(path, mode="rb") as file:
+		return blake2b(file.read(), digest_size=digest_size).digest()
+
+
+def test_init_exceptions():
+	with pytest.raises(ValueError):
+		FingerprintCache(max_files=0)
+
+	with pytest.raises(ValueError):
+		FingerprintCache(chunk_size=0)
+
+	with pytest.raises(ValueError):
+		FingerprintCache(digest_size=65)
+
+
+def test_hash_file():
+	with open(PDF_PATH, mode="rb") as file:
+		assert hash_file(file, bytearray(7)) == expected_digest(PDF_PATH)
+
+
+def test_hash_empty_file(tmp_path):
+	path = tmp_path/"empty.txt"
+	path.write_bytes(b"")
+
+	with path.open(mode="rb") as file:
+		assert hash_file(file, bytearray(16), 8) == expected_digest(path, 8)
+
+
+def test_fingerprint():
+	cache = FingerprintCache(chunk_size=100)
+	assert cache.fingerprint(PDF_PATH) == expected_digest(PDF_PATH)
+
+
+def test_fingerprint_cache(tmp_path):
+	cache = FingerprintCache(max_files=1)
+	path = tmp_path/"a_file.txt"
+	path.write_bytes(b"first content")
+	first_digest = cache.fingerprint(path)
+	assert cache.fingerprint(path) == first_digest
+	assert cache.hash_count == 1
+	assert len(cache) == 1
+
+	path.write_bytes(b"second content")
+	modified_time = stat(path).st_mtime_ns + 10 ** 9
+	utime(path, ns=(modified_time, modified_time))
+	assert cache.fingerprint(path) == expected_digest(path)
+	assert cache.hash_count == 2
+	assert len(cache) == 1
+
+	cache.clear()
+	assert len(cache) == 0
+
+
+def test_fingerprint_missing_file():
+	with pytest.raises(FileNotFoundError):
+		FingerprintCache().fingerprint("ajxoj/io.txt")
+
+
+def test_path_checker_get_fingerprint():
+	pc = PathChecker(PDF_PATH, ".pdf")
+	assert pc.get_fingerprint() == expected_digest(PDF_PATH)
+	cache = FingerprintCache(digest_size=16)
+	assert pc.get_fingerprint(cache) == expected_digest(PDF_PATH, 16)
@@ -0,0 +1,122 @@
+import pytest
+from jazal import\
+	InotifyWatcher,\
+	WatchedDirectoryIndex
+from sys import platform
+from time import monotonic, sleep
+
+
+pytestmark = pytest.mark.skipif(not platform.startswith("linux"),
+	reason="inotify is only available on Linux.")
+
+
+def wait_until(condition, timeout=5.0):
+	deadline = monotonic() + timeout
+
+	while not condition():
+		if monotonic() > deadline:
+			return False
+
+		sleep(0.01)
+
+	return True
+
+
+def test_watcher_reports_changes(tmp_path):
+	changed_dirs = list()
+	with InotifyWatcher(changed_dirs.append) as watcher:
+		assert watcher.watch(tmp_path)
+		assert watcher.is_watched(tmp_path)
+		(tmp_path/"new.txt").write_text("new")
+		assert wait_until(lambda: str(tmp_path) in changed_dirs)
+
+
+def test_watcher_inexistent_dir(tmp_path):
+	with InotifyWatcher(lambda dir_key: None) as watcher:
+		assert not watcher.watch(tmp_path/"nothing")
+		assert watcher.watched_count == 0
+
+
+def test_watcher_unwatch(tmp_path):
+	with InotifyWatcher(lambda dir_key: None) as watcher:
+		watcher.watch(tmp_path)
+		watcher.unwatch(tmp_path)
+		assert not watcher.is_watched(tmp_path)
+		watcher.unwatch(tmp_path)
+
+
+def test_index_no_syscall_when_unchanged(tmp_path, make_checker):
+	(tmp_path/"a_file.txt").write_text("a")
+	with WatchedDirectoryIndex() as index:
+		pc = make_checker(tmp_path/"a_file.txt", index)
+
+		for i in range(10):
+			assert pc.path_is_file()
+
+		assert index.scan_count == 1
+		assert index.watcher.is_watched(tmp_path)
+
+
+def test_index_invalidated_on_create(tmp_path, make_checker):
+	with WatchedDirectoryIndex() as index:
+		pc = make_checker(tmp_path/"new.txt", index)
+		assert not pc.path_exists()
+		(tmp_path/"new.txt").write_text("new")
+		assert wait_until(pc.path_is_file)
+
+
+def test_index_invalidated_on_delete_and_move(tmp_path, make_checker):
+	(tmp_path/"a_file.txt").write_text("a")
+	with WatchedDirectoryIndex() as index:
+		pc = make_checker(tmp_path/"a_file.txt", index)
+		moved_pc = make_checker(tmp_path/"b_file.txt", index)
+		assert pc.path_exists()
+		assert not moved_pc.path_exists()
+		(tmp_path/"a_file.txt").rename(tmp_path/"b_file.txt")
+		assert wait_until(lambda: not pc.path_exists())
+		assert moved_pc.path_exists()
+		(tmp_path/"b_file.txt").unlink()
+		assert wait_until(lambda: not moved_pc.path_exists())
+
+
+def test_index_eviction_unwatches(tmp_path, make_checker):
+	(tmp_path/"a_dir").mkdir()
+	with WatchedDirectoryIndex(max_dirs=1) as index:
+		make_checker(tmp_path/"a_file.txt", index).path_exists()
+		make_checker(tmp_path/"a_dir"/"b_file.txt", index).path_exists()
+		assert not index.watcher.is_watched(tmp_path)
+		assert index.watcher.is_watched(tmp_path/"a_dir")
+
+
+def test_index_change_unwatches(tmp_path, make_checker):
+	(tmp_path/"a_dir").mkdir()
+	with WatchedDirectoryIndex() as index:
+		make_checker(tmp_path/"a_file.txt", index).path_exists()
+		make_checker(tmp_path/"a_dir"/"b_file.txt", index).path_exists()
+		assert index.watcher.watched_count == 2
+		(tmp_path/"a_dir"/"b_file.txt").write_text("b")
+		assert wait_until(lambda: index.watcher.watched_count == 1)
+		assert not index.watcher.is_watched(tmp_path/"a_dir")
+		assert len(index) == 1
+
+
+def test_index_invalidated_scan_unwatches(tmp_path, make_checker):
+	with WatchedDirectoryIndex() as index:
+		on_scan = index._on_scan
+
+		def invalidating_on_scan(dir_key):
+			keep_listing = on_scan(dir_key)
+			index.invalidate(dir_key)
+			return keep_listing
+
+		index._on_scan = invalidating_on_scan
+		make_checker(tmp_path/"a_file.txt", index).path_exists()
+		assert len(index) == 0
+		assert index.watcher.watched_count == 0
+
+
+def test_index_inexistent_dir_not_kept(tmp_path, make_checker):
+	with WatchedDirectoryIndex() as index:
+		pc = make_checker(tmp_path/"nothing"/"io.txt", index)
+		assert not pc.path_exists()
+		assert len(index) == 0
@@ -0,0 +1,182 @@
+import pytest
+from jazal import\
+	CheckInstrument,\
+	DirFdLookup,\
+	DirectoryIndex,\
+	NegativeLookupCache,\
+	PathChecker,\
+	ReactivePathChecker,\
+	disable_instrumentation,\
+	enable_instrumentation,\
+	get_instrumentation
+from jazal import instrumentation
+from pathlib import Path
+
+
+@pytest.fixture
+def instrument():
+	instrument = enable_instrumentation()
+	yield instrument
+	disable_instrumentation()
+
+
+def test_disabled_by_default():
+	assert get_instrumentation() is None
+	assert PathChecker._instrument is None
+
+
+def test_enable_disable():
+	instrument = CheckInstrument()
+	assert enable_instrumentation(instrument) is instrument
+	assert get_instrumentation() is instrument
+	assert disable_instrumentation() is instrument
+	assert get_instrumentation() is None
+
+
+def test_enable_exception():
+	with pytest.raises(TypeError):
+		enable_instrumentation("instrument")
+
+
+def test_query_counts(instrument):
+	pc = PathChecker("some_dir/un_fichier_pdf.pdf", ".pdf")
+	assert pc.path_exists()
+	assert not pc.path_is_dir()
+	assert pc.path_is_file()
+	assert instrument.call_count() == 3
+	assert instrument.call_count("path_exists") == 1
+	assert instrument.syscall_count() == 3
+	assert instrument.operations()\
+		== ["path_exists", "path_is_dir", "path_is_file"]
+
+
+def test_snapshot_syscalls(instrument):
+	pc = PathChecker("some_dir/un_fichier_pdf.pdf", ".pdf")
+	pc.enable_snapshot()
+	pc.path_exists()
+	pc.path_is_dir()
+	pc.path_is_file()
+	assert instrument.call_count() == 3
+	assert instrument.syscall_count() == 1
+	assert instrument.syscall_count("path_exists") == 1
+
+
+def test_lookup_syscalls(instrument):
+	pc = PathChecker("some_dir/un_fichier_pdf.pdf", ".pdf")
+	pc.set_lookup(DirectoryIndex())
+	pc.path_exists()
+	pc.path_is_file()
+	assert instrument.syscall_count() == 1
+
+
+def test_dir_fd_lookup_syscalls(instrument):
+	pc = PathChecker("some_dir/un_fichier_pdf.pdf", ".pdf")
+
+	with DirFdLookup(revalidation_delay=None) as lookup:
+		pc.set_lookup(lookup)
+		pc.path_exists()
+		pc.path_is_file()
+		assert lookup.syscall_count == 3
+
+	assert instrument.syscall_count() == 3
+	assert instrument.syscall_count("path_exists") == 2
+
+
+def test_negative_lookup_cache_syscalls(instrument):
+	pc = PathChecker("ajxoj/io.txt", ".txt")
+	pc.set_lookup(NegativeLookupCache())
+	pc.path_exists()
+	pc.path_is_file()
+	assert instrument.syscall_count() == 2
+	assert instrument.syscall_count("path_is_file") == 0
+
+
+def test_check_methods(instrument):
+	rpc = ReactivePathChecker("ajxoj/io.txt", ".pdf", "arg")
+
+	with pytest.raises(FileNotFoundError):
+		rpc.check_path_exists()
+
+	with pytest.raises(ValueError):
+		rpc.check_extension_correct()
+
+	assert instrument.call_count("check_path_exists") == 1
+	assert instrument.call_count("check_extension_correct") == 1
+	assert instrument.call_count("path_exists") == 1
+	assert instrument.syscall_count("check_path_exists") == 0
+	assert instrument.syscall_count() == 1
+
+
+def test_histogram(instrument):
+	pc = PathChecker("ajxoj/io.txt", ".txt")
+
+	for _ in range(5):
+		pc.path_exists()
+
+	histogram = instrument.histogram("path_exists")
+	assert sum(histogram.values()) == 5
+	assert all(bound & (bound - 1) == 0 for bound in histogram)
+	assert instrument.histogram("path_is_dir") == dict()
+
+
+def test_mount_points(instrument):
+	pc = PathChecker("ajxoj/io.txt", ".txt")
+	pc.path_exists()
+	mount_points = instrument.mount_points()
+	assert len(mount_points) == 1
+	assert mount_points[0] in Path("ajxoj/io.txt").absolute().parents
+	assert sum(instrument.histogram(mount_point=mount_points[0]).values())\
+		== 1
+
+
+def test_mount_point_lookup_unlocked(instrument, monkeypatch):
+	ismount = instrumentation.ismount
+	locked_calls = list()
+
+	def checking_ismount(path):
+		locked_calls.append(instrument._lock.locked())
+		return ismount(path)
+
+	monkeypatch.setattr(instrumentation, "ismount", checking_ismount)
+	PathChecker("ajxoj/io.txt", ".txt").path_exists()
+	assert len(locked_calls) > 0
+	assert not any(locked_calls)
+
+
+def test_mount_point_dirs_bounded(instrument, tmp_path, monkeypatch):
+	monkeypatch.setattr(instrumentation, "_MAX_MOUNT_POINT_DIRS", 3)
+
+	for i in range(5):
+		PathChecker(tmp_path/str(i)/"io.txt", ".txt").path_exists()
+
+	assert len(instrument._mount_points) == 3
+
+
+def test_callbacks(instrument):
+	calls = list()
+
+	def callback(*args):
+		calls.append(args)
+
+	instrument.add_callback(callback)
+	pc = PathChecker("ajxoj/io.txt", ".txt")
+	pc.path_is_file()
+	instrument.remove_callback(callback)
+	pc.path_is_file()
+	assert len(calls) == 1
+	operation, checker, duration, syscall_count, mount_point = calls[0]
+	assert operation == "path_is_file"
+	assert checker is pc
+	assert duration >= 0
+	assert syscall_count == 1
+
+	with pytest.raises(ValueError):
+		instrument.remove_callback(callback)
+
+
+def test_reset(instrument):
+	PathChecker("ajxoj/io.txt", ".txt").path_exists()
+	instrument.reset()
+	assert instrument.call_count() == 0
+	assert instrument.syscall_count() == 0
+	assert instrument.histogram() == dict()
@@ -0,0 +1,49 @@
+import jazal
+import pytest
+from importlib import import_module
+from pathlib import Path
+from subprocess import run
+from sys import executable
+
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+
+def loaded_jazal_modules(statement):
+	code = statement + "\nimport sys\n"\
+		+ "print(' '.join(sorted(m for m in sys.modules "\
+		+ "if m.startswith('jazal.'))))"
+	completed = run((executable, "-c", code), cwd=str(REPO_DIR),
+		capture_output=True, text=True, check=True)
+	return completed.stdout.split()
+
+
+def test_import_loads_no_submodule():
+	assert loaded_jazal_modules("import jazal") == []
+
+
+def test_name_loads_its_module_only():
+	modules = loaded_jazal_modules("from jazal import ExtensionSet")
+	assert modules == ["jazal.extension_set"]
+
+
+def test_path_checker_loads_no_cache_module():
+	modules = loaded_jazal_modules("from jazal import PathChecker")
+	assert modules == ["jazal.extension_set", "jazal.parsed_path",
+		"jazal.path_checker", "jazal.path_util", "jazal.str_path_util"]
+
+
+def test_all_names_importable():
+	for name in jazal.__all__:
+		module_name = jazal._NAME_MODULES[name]
+		module = import_module(module_name, "jazal")
+		assert getattr(jazal, name) is getattr(module, name)
+
+
+def test_dir_lists_lazy_names():
+	assert set(jazal.__all__) <= set(dir(jazal))
+
+
+def test_unknown_name():
+	with pytest.raises(AttributeError):
+		jazal.NonExistentChecker
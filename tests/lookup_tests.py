@@ -0,0 +1,53 @@
+import pytest
+from jazal import\
+	DirFdLookup,\
+	DirectoryIndex,\
+	NegativeLookupCache,\
+	PathChecker,\
+	WatchedDirectoryIndex
+from pathlib import Path
+from sys import platform
+
+
+# The lookup objects that PathChecker.set_lookup accepts. Their specific
+# behaviors are tested in the modules named after them.
+LOOKUP_FACTORIES = [DirectoryIndex, DirFdLookup, NegativeLookupCache,
+	lambda: NegativeLookupCache(DirectoryIndex())]
+LOOKUP_IDS = ["DirectoryIndex", "DirFdLookup", "NegativeLookupCache",
+	"NegativeLookupCache(DirectoryIndex)"]
+
+if platform.startswith("linux"):
+	LOOKUP_FACTORIES.append(WatchedDirectoryIndex)
+	LOOKUP_IDS.append("WatchedDirectoryIndex")
+
+
+@pytest.fixture(params=LOOKUP_FACTORIES, ids=LOOKUP_IDS)
+def lookup(request):
+	lookup = request.param()
+
+	if hasattr(lookup, "__exit__"):
+		with lookup:
+			yield lookup
+
+	else:
+		yield lookup
+
+
+def test_matches_path_checker(tree, lookup, make_checker):
+	(tree/"a_link").symlink_to(tree/"a_dir")
+	(tree/"broken_link").symlink_to(tree/"nothing")
+	paths = (tree/"a_dir", tree/"a_file.txt", tree/"a_dir"/"b_file.pdf",
+		tree/"nothing", tree/"nothing"/"io.txt", tree/"a_file.txt"/"io.txt",
+		tree/"a_link", tree/"a_link"/"b_file.pdf", tree/"broken_link",
+		tree/"a_dir"/"..", tree/"nothing"/"..", tree/"nothing"/".."/"a_dir",
+		Path("some_dir"), Path("some_dir/un_fichier_pdf.pdf"),
+		Path("ajxoj/io.txt"), Path("."), Path("/"))
+
+	# The second pass gets the answers that the lookup object remembered.
+	for _ in range(2):
+		for path in paths:
+			pc = PathChecker(path, "")
+			lookup_pc = make_checker(path, lookup)
+			assert lookup_pc.path_exists() == pc.path_exists()
+			assert lookup_pc.path_is_dir() == pc.path_is_dir()
+			assert lookup_pc.path_is_file() == pc.path_is_file()
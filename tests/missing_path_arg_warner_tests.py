@@ -27,3 +27,23 @@ def test_make_reactive_path_checker():
 	warner = MissingPathArgWarner("awesomeArg", ".pdf")
 	rpc = warner.make_reactive_path_checker("ajxoj/io.txt")
 	assert rpc == ReactivePathChecker("ajxoj/io.txt", ".pdf", "awesomeArg")
+
+
+def test_eq():
+	warner = MissingPathArgWarner("awesomeArg", ".pdf")
+	assert warner == MissingPathArgWarner("awesomeArg", ".pdf")
+	assert warner != MissingPathArgWarner("awesomeArg", ".txt")
+	assert warner != MissingPathArgWarner("formidableArg", ".pdf")
+	assert warner != "awesomeArg"
+
+
+def test_hash():
+	warner1 = MissingPathArgWarner("awesomeArg", ".pdf")
+	warner2 = MissingPathArgWarner("awesomeArg", ".pdf")
+	assert hash(warner1) == hash(warner2)
+	assert len(set((warner1, warner2))) == 1
+
+
+def test_repr():
+	warner = MissingPathArgWarner("awesomeArg", ".pdf")
+	assert repr(warner) == "MissingPathArgWarner('awesomeArg', '.pdf')"
@@ -0,0 +1,65 @@
+import pytest
+from jazal import NegativeLookupCache
+from time import sleep
+
+
+def test_init_exceptions():
+	with pytest.raises(ValueError):
+		NegativeLookupCache(max_entries=0)
+
+	with pytest.raises(ValueError):
+		NegativeLookupCache(ttl=-1)
+
+
+def test_missing_subtree(tmp_path):
+	cache = NegativeLookupCache()
+	missing_dir = tmp_path/"a"/"b"
+	assert not cache.path_exists(missing_dir/"c.txt")
+	assert cache.miss_count == 1
+
+	for name in ("d.txt", "e.txt", "f/g.txt"):
+		assert not cache.path_exists(missing_dir/name)
+
+	assert not cache.path_is_file(tmp_path/"a"/"h"/"i.txt")
+	assert not cache.path_is_dir(tmp_path/"a")
+	assert cache.hit_count == 5
+	assert cache.miss_count == 1
+	assert cache.syscall_count == 4
+
+
+def test_not_a_dir(tree):
+	cache = NegativeLookupCache()
+	assert cache.path_is_file(tree/"a_file.txt")
+	assert not cache.path_exists(tree/"a_file.txt"/"io.txt")
+	assert cache.hit_count == 1
+
+
+def test_ttl(tmp_path):
+	cache = NegativeLookupCache(ttl=0.05)
+	assert not cache.path_exists(tmp_path/"a"/"b.txt")
+	(tmp_path/"a").mkdir()
+	(tmp_path/"a"/"b.txt").write_text("b")
+	assert not cache.path_exists(tmp_path/"a"/"b.txt")
+	sleep(0.1)
+	assert cache.path_exists(tmp_path/"a"/"b.txt")
+
+
+def test_max_entries(tmp_path):
+	cache = NegativeLookupCache(max_entries=3, ttl=None)
+
+	for name in ("a", "b", "c", "d"):
+		cache.path_exists(tmp_path/name)
+
+	assert len(cache) == 3
+
+
+def test_invalidate(tmp_path):
+	cache = NegativeLookupCache(ttl=None)
+	assert not cache.path_exists(tmp_path/"a"/"b.txt")
+	(tmp_path/"a").mkdir()
+	(tmp_path/"a"/"b.txt").write_text("b")
+	assert not cache.path_exists(tmp_path/"a"/"b.txt")
+	cache.invalidate(tmp_path/"a"/"b.txt")
+	assert cache.path_exists(tmp_path/"a"/"b.txt")
+	cache.clear()
+	assert len(cache) == 0
@@ -0,0 +1,57 @@
+import pytest
+from jazal import\
+	ParsedPath,\
+	extension_to_str,\
+	get_file_stem,\
+	make_altered_name,\
+	make_altered_path,\
+	make_altered_stem
+from pathlib import Path
+
+
+def test_init():
+	pp = ParsedPath(Path("ajxoj/io.tar.gz"))
+	assert pp.path == Path("ajxoj/io.tar.gz")
+	assert pp.name == "io.tar.gz"
+	assert pp.stem == "io"
+	assert pp.extension == ".tar.gz"
+	assert pp.suffixes == (".tar", ".gz")
+	assert pp.parent == Path("ajxoj")
+
+
+def test_no_exten():
+	pp = ParsedPath(Path("some_dir"))
+	assert pp.stem == "some_dir"
+	assert pp.extension == ""
+	assert pp.suffixes == ()
+	assert pp.parent == Path(".")
+
+
+def test_suffixes_match_pathlib():
+	for path_str in ("a..b", "..a.b", ".bashrc", "a.b.c.b", "a.", ""):
+		path = Path(path_str)
+		assert ParsedPath(path).suffixes == tuple(path.suffixes)
+
+
+def test_eq_and_hash():
+	pp1 = ParsedPath(Path("ajxoj/io.txt"))
+	pp2 = ParsedPath(Path("ajxoj/io.txt"))
+	assert pp1 == pp2
+	assert hash(pp1) == hash(pp2)
+	assert pp1 != ParsedPath(Path("ajxoj/io.pdf"))
+	assert pp1 != Path("ajxoj/io.txt")
+
+
+def test_repr():
+	assert repr(ParsedPath(Path("ajxoj/io.txt"))) in (
+		"ParsedPath('ajxoj/io.txt')", "ParsedPath('ajxoj\\io.txt')")
+
+
+def test_path_util_accepts_parsed_path():
+	pp = ParsedPath(Path("some_dir/gugusse.docx"))
+	assert extension_to_str(pp) == ".docx"
+	assert get_file_stem(pp) == "gugusse"
+	assert make_altered_stem(pp, "a", "b") == "agugusseb"
+	assert make_altered_name(pp, "a", "b", ".pdf") == "agugusseb.pdf"
+	assert make_altered_path(pp, "a", "b", None)\
+		== Path("some_dir/agugusseb.docx")
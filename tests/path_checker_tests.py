@@ -1,6 +1,18 @@
+import pickle
 import pytest
-from jazal import PathChecker
+from copy import copy, deepcopy
+from jazal import\
+	DirectoryIndex,\
+	PathChecker
 from pathlib import Path
+from time import sleep
+
+
+class TaggedPathChecker(PathChecker):
+
+	def __init__(self, a_path, extension, tag):
+		PathChecker.__init__(self, a_path, extension)
+		self.tag = tag
 
 
 def test_init_no_exten():
@@ -45,6 +57,42 @@ def test_eq_different_types():
 	assert pc1 != pc2
 
 
+def test_copy():
+	pc = PathChecker("some_dir/un_fichier_pdf.pdf", ".pdf")
+	pc.enable_snapshot(5)
+	pc.set_lookup(DirectoryIndex())
+	assert pc.path_is_file()
+
+	for pc_copy in (copy(pc), deepcopy(pc), pickle.loads(pickle.dumps(pc))):
+		assert pc_copy == pc
+		assert pc_copy.snapshot_enabled
+		assert pc_copy._snapshot is not pc._snapshot
+		assert pc_copy.path_is_file()
+
+	assert copy(pc).lookup is pc.lookup
+	assert deepcopy(pc).lookup is None
+	assert pickle.loads(pickle.dumps(pc)).lookup is None
+
+
+def test_pickle_state():
+	pc = PathChecker("some_dir/un_fichier_pdf.pdf", ".pdf")
+	pc.parsed_path
+	assert set(pc.__getstate__()) == {"_extension", "_path"}
+	pc_copy = pickle.loads(pickle.dumps(pc))
+	assert pc_copy._parsed_path is None
+	assert pc_copy._snapshot is None
+	assert pc_copy.parsed_path == pc.parsed_path
+
+
+def test_copy_subclass():
+	tpc = TaggedPathChecker("ajxoj/io.txt", ".txt", "a_tag")
+
+	for tpc_copy in (copy(tpc), pickle.loads(pickle.dumps(tpc))):
+		assert isinstance(tpc_copy, TaggedPathChecker)
+		assert tpc_copy == tpc
+		assert tpc_copy.tag == "a_tag"
+
+
 def test_repr():
 	pc = PathChecker("ajxoj/io.txt", ".pdf")
 	print(repr(pc))
@@ -126,3 +174,112 @@ def test_path_is_file_false():
 def test_path_is_file_inexistent():
 	pc = PathChecker("ajxoj/io.txt", ".pdf")
 	assert not pc.path_is_file()
+
+
+def test_snapshot_disabled_by_default():
+	pc = PathChecker("some_dir", ".pdf")
+	assert not pc.snapshot_enabled
+
+
+def test_snapshot_predicates():
+	pc = PathChecker("some_dir/un_fichier_pdf.pdf", ".pdf")
+	pc.enable_snapshot()
+	assert pc.snapshot_enabled
+	assert pc.path_exists()
+	assert pc.path_is_file()
+	assert not pc.path_is_dir()
+
+
+def test_snapshot_predicates_dir():
+	pc = PathChecker("some_dir", "")
+	pc.enable_snapshot()
+	assert pc.path_exists()
+	assert pc.path_is_dir()
+	assert not pc.path_is_file()
+
+
+def test_snapshot_predicates_inexistent():
+	pc = PathChecker("ajxoj/io.txt", ".pdf")
+	pc.enable_snapshot()
+	assert not pc.path_exists()
+	assert not pc.path_is_dir()
+	assert not pc.path_is_file()
+
+
+def test_snapshot_kept_until_refresh(tmp_path):
+	file_path = tmp_path/"io.txt"
+	pc = PathChecker(file_path, ".txt")
+	pc.enable_snapshot()
+	assert not pc.path_exists()
+	file_path.write_text("io")
+	assert not pc.path_is_file()
+	pc.refresh()
+	assert pc.path_exists()
+	assert pc.path_is_file()
+
+
+def test_snapshot_ttl_expired(tmp_path):
+	file_path = tmp_path/"io.txt"
+	pc = PathChecker(file_path, ".txt")
+	pc.enable_snapshot(ttl=0)
+	assert not pc.path_exists()
+	file_path.write_text("io")
+	sleep(0.01)
+	assert pc.path_exists()
+
+
+def test_snapshot_disable(tmp_path):
+	file_path = tmp_path/"io.txt"
+	pc = PathChecker(file_path, ".txt")
+	pc.enable_snapshot()
+	assert not pc.path_exists()
+	file_path.write_text("io")
+	pc.disable_snapshot()
+	assert not pc.snapshot_enabled
+	assert pc.path_exists()
+
+
+def test_snapshot_negative_ttl():
+	pc = PathChecker("some_dir", "")
+	with pytest.raises(ValueError):
+		pc.enable_snapshot(ttl=-1)
+
+
+def test_parsed_path():
+	pc = PathChecker("ajxoj/io.tar.gz", ".tar.gz")
+	assert pc.parsed_path.path == pc.path
+	assert pc.parsed_path is pc.parsed_path
+	assert pc.parsed_path.extension == ".tar.gz"
+
+
+def test_hash():
+	pc1 = PathChecker("ajxoj/io.txt", ".pdf")
+	pc2 = PathChecker(Path("ajxoj/io.txt"), ".pdf")
+	pc3 = PathChecker("ajxoj/io.txt", ".txt")
+	assert hash(pc1) == hash(pc2)
+	assert len(set((pc1, pc2, pc3))) == 2
+
+
+def test_no_instance_dict():
+	pc = PathChecker("ajxoj/io.txt", ".pdf")
+	assert not hasattr(pc, "__dict__")
+
+
+def test_subclass_without_slots():
+	class TaggedPathChecker(PathChecker):
+		pass
+
+	tpc = TaggedPathChecker("ajxoj/io.txt", ".pdf")
+	tpc.tag = "input"
+	assert tpc.tag == "input"
+	assert tpc == TaggedPathChecker("ajxoj/io.txt", ".pdf")
+	assert repr(tpc) in (
+		"TaggedPathChecker('ajxoj/io.txt', '.pdf')",
+		"TaggedPathChecker('ajxoj\\io.txt', '.pdf')")
+
+
+def test_content_is_correct():
+	assert PathChecker("../some_pdf_file.pdf", ".pdf").content_is_correct()
+	assert not PathChecker(
+		"some_dir/un_fichier_pdf.pdf", ".gz").content_is_correct()
+	assert not PathChecker("ajxoj/io.pdf", ".pdf").content_is_correct()
@@ -0,0 +1,87 @@
+import pytest
+from io import StringIO
+from jazal import\
+	MissingPathArgWarner,\
+	PathPipeline,\
+	ReactivePathChecker,\
+	read_path_lines
+from pathlib import Path
+
+
+FILE_CHECKS = (
+	ReactivePathChecker.check_extension_correct,
+	ReactivePathChecker.check_path_exists,
+	ReactivePathChecker.check_path_is_file)
+
+PATHS = (
+	"some_dir/un_fichier_pdf.pdf",
+	"ajxoj/io.pdf",
+	Path("some_dir/un_fichier_pdf.pdf"),
+	"some_dir/io.txt")
+
+
+def make_pipeline():
+	return PathPipeline(MissingPathArgWarner("input", ".pdf"), FILE_CHECKS)
+
+
+def test_init():
+	warner = MissingPathArgWarner("input", ".pdf")
+	pipeline = PathPipeline(warner, list(FILE_CHECKS))
+	assert pipeline.warner is warner
+	assert pipeline.checks == FILE_CHECKS
+
+
+def test_validate():
+	results = list(make_pipeline().validate(PATHS))
+	assert [checker.path for checker, _ in results]\
+		== [Path(path) for path in PATHS]
+	assert all(checker.arg_name == "input" for checker, _ in results)
+	assert results[0][1] is None
+	assert str(results[1][1]) == "input: " + str(Path("ajxoj/io.pdf"))\
+		+ " does not exist."
+	assert results[2][1] is None
+	assert str(results[3][1])\
+		== "input must be the path to a file with the extension '.pdf'."
+
+
+def test_validate_lazy():
+	def paths():
+		yield "some_dir/un_fichier_pdf.pdf"
+		raise RuntimeError("The second path must not be requested.")
+
+	results = make_pipeline().validate(paths())
+	checker, error = next(results)
+	assert error is None
+
+
+def test_validate_path_exception():
+	with pytest.raises(TypeError):
+		list(make_pipeline().validate([3.14159]))
+
+
+def test_failures():
+	failures = list(make_pipeline().failures(PATHS))
+	assert len(failures) == 2
+	assert isinstance(failures[0][1], FileNotFoundError)
+	assert isinstance(failures[1][1], ValueError)
+
+
+def test_valid_paths():
+	assert list(make_pipeline().valid_paths(PATHS))\
+		== [Path("some_dir/un_fichier_pdf.pdf")] * 2
+
+
+def test_chunks():
+	chunks = list(make_pipeline().chunks(PATHS, 3))
+	assert [len(chunk) for chunk in chunks] == [3, 1]
+
+
+def test_chunks_size_exception():
+	with pytest.raises(ValueError):
+		make_pipeline().chunks(PATHS, 0)
+
+
+def test_read_path_lines():
+	stream = StringIO("some_dir/un_fichier_pdf.pdf\n\najxoj/io.pdf\r\n")
+	assert list(read_path_lines(stream))\
+		== ["some_dir/un_fichier_pdf.pdf", "ajxoj/io.pdf"]
@@ -0,0 +1,131 @@
+import pytest
+from jazal import\
+	BatchPathChecker,\
+	PathChecker,\
+	PathSet
+from os import sep
+from pathlib import Path
+
+
+PATHS = (
+	"some_dir/un_fichier_pdf.pdf",
+	"some_dir",
+	"ajxoj/io.txt",
+	"ajxoj/io.tar.gz",
+	Path("ajxoj/io"))
+
+
+def test_init():
+	ps = PathSet(PATHS)
+	assert len(ps) == 5
+	assert ps.dir_count == 3
+	assert [Path(path) for path in ps] == [Path(path) for path in PATHS]
+
+
+def test_init_path_exception():
+	except_msg = "The given path must be an instance of pathlib.Path or str."
+	with pytest.raises(TypeError, match = except_msg):
+		ps = PathSet([3.14159])
+
+
+def test_repr():
+	assert repr(PathSet(PATHS)) == "PathSet(<5 paths in 3 directories>)"
+
+
+def test_add_duplicate():
+	ps = PathSet(PATHS)
+	assert ps.add(Path("ajxoj/io.txt")) == 2
+	assert ps.add("ajxoj/io.txt/") == 2
+	assert len(ps) == 5
+	assert ps.add("ajxoj/new.txt") == 5
+	assert len(ps) == 6
+
+
+def test_getitem():
+	ps = PathSet(["io.txt", "/io.txt", "ajxoj/io.txt", "ajxoj/", ""])
+	assert ps[0] == "io.txt"
+	assert ps[1] == sep + "io.txt"
+	assert ps[2] == "ajxoj" + sep + "io.txt"
+	assert ps[3] == "ajxoj"
+	assert ps[4] == ""
+
+
+def test_getitem_negative_index():
+	ps = PathSet(["a/b", "a/c", "d/e"])
+	assert ps[-3] == "a" + sep + "b"
+	assert ps[-1] == "d" + sep + "e"
+
+	with pytest.raises(IndexError):
+		ps[-4]
+
+	with pytest.raises(IndexError):
+		ps[3]
+
+	with pytest.raises(TypeError):
+		ps[1.0]
+
+
+def test_repeated_separators():
+	ps = PathSet(["ajxoj//io.txt", "ajxoj/io.txt", "ajxoj///sub//",
+		"//server/share", "///io.txt"])
+	assert len(ps) == 4
+	assert ps.dir_count == 3
+	assert ps[0] == "ajxoj" + sep + "io.txt"
+	assert ps[1] == "ajxoj" + sep + "sub"
+	assert ps[2] == sep + sep + "server" + sep + "share"
+	assert ps[3] == sep + "io.txt"
+	assert ps.index("ajxoj/io.txt") == 0
+	assert "ajxoj//sub" in ps
+
+
+def test_non_ascii_names():
+	ps = PathSet(["répertoire/żal.pdf", "répertoire/łza.txt"])
+	assert ps.dir_count == 1
+	assert Path(ps[0]) == Path("répertoire/żal.pdf")
+	assert ps.index("répertoire/łza.txt") == 1
+
+
+def test_index_and_contains():
+	ps = PathSet(PATHS)
+	assert ps.index("ajxoj/io.tar.gz") == 3
+	assert ps.index("ajxoj/io.pdf") == -1
+	assert ps.index("nothing/io.txt") == -1
+	assert Path("some_dir") in ps
+	assert "some_dir/io.txt" not in ps
+
+
+def test_make_path_checker():
+	ps = PathSet(PATHS)
+	assert ps.make_path_checker(0, ".pdf")\
+		== PathChecker("some_dir/un_fichier_pdf.pdf", ".pdf")
+
+
+def test_no_results_before_check():
+	ps = PathSet(PATHS)
+	assert ps.exists is None
+	ps.check(".pdf")
+	assert ps.exists is not None
+	ps.add("new.pdf")
+	assert ps.exists is None
+
+
+def test_check_matches_batch_path_checker():
+	ps = PathSet(PATHS)
+	bpc = BatchPathChecker(PATHS, ".tar.gz")
+	ps.check(".tar.gz")
+	assert list(ps.exists) == [int(r) for r in bpc.path_exists()]
+	assert list(ps.is_dir) == [int(r) for r in bpc.path_is_dir()]
+	assert list(ps.is_file) == [int(r) for r in bpc.path_is_file()]
+	assert list(ps.extension_ok)\
+		== [int(r) for r in bpc.extension_is_correct()]
+
+
+def test_many_paths():
+	paths = ["dir_" + str(i % 7) + "/file_" + str(i) + ".txt"
+		for i in range(1000)]
+	ps = PathSet(paths)
+	assert len(ps) == 1000
+	assert [ps.add(path) for path in paths] == list(range(1000))
+	assert len(ps) == 1000
+	assert all(ps.index(path) == i for i, path in enumerate(paths))
+	assert ps.index("dir_0/file_1.txt") == -1
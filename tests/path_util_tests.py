@@ -1,3 +1,4 @@
+import os
 import pytest
 from pathlib import Path
 from jazal import\
@@ -5,7 +6,8 @@ from jazal import\
 	get_file_stem,\
 	make_altered_name,\
 	make_altered_path,\
-	make_altered_stem
+	make_altered_stem,\
+	stat_or_none
 
 
 EMPTY_STR = ""
@@ -119,3 +121,26 @@ def test_altered_path_no_exten():
 def test_altered_path_with_exten():
 	assert_altered_path(
 		"some_dir/gugusse.docx", "a", "b", ".pdf", "some_dir/agugusseb.pdf")
+
+
+def test_stat_or_none_file():
+	assert stat_or_none(Path("some_dir/un_fichier_pdf.pdf")) is not None
+
+
+def test_stat_or_none_inexistent():
+	assert stat_or_none(Path("ajxoj/io.txt")) is None
+
+
+def test_stat_or_none_under_file():
+	assert stat_or_none(Path("some_dir/un_fichier_pdf.pdf/io.txt")) is None
+
+
+def test_stat_or_none_dir_fd():
+	dir_fd = os.open("some_dir", os.O_RDONLY)
+
+	try:
+		assert stat_or_none("un_fichier_pdf.pdf", dir_fd) is not None
+		assert stat_or_none("io.txt", dir_fd) is None
+
+	finally:
+		os.close(dir_fd)
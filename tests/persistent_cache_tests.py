@@ -0,0 +1,183 @@
+import pytest
+from hashlib import blake2b
+from jazal import\
+	ExtensionSet,\
+	PathChecker,\
+	PersistentCheckCache,\
+	ReactivePathChecker
+from os import fsdecode, stat, utime
+from pathlib import Path
+from time import sleep
+
+
+PDF_PATH = "some_dir/un_fichier_pdf.pdf"
+
+
+def test_init_exceptions(tmp_path):
+	db_path = tmp_path/"cache.db"
+
+	with pytest.raises(ValueError):
+		PersistentCheckCache(db_path, max_entries=0)
+
+	with pytest.raises(ValueError):
+		PersistentCheckCache(db_path, max_age=-1)
+
+	with pytest.raises(ValueError):
+		PersistentCheckCache(db_path, batch_size=0)
+
+
+def test_wal_mode(tmp_path):
+	with PersistentCheckCache(tmp_path/"cache.db") as cache:
+		journal_mode = cache._connection.execute(
+			"PRAGMA journal_mode").fetchone()[0]
+
+	assert journal_mode == "wal"
+
+
+def test_content_matches(tmp_path):
+	with PersistentCheckCache(tmp_path/"cache.db") as cache:
+		assert cache.content_matches(PDF_PATH, ".pdf")
+		assert not cache.content_matches(PDF_PATH, ".zip")
+		assert cache.content_matches(PDF_PATH, ExtensionSet((".zip", ".pdf")))
+		assert not cache.content_matches("some_dir", ".pdf")
+		assert not cache.content_matches("ajxoj/io.pdf", ".pdf")
+		assert cache.miss_count == 1
+		assert cache.hit_count == 2
+
+
+def test_non_utf8_name(tmp_path):
+	path = tmp_path/fsdecode(b"x\xff.pdf")
+	path.write_bytes(Path(PDF_PATH).read_bytes())
+
+	with PersistentCheckCache(tmp_path/"cache.db", batch_size=1) as cache:
+		assert cache.content_matches(path, ".pdf")
+		assert cache.content_matches(str(path), ".pdf")
+		assert cache.hit_count == 1
+		assert len(cache.fingerprint(path)) == 32
+
+
+def test_results_survive_restart(tmp_path):
+	db_path = tmp_path/"cache.db"
+
+	with PersistentCheckCache(db_path) as cache:
+		digest = cache.fingerprint(PDF_PATH)
+		assert cache.content_matches(PDF_PATH, ".pdf")
+
+	with PersistentCheckCache(db_path) as cache:
+		assert cache.fingerprint(PDF_PATH) == digest
+		assert cache.content_matches(PDF_PATH, ".pdf")
+		assert cache.hit_count == 2
+		assert cache.miss_count == 0
+		assert len(cache) == 2
+
+
+def test_fingerprint(tmp_path):
+	with open(PDF_PATH, mode="rb") as file:
+		expected = blake2b(file.read(), digest_size=16).digest()
+
+	with PersistentCheckCache(tmp_path/"cache.db") as cache:
+		assert cache.fingerprint(PDF_PATH, 16) == expected
+
+		with pytest.raises(FileNotFoundError):
+			cache.fingerprint("ajxoj/io.txt")
+
+
+def test_changed_file(tmp_path):
+	path = tmp_path/"a_file.pdf"
+	path.write_bytes(b"%PDF-1.4")
+
+	with PersistentCheckCache(tmp_path/"cache.db") as cache:
+		assert cache.content_matches(path, ".pdf")
+		path.write_bytes(b"PK\x03\x04")
+		modified_time = stat(path).st_mtime_ns + 10 ** 9
+		utime(path, ns=(modified_time, modified_time))
+		assert not cache.content_matches(path, ".pdf")
+		assert cache.miss_count == 2
+
+
+def test_bulk_writes(tmp_path):
+	db_path = tmp_path/"cache.db"
+	paths = list()
+
+	for i in range(5):
+		path = tmp_path/("file" + str(i) + ".txt")
+		path.write_text(str(i))
+		paths.append(path)
+
+	cache = PersistentCheckCache(db_path, batch_size=3)
+
+	for path in paths:
+		cache.fingerprint(path)
+
+	with PersistentCheckCache(db_path) as other_cache:
+		assert len(other_cache) == 3
+
+	cache.flush()
+
+	with PersistentCheckCache(db_path) as other_cache:
+		assert len(other_cache) == 5
+
+	cache.close()
+
+
+def test_evict_by_size(tmp_path):
+	with PersistentCheckCache(tmp_path/"cache.db", max_entries=2) as cache:
+		for i in range(4):
+			path = tmp_path/("file" + str(i) + ".txt")
+			path.write_text(str(i))
+			cache.fingerprint(path)
+
+		cache.evict()
+		assert len(cache) == 2
+
+
+def test_evict_automatically(tmp_path):
+	with PersistentCheckCache(tmp_path/"cache.db", max_entries=2,
+			batch_size=1) as cache:
+		for i in range(32):
+			path = tmp_path/("file" + str(i) + ".txt")
+			path.write_text(str(i))
+			cache.fingerprint(path)
+
+		assert len(cache) == 2
+
+
+def test_evict_least_recently_used(tmp_path):
+	paths = list()
+
+	for name in ("a", "b", "c"):
+		path = tmp_path/(name + ".txt")
+		path.write_text(name)
+		paths.append(path)
+
+	with PersistentCheckCache(tmp_path/"cache.db", max_entries=2,
+			batch_size=1) as cache:
+		for path in (paths[0], paths[1], paths[0], paths[2]):
+			cache.fingerprint(path)
+			sleep(0.01)
+
+		assert cache.hit_count == 1
+		cache.evict()
+		assert len(cache) == 2
+		cache.fingerprint(paths[0])
+		cache.fingerprint(paths[2])
+		assert cache.hit_count == 3
+
+
+def test_evict_by_age(tmp_path):
+	with PersistentCheckCache(tmp_path/"cache.db", max_age=0.05) as cache:
+		cache.fingerprint(PDF_PATH)
+		sleep(0.1)
+		cache.evict()
+		assert len(cache) == 0
+
+
+def test_path_checkers(tmp_path):
+	with PersistentCheckCache(tmp_path/"cache.db") as cache:
+		pc = PathChecker(PDF_PATH, ".pdf")
+		assert pc.content_is_correct(cache)
+		assert pc.get_fingerprint(cache) == cache.fingerprint(PDF_PATH)
+		rpc = ReactivePathChecker(PDF_PATH, ".png", "arg")
+
+		with pytest.raises(ValueError):
+			rpc.check_content_correct(cache)
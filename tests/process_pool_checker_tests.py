@@ -0,0 +1,111 @@
+import pickle
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from jazal import\
+	CheckPlan,\
+	CheckStatus,\
+	DirectoryIndex,\
+	ExtensionSet,\
+	PathChecker,\
+	ProcessPoolChecker,\
+	ReactivePathChecker
+from jazal.process_pool_checker import tune_chunk_size
+from pathlib import Path
+
+
+PATHS = ["some_dir/un_fichier_pdf.pdf", "ajxoj/io.pdf", "some_dir",
+	Path("some_dir/un_fichier_pdf.pdf"), "ajxoj/io.txt"] * 200
+VALIDATIONS = (
+	ReactivePathChecker.validate_path_exists,
+	ReactivePathChecker.validate_path_is_file,
+	ReactivePathChecker.validate_extension)
+
+
+def test_init_exceptions():
+	with pytest.raises(ValueError):
+		ProcessPoolChecker(chunk_size=0)
+
+	with pytest.raises(ValueError):
+		ProcessPoolChecker(target_duration=0)
+
+	with pytest.raises(ValueError):
+		ProcessPoolChecker(max_workers=0)
+
+
+def test_pickle_path_checker():
+	pc = PathChecker("ajxoj/io.txt", ".pdf")
+	pc.enable_snapshot()
+	pc.set_lookup(DirectoryIndex())
+	pc_copy = pickle.loads(pickle.dumps(pc))
+	assert pc_copy == pc
+	assert pc_copy.snapshot_enabled
+	assert pc_copy.lookup is None
+	assert not pc_copy.path_exists()
+
+
+def test_pickle_reactive_path_checker():
+	rpc = ReactivePathChecker("ajxoj/io.txt", (".pdf", ".txt"), "arg")
+	rpc_copy = pickle.loads(pickle.dumps(rpc))
+	assert rpc_copy == rpc
+	assert rpc_copy.extension == ExtensionSet((".pdf", ".txt"))
+
+
+def test_pickle_check_plan():
+	plan = CheckPlan("arg", ".pdf", must_be_file=True)
+	assert repr(pickle.loads(pickle.dumps(plan))) == repr(plan)
+
+
+def test_validate():
+	plan = CheckPlan("arg", ".pdf", must_be_file=True)
+
+	with ProcessPoolChecker(max_workers=2) as ppc:
+		results = ppc.validate(PATHS, plan)
+
+	assert results == plan.validate_all(PATHS)
+	assert ppc.last_chunk_size >= 1
+
+
+def test_validate_fixed_chunk_size():
+	plan = CheckPlan("arg", ".pdf", must_be_file=True)
+
+	with ProcessPoolChecker(max_workers=2, chunk_size=7) as ppc:
+		results = ppc.validate(PATHS, plan)
+
+	assert results == plan.validate_all(PATHS)
+	assert ppc.last_chunk_size == 7
+
+
+def test_validate_empty():
+	plan = CheckPlan("arg", ".pdf")
+
+	with ThreadPoolExecutor() as executor:
+		ppc = ProcessPoolChecker(executor=executor)
+		assert ppc.validate([], plan) == bytearray()
+
+
+def test_max_workers_given_executor():
+	with ThreadPoolExecutor(max_workers=3) as executor:
+		ppc = ProcessPoolChecker(max_workers=3, chunk_size=4,
+			executor=executor)
+		assert ppc.max_workers == 3
+		assert ppc.validate(PATHS[:10], CheckPlan("arg", ".pdf"))[:2]\
+			== bytearray((CheckStatus.OK, CheckStatus.PATH_NOT_FOUND))
+
+
+def test_validate_checkers():
+	checkers = [ReactivePathChecker(path, ".pdf", "arg") for path in PATHS]
+
+	with ProcessPoolChecker(max_workers=2) as ppc:
+		results = ppc.validate_checkers(checkers, VALIDATIONS)
+
+	assert results[:5] == bytearray((CheckStatus.OK,
+		CheckStatus.PATH_NOT_FOUND, CheckStatus.NOT_A_FILE, CheckStatus.OK,
+		CheckStatus.PATH_NOT_FOUND))
+	assert results == results[:5] * 200
+
+
+def test_tune_chunk_size():
+	assert tune_chunk_size(256, 0.01, 10 ** 6, 4, 0.05) == 1280
+	assert tune_chunk_size(256, 0.01, 1000, 4, 0.05) == 63
+	assert tune_chunk_size(256, 0.0, 10 ** 9, 1, 0.05) == 65536
+	assert tune_chunk_size(256, 10.0, 10 ** 6, 4, 0.05) == 1
@@ -1,5 +1,8 @@
 import pytest
-from jazal import PathChecker, ReactivePathChecker
+from jazal import\
+	CheckStatus,\
+	PathChecker,\
+	ReactivePathChecker
 from pathlib import Path
 
 
@@ -70,6 +73,27 @@ def test_check_path_is_file():
 		rpc.check_path_is_file()
 
 
+def test_check_content_correct():
+	rpc = ReactivePathChecker(
+		"some_dir/un_fichier_pdf.pdf", ".pdf", "awesomeArg")
+	rpc.check_content_correct()
+	rpc = ReactivePathChecker(
+		"some_dir/un_fichier_pdf.pdf", ".png", "awesomeArg")
+	except_msg = "awesomeArg must be the path to a file whose content "\
+		+ "matches the extension '.png'."
+	with pytest.raises(ValueError, match = except_msg):
+		rpc.check_content_correct()
+
+
+def test_check_content_correct_several_extens():
+	rpc = ReactivePathChecker(
+		"some_dir/un_fichier_pdf.pdf", (".png", ".zip"), "awesomeArg")
+	except_msg = "awesomeArg must be the path to a file whose content "\
+		+ "matches one of the extensions '.png', '.zip'."
+	with pytest.raises(ValueError, match = except_msg):
+		rpc.check_content_correct()
+
+
 def test_name_with_correct_exten():
 	rpc = ReactivePathChecker("ajxoj/io.txt", ".pdf", "awesomeArg")
 	assert rpc.name_with_correct_exten() == "io.pdf"
@@ -79,3 +103,66 @@ def test_path_with_correct_exten():
 	rpc = ReactivePathChecker("ajxoj/io.txt", ".pdf", "awesomeArg")
 	correct_path = rpc.path_with_correct_exten()
 	assert correct_path in (Path("ajxoj/io.pdf"), Path("ajxoj\\io.pdf"))
+
+
+def test_hash():
+	rpc1 = ReactivePathChecker("ajxoj/io.txt", ".pdf", "awesomeArg")
+	rpc2 = ReactivePathChecker("ajxoj/io.txt", ".pdf", "awesomeArg")
+	rpc3 = ReactivePathChecker("ajxoj/io.txt", ".pdf", "formidableArg")
+	assert hash(rpc1) == hash(rpc2)
+	assert len(set((rpc1, rpc2, rpc3))) == 2
+
+
+def test_no_instance_dict():
+	rpc = ReactivePathChecker("ajxoj/io.txt", ".pdf", "awesomeArg")
+	assert not hasattr(rpc, "__dict__")
+
+
+def test_validate_ok():
+	rpc = ReactivePathChecker(
+		"some_dir/un_fichier_pdf.pdf", ".pdf", "awesomeArg")
+	assert rpc.validate_extension() is CheckStatus.OK
+	assert rpc.validate_path_exists() is CheckStatus.OK
+	assert rpc.validate_path_is_file() is CheckStatus.OK
+	assert rpc.validate_path_is_dir() is CheckStatus.NOT_A_DIR
+	assert not rpc.validate_path_exists()
+	assert rpc.make_status_msg(CheckStatus.OK) is None
+
+
+def test_validate_failures():
+	rpc = ReactivePathChecker("ajxoj/io.txt", ".pdf", "awesomeArg")
+	assert rpc.validate_content() is CheckStatus.WRONG_CONTENT
+	assert rpc.validate_extension() is CheckStatus.WRONG_EXTENSION
+	assert rpc.validate_path_exists() is CheckStatus.PATH_NOT_FOUND
+	assert rpc.validate_path_is_dir() is CheckStatus.NOT_A_DIR
+	assert rpc.validate_path_is_file() is CheckStatus.NOT_A_FILE
+
+
+def test_status_msgs_match_exceptions():
+	checks = (
+		(ReactivePathChecker.check_content_correct,
+			ReactivePathChecker.validate_content),
+		(ReactivePathChecker.check_extension_correct,
+			ReactivePathChecker.validate_extension),
+		(ReactivePathChecker.check_path_exists,
+			ReactivePathChecker.validate_path_exists),
+		(ReactivePathChecker.check_path_is_dir,
+			ReactivePathChecker.validate_path_is_dir),
+		(ReactivePathChecker.check_path_is_file,
+			ReactivePathChecker.validate_path_is_file))
+	checkers = (
+		ReactivePathChecker("ajxoj/io.txt", ".pdf", "awesomeArg"),
+		ReactivePathChecker("some_dir", "", "awesomeArg"),
+		ReactivePathChecker("ajxoj/io.txt", (".pdf", ".doc"), "awesomeArg"))
+
+	for rpc in checkers:
+		for check, validate in checks:
+			status = validate(rpc)
+
+			try:
+				check(rpc)
+				assert status is CheckStatus.OK
+
+			except (FileNotFoundError, ValueError) as e:
+				assert type(e) is status.error_type
+				assert str(e) == rpc.make_status_msg(status)
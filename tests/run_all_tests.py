@@ -4,4 +4,27 @@ from os import system
 system("pytest path_util_tests.py")
 system("pytest path_checker_tests.py")
 system("pytest reactive_path_checker_tests.py")
+system("pytest check_status_tests.py")
+system("pytest check_plan_tests.py")
 system("pytest missing_path_arg_warner_tests.py")
+system("pytest batch_path_checker_tests.py")
+system("pytest thread_pool_checker_tests.py")
+system("pytest process_pool_checker_tests.py")
+system("pytest tree_validator_tests.py")
+system("pytest async_path_checker_tests.py")
+system("pytest path_pipeline_tests.py")
+system("pytest dir_fd_lookup_tests.py")
+system("pytest directory_index_tests.py")
+system("pytest negative_lookup_cache_tests.py")
+system("pytest inotify_watcher_tests.py")
+system("pytest str_path_util_tests.py")
+system("pytest parsed_path_tests.py")
+system("pytest path_set_tests.py")
+system("pytest altered_path_maker_tests.py")
+system("pytest extension_set_tests.py")
+system("pytest content_signature_tests.py")
+system("pytest file_fingerprint_tests.py")
+system("pytest persistent_cache_tests.py")
+system("pytest jazal_import_tests.py")
+system("pytest instrumentation_tests.py")
+system("pytest lookup_tests.py")
@@ -0,0 +1,80 @@
+import pytest
+from os import scandir
+from pathlib import Path
+from jazal import\
+	extension_to_str,\
+	get_file_stem,\
+	get_str_name,\
+	make_altered_name,\
+	split_name,\
+	str_altered_name,\
+	str_extension,\
+	str_file_stem
+
+
+EMPTY_STR = ""
+
+TRICKY_PATHS = (
+	"", ".", "..", "./", "a/.", "a/./", "a//b.pdf", "a/b/", ".bashrc",
+	"..a.b", "..b.b", "a..b", "a.", "a.b.", "a.b.c.b", ".a.tar.gz",
+	"some_dir/un_fichier_pdf.pdf", "/", "/x.y.z")
+
+
+def test_name_matches_pathlib():
+	for path_str in TRICKY_PATHS:
+		assert get_str_name(path_str) == Path(path_str).name
+
+
+def test_name_path():
+	assert get_str_name(Path("ajxoj/io.txt")) == "io.txt"
+
+
+def test_name_dir_entry():
+	with scandir("some_dir") as entries:
+		entry = next(entries)
+
+	assert get_str_name(entry) == "un_fichier_pdf.pdf"
+	assert str_extension(entry) == ".pdf"
+	assert str_file_stem(entry) == "un_fichier_pdf"
+
+
+def test_exten_matches_path_util():
+	for path_str in TRICKY_PATHS:
+		assert str_extension(path_str) == extension_to_str(Path(path_str))
+
+
+def test_stem_matches_path_util():
+	for path_str in TRICKY_PATHS:
+		assert str_file_stem(path_str) == get_file_stem(Path(path_str))
+
+
+def test_split_name_no_exten():
+	assert split_name("some_dir") == ("some_dir", EMPTY_STR)
+
+
+def test_split_name_one_suffix():
+	assert split_name("something.pdf") == ("something", ".pdf")
+
+
+def test_split_name_two_suffixes():
+	assert split_name("something.tar.gz") == ("something", ".tar.gz")
+
+
+def test_split_name_three_suffixes():
+	assert split_name("something.x.y.z") == ("something", ".x.y.z")
+
+
+def test_altered_name_no_exten():
+	assert str_altered_name("some_dir/gugusse.docx", "a", "b")\
+		== "agugusseb.docx"
+
+
+def test_altered_name_with_exten():
+	assert str_altered_name("some_dir/gugusse.tar.gz", None, "b", ".pdf")\
+		== "gugusseb.pdf"
+
+
+def test_altered_name_matches_path_util():
+	for path_str in TRICKY_PATHS:
+		assert str_altered_name(path_str, "x", "y")\
+			== make_altered_name(Path(path_str), "x", "y")
@@ -0,0 +1,113 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from jazal import\
+	PathChecker,\
+	ReactivePathChecker,\
+	ThreadPoolChecker
+
+
+FILE_CHECKS = (
+	ReactivePathChecker.check_path_exists,
+	ReactivePathChecker.check_path_is_file,
+	ReactivePathChecker.check_extension_correct)
+
+
+def make_checkers():
+	return [
+		ReactivePathChecker("some_dir/un_fichier_pdf.pdf", ".pdf", "arg0"),
+		ReactivePathChecker("ajxoj/io.pdf", ".pdf", "arg1"),
+		ReactivePathChecker("some_dir", ".pdf", "arg2"),
+		ReactivePathChecker("some_dir/un_fichier_pdf.pdf", ".txt", "arg3")]
+
+
+def sequential_error(checker):
+	try:
+		for check in FILE_CHECKS:
+			check(checker)
+
+	except Exception as e:
+		return e
+
+	return None
+
+
+def test_init_max_pending_exception():
+	with pytest.raises(ValueError):
+		ThreadPoolChecker(max_pending=0)
+
+
+def test_init_max_workers_exception():
+	with pytest.raises(ValueError):
+		ThreadPoolChecker(max_workers=0)
+
+
+def test_max_pending_given_executor():
+	with ThreadPoolExecutor(max_workers=2) as executor:
+		tpc = ThreadPoolChecker(max_workers=2, executor=executor)
+		assert tpc.max_workers == 2
+		assert tpc.max_pending == 8
+
+
+def test_map_ordered():
+	checkers = [PathChecker("some_dir", ""), PathChecker("ajxoj", ""),
+		PathChecker("some_dir/un_fichier_pdf.pdf", ".pdf")] * 10
+	with ThreadPoolChecker(max_workers=4, max_pending=3) as tpc:
+		results = list(tpc.map(PathChecker.path_exists, checkers))
+
+	assert [checker for checker, _ in results] == checkers
+	assert [exists for _, exists in results] == [True, False, True] * 10
+
+
+def test_map_unordered():
+	checkers = [PathChecker("some_dir/" + str(i), "") for i in range(20)]
+	with ThreadPoolChecker(max_workers=4, max_pending=2) as tpc:
+		results = list(tpc.map(PathChecker.path_is_dir, checkers, False))
+
+	assert len(results) == 20
+	assert set(id(checker) for checker, _ in results)\
+		== set(id(checker) for checker in checkers)
+	assert not any(is_dir for _, is_dir in results)
+
+
+def test_map_exception():
+	def fail(checker):
+		raise RuntimeError("fail")
+
+	with ThreadPoolChecker(max_workers=2) as tpc:
+		with pytest.raises(RuntimeError, match = "fail"):
+			list(tpc.map(fail, [PathChecker("some_dir", "")]))
+
+
+def test_check_ordered():
+	checkers = make_checkers()
+	with ThreadPoolChecker(max_workers=2, max_pending=1) as tpc:
+		results = list(tpc.check(checkers, FILE_CHECKS))
+
+	assert [checker for checker, _ in results] == checkers
+	assert results[0][1] is None
+	assert isinstance(results[1][1], FileNotFoundError)
+	assert isinstance(results[2][1], ValueError)
+	assert isinstance(results[3][1], ValueError)
+
+
+def test_check_same_messages():
+	checkers = make_checkers()
+	with ThreadPoolChecker(max_workers=2) as tpc:
+		results = dict(
+			(checker.arg_name, error) for checker, error
+			in tpc.check(checkers, FILE_CHECKS, ordered=False))
+
+	for checker in checkers:
+		expected = sequential_error(checker)
+		error = results[checker.arg_name]
+		assert type(error) is type(expected)
+		assert str(error) == str(expected)
+
+
+def test_given_executor_not_shut_down():
+	executor = ThreadPoolExecutor(max_workers=2)
+	with ThreadPoolChecker(executor=executor) as tpc:
+		list(tpc.map(PathChecker.path_exists, [PathChecker("some_dir", "")]))
+
+	assert executor.submit(int, "1").result() == 1
+	executor.shutdown()
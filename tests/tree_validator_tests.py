@@ -0,0 +1,110 @@
+import pytest
+from jazal import\
+	CheckStatus,\
+	ExtensionSet,\
+	TreeValidator
+from jazal import tree_validator
+from os import symlink
+from threading import Thread
+
+
+def make_tree(tmp_path):
+	for i in range(3):
+		dir_path = tmp_path/("dir" + str(i))/"sub"
+		dir_path.mkdir(parents=True)
+
+		for j in range(4):
+			(dir_path/("file" + str(j) + ".pdf")).write_text("a")
+
+	(tmp_path/"dir0"/"notes.txt").write_text("b")
+	(tmp_path/"dir1"/"sub"/"archive.tar.gz").write_text("c")
+	symlink(tmp_path/"dir2", tmp_path/"dir1"/"link.pdf")
+
+
+def test_init_exception():
+	with pytest.raises(ValueError):
+		TreeValidator(".pdf", max_workers=0)
+
+
+def test_repr():
+	assert repr(TreeValidator(".pdf", 4)) == "TreeValidator('.pdf', 4)"
+
+
+def test_validate_not_dir():
+	except_msg = "root must be the path to a directory."
+	with pytest.raises(ValueError, match = except_msg):
+		TreeValidator(".pdf").validate("some_dir/un_fichier_pdf.pdf")
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_validate(tmp_path, max_workers):
+	make_tree(tmp_path)
+	violations = sorted(TreeValidator(".pdf", max_workers).validate(tmp_path))
+	assert [(path, status) for path, status, _ in violations] == [
+		(tmp_path/"dir0"/"notes.txt", CheckStatus.WRONG_EXTENSION),
+		(tmp_path/"dir1"/"link.pdf", CheckStatus.NOT_A_FILE),
+		(tmp_path/"dir1"/"sub"/"archive.tar.gz", CheckStatus.WRONG_EXTENSION)]
+	assert violations[0][2] == str(tmp_path/"dir0"/"notes.txt")\
+		+ " must be the path to a file with the extension '.pdf'."
+	assert violations[1][2] == str(tmp_path/"dir1"/"link.pdf")\
+		+ " must be the path to a file."
+
+
+def test_validate_several_extensions(tmp_path):
+	make_tree(tmp_path)
+	validator = TreeValidator(ExtensionSet((".pdf", ".txt", ".tar.gz")))
+	violations = list(validator.validate(tmp_path))
+	assert len(violations) == 1
+	assert violations[0][1] is CheckStatus.NOT_A_FILE
+
+
+def test_validate_large_tree(tmp_path):
+	for i in range(50):
+		dir_path = tmp_path/("dir" + str(i % 7))/("sub" + str(i))
+		dir_path.mkdir(parents=True)
+		(dir_path/"a.txt").write_text("a")
+		(dir_path/"b.pdf").write_text("b")
+
+	violations = list(TreeValidator(".pdf", 8).validate(str(tmp_path)))
+	assert len(violations) == 50
+	assert all(path.name == "a.txt" for path, _, _ in violations)
+
+
+def test_validate_unlistable_dirs(tmp_path, monkeypatch):
+	make_tree(tmp_path)
+	scandir = tree_validator.scandir
+	unlistable_dirs = {str(tmp_path/"dir0"), str(tmp_path/"dir2"/"sub")}
+
+	def failing_scandir(path):
+		if path in unlistable_dirs:
+			raise PermissionError(13, "Permission denied", path)
+
+		return scandir(path)
+
+	monkeypatch.setattr(tree_validator, "scandir", failing_scandir)
+	violations = sorted(TreeValidator(".pdf").validate(tmp_path))
+	assert [(path, status) for path, status, _ in violations] == [
+		(tmp_path/"dir0", CheckStatus.NOT_LISTABLE),
+		(tmp_path/"dir1"/"link.pdf", CheckStatus.NOT_A_FILE),
+		(tmp_path/"dir1"/"sub"/"archive.tar.gz", CheckStatus.WRONG_EXTENSION),
+		(tmp_path/"dir2"/"sub", CheckStatus.NOT_LISTABLE)]
+	assert violations[0][2] == str(tmp_path/"dir0")\
+		+ " must be the path to a directory that can be listed."
+
+
+def test_close_early(tmp_path, monkeypatch):
+	make_tree(tmp_path)
+	threads = list()
+
+	class RecordedThread(Thread):
+
+		def __init__(self, *args, **kwargs):
+			Thread.__init__(self, *args, **kwargs)
+			threads.append(self)
+
+	monkeypatch.setattr(tree_validator, "Thread", RecordedThread)
+	generator = TreeValidator(".doc", 4).validate(tmp_path)
+	next(generator)
+	generator.close()
+	assert len(threads) == 4
+	assert not any(thread.is_alive() for thread in threads)